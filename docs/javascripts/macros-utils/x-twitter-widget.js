@@ -24,6 +24,65 @@
     }
   }
 
+  /**
+   * Static tweet markup inlined at build time, kept per container so it can be
+   * shown while the widget renders.
+   * @type {WeakMap<HTMLElement, HTMLElement>}
+   */
+  const prerenderedTweets = new WeakMap();
+
+  /**
+   * Widget renderings of each rendered container, keyed by theme.
+   * Only the rendering of the container's current theme is shown; the other
+   * one is kept hidden so switching back does not reload the widget.
+   * @type {WeakMap<HTMLElement, Map<string, HTMLElement>>}
+   */
+  const tweetRenderings = new WeakMap();
+
+  /**
+   * Rendered containers currently intersecting the viewport.
+   * @type {WeakSet<HTMLElement>}
+   */
+  const visibleTweets = new WeakSet();
+
+  /**
+   * Observer tracking which rendered containers are visible, or null when
+   * IntersectionObserver is not supported (every tweet counts as visible).
+   * @type {IntersectionObserver|null|undefined}
+   */
+  let visibilityObserver;
+
+  /**
+   * Theme requested by the last color scheme change, applied to off-screen
+   * tweets when they become visible.
+   * @type {string|null}
+   */
+  let requestedTheme = null;
+
+  /**
+   * Viewport observers of lazily rendered tweets, keyed by root margin.
+   * @type {Map<string, IntersectionObserver>}
+   */
+  const lazyObservers = new Map();
+
+  /**
+   * Root margin used when a container has an invalid one.
+   * @type {string}
+   */
+  const DEFAULT_ROOT_MARGIN = "200px 0px";
+
+  /**
+   * Callbacks waiting for widgets.js, which is downloaded once for all tweets.
+   * @type {Function[]}
+   */
+  const widgetsScriptCallbacks = [];
+
+  /**
+   * Whether widgets.js is being downloaded.
+   * @type {boolean}
+   */
+  let widgetsScriptLoading = false;
+
   /**
    * Determines the current color scheme of the document.
    *
@@ -72,49 +131,285 @@
   }
 
   /**
-   * Recreates a tweet widget in the specified container.
+   * Renders a tweet widget in the specified container.
    *
-   * Clears existing content, creates a new blockquote with the tweet,
-   * and reloads the Twitter widget with the current color scheme.
+   * Each theme gets its own rendering: a wrapper holding a new blockquote
+   * with the tweet (a copy of the build-time markup for pre-rendered tweets),
+   * loaded by the Twitter widget. A rendering already made for the theme is
+   * shown again instead of being reloaded, and nothing happens if the
+   * container already shows the theme.
    *
    * @param {HTMLElement} container - The container element for the tweet
+   * @param {string} [theme] - 'dark' or 'light', the current color scheme
+   *   by default
    */
-  function recreateTweet(container) {
-    const theme = getColorScheme();
+  function renderTweet(container, theme = getColorScheme()) {
     const url = container.getAttribute("data-url");
-    log("Recreating tweet:", url, "with theme:", theme);
+    let renderings = tweetRenderings.get(container);
+
+    if (!renderings) {
+      // Keep the build-time markup before it is replaced by the widget
+      if (
+        container.classList.contains("x-twitter-prerendered") &&
+        !prerenderedTweets.has(container)
+      ) {
+        const prerendered = container.querySelector("blockquote.twitter-tweet");
+        if (prerendered) {
+          prerenderedTweets.set(container, prerendered.cloneNode(true));
+        }
+      }
+
+      // Clear existing content
+      container.innerHTML = "";
+      renderings = new Map();
+      tweetRenderings.set(container, renderings);
+      observeVisibility(container);
+    } else if (container.getAttribute("data-theme") === theme) {
+      log("Tweet already in theme:", url, theme);
+      return;
+    }
+
+    renderings.forEach((rendering, renderingTheme) => {
+      rendering.hidden = renderingTheme !== theme;
+    });
+    container.setAttribute("data-theme", theme);
 
-    // Clear existing content
-    container.innerHTML = "";
+    if (renderings.has(theme)) {
+      log("Showing cached tweet:", url, "with theme:", theme);
+      return;
+    }
+    log("Rendering tweet:", url, "with theme:", theme);
 
     // Create new blockquote
-    const blockquote = document.createElement("blockquote");
-    blockquote.className = "twitter-tweet";
-    blockquote.setAttribute("data-theme", theme);
+    let blockquote;
+    if (prerenderedTweets.has(container)) {
+      blockquote = prerenderedTweets.get(container).cloneNode(true);
+    } else {
+      blockquote = document.createElement("blockquote");
+      blockquote.className = "twitter-tweet";
 
-    const link = document.createElement("a");
-    link.href = url;
-    blockquote.appendChild(link);
+      const link = document.createElement("a");
+      link.href = url;
+      blockquote.appendChild(link);
+    }
+    blockquote.setAttribute("data-theme", theme);
 
-    container.appendChild(blockquote);
+    const rendering = document.createElement("div");
+    rendering.className = "x-twitter-rendering";
+    rendering.setAttribute("data-theme", theme);
+    rendering.appendChild(blockquote);
+    container.appendChild(rendering);
+    renderings.set(theme, rendering);
 
-    // Reload widget
+    // Load widget
     if (window.twttr && window.twttr.widgets) {
       window.twttr.widgets
-        .load(container)
+        .load(rendering)
         .then(() => log("Tweet widget loaded successfully"))
         .catch((err) => log("Error loading tweet widget:", err));
     }
   }
 
   /**
-   * Recreates all Twitter tweet widgets on the page.
-   * Finds all elements with the 'x-twitter-embed' class and reloads them.
+   * Starts tracking whether a rendered tweet is visible.
+   *
+   * When an off-screen tweet scrolls into view after a color scheme change,
+   * it is switched to the requested theme then.
+   *
+   * @param {HTMLElement} container - The container element for the tweet
    */
-  function recreateAllTweets() {
-    log("Recreating all tweets");
+  function observeVisibility(container) {
+    if (visibilityObserver === undefined) {
+      visibilityObserver =
+        "IntersectionObserver" in window
+          ? new IntersectionObserver((entries) => {
+              entries.forEach((entry) => {
+                if (!entry.isIntersecting) {
+                  visibleTweets.delete(entry.target);
+                  return;
+                }
+                visibleTweets.add(entry.target);
+                if (requestedTheme) {
+                  renderTweet(entry.target, requestedTheme);
+                }
+              });
+            })
+          : null;
+    }
+    if (visibilityObserver) {
+      visibilityObserver.observe(container);
+    }
+  }
+
+  /**
+   * Checks whether a rendered tweet is in the viewport.
+   *
+   * @param {HTMLElement} container - The container element for the tweet
+   * @returns {boolean} True if visible, or if visibility cannot be tracked
+   */
+  function isVisible(container) {
+    return !visibilityObserver || visibleTweets.has(container);
+  }
+
+  /**
+   * Applies the current color scheme to the rendered tweets.
+   *
+   * Only visible tweets are switched right away. Off-screen tweets switch
+   * when they become visible, and tweets that have not been rendered yet
+   * (lazy tweets still far from the viewport) use the color scheme current
+   * when they are rendered.
+   */
+  function applyColorScheme() {
+    const theme = getColorScheme();
+    requestedTheme = theme;
+    log("Applying color scheme to tweets:", theme);
+
     document.querySelectorAll(".x-twitter-embed").forEach((container) => {
-      recreateTweet(container);
+      if (
+        !tweetRenderings.has(container) ||
+        container.getAttribute("data-theme") === theme
+      ) {
+        return;
+      }
+      if (!isVisible(container)) {
+        log("Deferring off-screen tweet:", container.getAttribute("data-url"));
+        return;
+      }
+      renderTweet(container, theme);
+    });
+  }
+
+  /**
+   * Checks whether a tweet is rendered only when it comes near the viewport.
+   *
+   * Tweets are lazy when the build set their root margin (the
+   * `x_twitter_card.lazy` setting) and the browser supports
+   * IntersectionObserver.
+   *
+   * @param {HTMLElement} container - The container element for the tweet
+   * @returns {boolean} True if the tweet is lazily rendered
+   */
+  function isLazy(container) {
+    return (
+      "IntersectionObserver" in window &&
+      container.hasAttribute("data-root-margin")
+    );
+  }
+
+  /**
+   * Runs a callback once the Twitter script is loaded.
+   *
+   * The script is downloaded on the first call only; callbacks registered
+   * while it is loading run together when it is ready.
+   *
+   * @param {Function} callback - Function to run once widgets.js is loaded
+   */
+  function whenWidgetsScriptLoaded(callback) {
+    if (window.twttr) {
+      callback();
+      return;
+    }
+
+    widgetsScriptCallbacks.push(callback);
+    if (widgetsScriptLoading) {
+      return;
+    }
+    widgetsScriptLoading = true;
+
+    log("Loading Twitter script");
+    const script = document.createElement("script");
+    script.src = "https://platform.twitter.com/widgets.js";
+    script.async = true;
+    script.onload = () => {
+      log("Twitter script loaded");
+      widgetsScriptLoading = false;
+      widgetsScriptCallbacks.splice(0).forEach((queued) => queued());
+    };
+    script.onerror = () => {
+      // Drop the waiting tweets, a later tweet retries the download
+      log("Error loading Twitter script");
+      widgetsScriptLoading = false;
+      widgetsScriptCallbacks.length = 0;
+    };
+    document.head.appendChild(script);
+  }
+
+  /**
+   * Renders the tweets that came near the viewport.
+   *
+   * @param {IntersectionObserverEntry[]} entries - Observed containers
+   * @param {IntersectionObserver} observer - The observer of the containers
+   */
+  function renderNearTweets(entries, observer) {
+    entries.forEach((entry) => {
+      if (!entry.isIntersecting) {
+        return;
+      }
+      const container = entry.target;
+      observer.unobserve(container);
+      log("Tweet near viewport:", container.getAttribute("data-url"));
+
+      whenWidgetsScriptLoaded(() => renderTweet(container));
+    });
+  }
+
+  /**
+   * Gets the viewport observer for a root margin.
+   *
+   * @param {string} rootMargin - Margin around the viewport, e.g. "200px 0px"
+   * @returns {IntersectionObserver} Shared observer for the root margin
+   */
+  function getLazyObserver(rootMargin) {
+    if (!lazyObservers.has(rootMargin)) {
+      let observer;
+      try {
+        observer = new IntersectionObserver(renderNearTweets, { rootMargin });
+      } catch (err) {
+        log("Invalid root margin:", rootMargin, err);
+        observer = getLazyObserver(DEFAULT_ROOT_MARGIN);
+      }
+      lazyObservers.set(rootMargin, observer);
+    }
+    return lazyObservers.get(rootMargin);
+  }
+
+  /**
+   * Keeps widgets.js from rendering a lazy tweet before it is near.
+   *
+   * widgets.js renders every `blockquote.twitter-tweet` of the page when it
+   * loads, so the blockquote of a lazy tweet is marked pending instead. The
+   * build-time markup of pre-rendered tweets is kept for renderTweet.
+   *
+   * @param {HTMLElement} container - The container element for the tweet
+   */
+  function holdTweet(container) {
+    const blockquote = container.querySelector("blockquote.twitter-tweet");
+    if (!blockquote) {
+      return;
+    }
+    if (
+      container.classList.contains("x-twitter-prerendered") &&
+      !prerenderedTweets.has(container)
+    ) {
+      prerenderedTweets.set(container, blockquote.cloneNode(true));
+    }
+    blockquote.classList.replace("twitter-tweet", "x-twitter-pending");
+  }
+
+  /**
+   * Starts observing lazy tweets.
+   *
+   * Neither widgets.js nor any widget is loaded until the first tweet comes
+   * within its root margin of the viewport.
+   */
+  function observeLazyTweets() {
+    document.querySelectorAll(".x-twitter-embed").forEach((container) => {
+      if (isLazy(container) && !tweetRenderings.has(container)) {
+        holdTweet(container);
+        getLazyObserver(container.getAttribute("data-root-margin")).observe(
+          container
+        );
+      }
     });
   }
 
@@ -138,27 +433,27 @@
   }
 
   /**
-   * Initializes the Twitter widget.
+   * Initializes the Twitter widget for tweets that are not lazily rendered.
    *
    * Loads the Twitter script if not already loaded,
-   * then recreates all tweets after a short delay.
+   * then renders those tweets after a short delay.
    */
   function initializeWidget() {
     log("Initializing Twitter widget");
 
-    if (!window.twttr) {
-      log("Loading Twitter script");
-      const script = document.createElement("script");
-      script.src = "https://platform.twitter.com/widgets.js";
-      script.async = true;
-      script.onload = () => {
-        log("Twitter script loaded");
-        setTimeout(recreateAllTweets, 500);
-      };
-      document.head.appendChild(script);
-    } else {
-      setTimeout(recreateAllTweets, 500);
+    const eagerTweets = Array.from(
+      document.querySelectorAll(".x-twitter-embed")
+    ).filter((container) => !isLazy(container));
+    if (eagerTweets.length === 0) {
+      return;
     }
+
+    whenWidgetsScriptLoaded(() => {
+      setTimeout(
+        () => eagerTweets.forEach((container) => renderTweet(container)),
+        500
+      );
+    });
   }
 
   /**
@@ -171,15 +466,15 @@
   function setupColorSchemeObserver() {
     log("Setting up color scheme observer");
 
-    // Debounce recreation of tweets
-    const debouncedRecreate = debounce(recreateAllTweets, 100);
+    // Debounce theme switches of tweets
+    const debouncedApply = debounce(applyColorScheme, 100);
 
     // Observe HTML element for color scheme changes
     const observer = new MutationObserver((mutations) => {
       mutations.forEach((mutation) => {
         if (mutation.attributeName === "data-md-color-scheme") {
           log("Color scheme mutation detected");
-          debouncedRecreate();
+          debouncedApply();
         }
       });
     });
@@ -200,7 +495,7 @@
     if (palette) {
       palette.addEventListener("change", () => {
         log("Palette change detected");
-        debouncedRecreate();
+        debouncedApply();
       });
     }
   }
@@ -208,7 +503,8 @@
   /**
    * Main initialization function.
    *
-   * Sets up color scheme observer and initializes the Twitter widget.
+   * Sets up color scheme observer, starts observing lazy tweets and
+   * initializes the Twitter widget for the others.
    * Handles cases where the document might still be loading.
    */
   function initialize() {
@@ -218,12 +514,14 @@
       log("Document still loading, waiting for DOMContentLoaded");
       document.addEventListener("DOMContentLoaded", () => {
         setupColorSchemeObserver();
+        observeLazyTweets();
         setTimeout(initializeWidget, 1000);
       });
       return;
     }
 
     setupColorSchemeObserver();
+    observeLazyTweets();
     setTimeout(initializeWidget, 1000);
   }
 
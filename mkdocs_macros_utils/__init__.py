@@ -13,6 +13,12 @@ from mkdocs_macros.plugin import MacrosPlugin
 from . import link_card
 from . import gist_codeblock
 from . import x_twitter_card
+from . import prefetch
+from . import http_client
+from . import lockfile
+from . import incremental
+from . import profiler
+from . import card_templates
 
 logger = logging.getLogger("mkdocs.plugins.macros-utils")
 
@@ -95,12 +101,61 @@ def define_env(env: MacrosPlugin) -> None:
         # スタティックファイルをコピー
         copy_static_files(plugin_dir, docs_dir)
 
+        # 共有HTTPセッションとオフライン用ロックファイルを設定
+        http_client.configure_session(env)
+        lockfile.configure_lock(env)
+
+        # カードのテンプレートをコンパイル(overridesディレクトリのテンプレートを優先)
+        card_templates.configure_templates(env)
+
+        # 変更のないページのマクロ結果を再利用するための依存関係トラッカーを設定
+        # (テンプレートの変更も設定の変更として扱う)
+        incremental.configure_tracker(env)
+
+        # マクロのプロファイリングを設定
+        profiler.configure_profiler(env)
+
         # マクロを登録
         link_card.define_env(env)
         gist_codeblock.define_env(env)
         x_twitter_card.define_env(env)
 
+        # リモートリソースを事前取得
+        prefetch.prefetch_remote_resources(env)
+
         logger.info("MkDocs Macros Utils initialized successfully")
 
     except Exception as e:
         logger.error(f"Failed to initialize MkDocs Macros Utils: {e}")
+
+
+def on_pre_page_macros(env: MacrosPlugin) -> None:
+    """
+    ページのマクロ実行前の処理
+
+    Args:
+        env (MacrosPlugin): MkDocsマクロプラグインの環境
+    """
+    incremental.begin_page(env)
+    profiler.begin_page(env)
+
+
+def on_post_page_macros(env: MacrosPlugin) -> None:
+    """
+    ページのマクロ実行後の処理
+
+    Args:
+        env (MacrosPlugin): MkDocsマクロプラグインの環境
+    """
+    incremental.end_page(env)
+    profiler.end_page(env)
+
+
+def on_post_build(env: MacrosPlugin) -> None:
+    """
+    ビルド完了後の処理
+
+    Args:
+        env (MacrosPlugin): MkDocsマクロプラグインの環境
+    """
+    profiler.write_report(env)
@@ -0,0 +1,215 @@
+"""
+MkDocs Macros Utils asyncio prefetch backend
+
+Selected with `extra.macros_utils.prefetch.backend: async`. All Gists and
+link card SVG icons found in the pages are scheduled on one event loop, which
+bounds the requests in flight and spaces the requests to each host. Each
+request runs the same GistProcessor and `cached_get` calls as the macros in a
+worker thread, so it goes through the shared HTTP session (proxies, retries,
+connection pool) and the response cache, and rendering only reads from memory.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, TypeVar
+from urllib.parse import urlsplit
+import asyncio
+import logging
+
+from .debug_logger import DebugLogger
+from .gist_codeblock import RESOLVER_API, GistProcessor
+from .link_card import get_gist_content, get_gist_raw_url
+
+logger = logging.getLogger("mkdocs.plugins.macros-utils.async")
+
+T = TypeVar("T")
+
+
+class HostRateLimiter:
+    """Spaces requests to the same host at a fixed rate"""
+
+    def __init__(self, rate: float = 0.0) -> None:
+        """
+        Initialize the limiter
+
+        Args:
+            rate (float, optional): Requests per second per host, 0 for no limit.
+                Defaults to 0.
+        """
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+
+    async def wait(self, host: str) -> None:
+        """
+        Wait for the next request slot of a host
+
+        Args:
+            host (str): Host name
+        """
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncPrefetcher:
+    """
+    Runs blocking fetches in worker threads from an event loop
+
+    At most `max_concurrency` fetches run at once, and fetches of one host are
+    started no faster than its rate limit.
+    """
+
+    def __init__(
+        self, executor: Executor, max_concurrency: int, host_rate_limit: float
+    ) -> None:
+        """
+        Initialize the prefetcher, inside the running event loop
+
+        Args:
+            executor (Executor): Executor running the blocking fetches
+            max_concurrency (int): Fetches in flight at once
+            host_rate_limit (float): Requests per second per host, 0 for no limit
+        """
+        self.executor = executor
+        self.semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        self.limiter = HostRateLimiter(host_rate_limit)
+
+    async def run(self, url: str, fetch: Callable[[], T]) -> T:
+        """
+        Run a blocking fetch of a URL in a worker thread
+
+        Args:
+            url (str): URL requested by the fetch, for the host rate limit
+            fetch (Callable[[], T]): Blocking fetch
+
+        Returns:
+            T: Result of the fetch
+        """
+        # Wait for the host before taking a slot, so a rate limited host does
+        # not hold slots that requests to other hosts could use
+        await self.limiter.wait(urlsplit(url).hostname or "")
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, fetch)
+
+
+async def prefetch_gist(
+    prefetcher: AsyncPrefetcher, processor: GistProcessor, gist_url: str
+) -> List[str]:
+    """
+    Resolve a Gist and fetch all its files concurrently
+
+    Args:
+        prefetcher (AsyncPrefetcher): Prefetcher running the requests
+        processor (GistProcessor): Processor configured for the site
+        gist_url (str): Gist URL
+
+    Returns:
+        List[str]: Errors, empty on success
+    """
+    # The API resolver requests the Gist API rather than the Gist page
+    manifest_url = processor.api_url if processor.resolver == RESOLVER_API else gist_url
+    files, error = await prefetcher.run(
+        manifest_url, lambda: processor.get_gist_files(gist_url)
+    )
+    if error:
+        return [error]
+
+    results = await asyncio.gather(
+        *(
+            prefetcher.run(f.raw_url, partial(processor.fetch_gist_content, f.raw_url))
+            for f in files
+            if f.raw_url not in processor.inline_content
+        )
+    )
+    return [error for _, error in results if error]
+
+
+async def prefetch_all(
+    prefetcher: AsyncPrefetcher,
+    processor: GistProcessor,
+    gist_urls: List[str],
+    svg_paths: List[str],
+    svg_logger: DebugLogger,
+) -> int:
+    """
+    Prefetch Gists and SVG icons concurrently
+
+    Args:
+        prefetcher (AsyncPrefetcher): Prefetcher running the requests
+        processor (GistProcessor): Processor configured for the site
+        gist_urls (List[str]): Gist URLs
+        svg_paths (List[str]): Link card SVG paths (user/gist_id/filename)
+        svg_logger (DebugLogger): Debug logger of the link card macro
+
+    Returns:
+        int: Number of resources prefetched without errors
+    """
+
+    async def prefetch_one_gist(gist_url: str) -> bool:
+        try:
+            errors = await prefetch_gist(prefetcher, processor, gist_url)
+        except Exception as e:
+            errors = [str(e)]
+        for error in errors:
+            logger.warning(f"Failed to prefetch Gist {gist_url}: {error}")
+        return not errors
+
+    async def prefetch_svg(svg_path: str) -> bool:
+        user_id, gist_id, filename = svg_path.split("/")
+        try:
+            content = await prefetcher.run(
+                get_gist_raw_url(user_id, gist_id, filename),
+                lambda: get_gist_content(
+                    user_id, gist_id, filename, svg_logger, processor.cache
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to prefetch SVG {svg_path}: {e}")
+            return False
+        if content is None:
+            logger.warning(f"Failed to prefetch SVG {svg_path}")
+        return content is not None
+
+    results = await asyncio.gather(
+        *(prefetch_one_gist(url) for url in gist_urls),
+        *(prefetch_svg(path) for path in svg_paths if len(path.split("/")) == 3),
+    )
+    return sum(results)
+
+
+def prefetch_async(
+    processor: GistProcessor,
+    gist_urls: List[str],
+    svg_paths: List[str],
+    svg_logger: DebugLogger,
+    max_concurrency: int,
+    host_rate_limit: float,
+) -> int:
+    """
+    Run the async prefetch on a new event loop
+
+    Args:
+        processor (GistProcessor): Processor configured for the site
+        gist_urls (List[str]): Gist URLs
+        svg_paths (List[str]): Link card SVG paths (user/gist_id/filename)
+        svg_logger (DebugLogger): Debug logger of the link card macro
+        max_concurrency (int): Requests in flight at once
+        host_rate_limit (float): Requests per second per host, 0 for no limit
+
+    Returns:
+        int: Number of resources prefetched without errors
+    """
+
+    async def run(executor: Executor) -> int:
+        prefetcher = AsyncPrefetcher(executor, max_concurrency, host_rate_limit)
+        return await prefetch_all(
+            prefetcher, processor, gist_urls, svg_paths, svg_logger
+        )
+
+    with ThreadPoolExecutor(max_workers=max(max_concurrency, 1)) as executor:
+        return asyncio.run(run(executor))
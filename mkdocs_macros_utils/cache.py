@@ -0,0 +1,324 @@
+"""
+MkDocs Macros Utils on-disk response cache
+"""
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from mkdocs_macros.plugin import MacrosPlugin
+
+from .settings import get_config_file_path, get_settings, resolve_path
+
+logger = logging.getLogger("mkdocs.plugins.macros-utils.cache")
+
+DEFAULT_CACHE_DIR = ".cache/macros-utils"
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+DEFAULT_MAX_SIZE = 50 * 1024 * 1024  # bytes
+
+# Cache instances shared by all macros, keyed by resolved settings
+_caches: Dict[Tuple[Optional[str], float, int], "ResponseCache"] = {}
+
+
+@dataclass
+class CacheEntry:
+    """Cached response body and its metadata"""
+
+    key: str
+    body: str
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # Body cut short by a download size limit
+    truncated: bool = False
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Return True if the entry is younger than ttl seconds"""
+        return time.time() - self.stored_at < ttl
+
+
+class ResponseCache:
+    """
+    Content-addressed cache for remote responses
+
+    Entries are kept in an in-memory LRU layer and, when a cache directory is
+    given, persisted as JSON files named after the SHA-256 of their key.
+    Entries expire after `ttl` seconds, and the least recently used entries
+    are evicted once the total size exceeds `max_size` bytes. The size of the
+    directory is scanned once, then kept up to date as entries are written and
+    removed, so the directory is only scanned again when eviction is needed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path],
+        ttl: float = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir (Optional[Path]): Directory to store cache entries in,
+                or None for a memory-only cache
+            ttl (float, optional): Entry lifetime in seconds. Defaults to one day.
+            max_size (int, optional): Maximum total size in bytes. Defaults to 50MB.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.ttl = ttl
+        self.max_size = max_size
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        # Entry file sizes by file name, scanned on the first write
+        self._disk_sizes: Optional[Dict[str, int]] = None
+        self._disk_size = 0
+        self._disk_lock = threading.Lock()
+
+    def _path_for(self, key: str) -> Optional[Path]:
+        """Get the entry file path for a key"""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _remember(self, entry: CacheEntry) -> None:
+        """Put an entry into the in-memory layer, evicting LRU entries"""
+        with self._lock:
+            previous = self._memory.pop(entry.key, None)
+            if previous:
+                self._memory_size -= len(previous.body)
+            self._memory[entry.key] = entry
+            self._memory_size += len(entry.body)
+            while self._memory_size > self.max_size and len(self._memory) > 1:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted.body)
+
+    def _recall(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry from the in-memory layer"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry:
+                self._memory.move_to_end(key)
+            return entry
+
+    def get(self, key: str, include_stale: bool = False) -> Optional[CacheEntry]:
+        """
+        Get an entry from the cache
+
+        Args:
+            key (str): Cache key (usually a URL)
+            include_stale (bool, optional): Also return expired entries, e.g. for
+                conditional revalidation. Defaults to False.
+
+        Returns:
+            Optional[CacheEntry]: Cached entry, or None if missing or expired
+        """
+        entry = self._recall(key) or self._load(key)
+        if not entry:
+            return None
+        if not include_stale and not entry.is_fresh(self.ttl):
+            return None
+        return entry
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        """Load an entry from disk into the in-memory layer"""
+        path = self._path_for(key)
+        if path is None:
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entry = CacheEntry(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError):
+            logger.warning(f"Discarding corrupt cache entry: {path.name}")
+            path.unlink(missing_ok=True)
+            self._update_disk_size(path, None)
+            return None
+
+        if entry.key != key:
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._remember(entry)
+        return entry
+
+    def set(
+        self,
+        key: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        truncated: bool = False,
+    ) -> CacheEntry:
+        """
+        Store a response body in the cache
+
+        Args:
+            key (str): Cache key (usually a URL)
+            body (str): Response body
+            etag (Optional[str], optional): ETag response header. Defaults to None.
+            last_modified (Optional[str], optional): Last-Modified response header.
+                Defaults to None.
+            truncated (bool, optional): Whether the body was cut short by a size
+                limit. Defaults to False.
+
+        Returns:
+            CacheEntry: Stored entry
+        """
+        entry = CacheEntry(
+            key=key,
+            body=body,
+            stored_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+            truncated=truncated,
+        )
+        self._remember(entry)
+
+        path = self._path_for(key)
+        if self.cache_dir is None or path is None:
+            return entry
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            data = json.dumps(asdict(entry)).encode("utf-8")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            self._update_disk_size(path, len(data))
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry: {e}")
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries from the cache"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+        if self.cache_dir is None:
+            return
+        with self._disk_lock:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._disk_sizes = {}
+            self._disk_size = 0
+
+    def _scan_disk_sizes(self) -> Dict[str, int]:
+        """Get the entry file sizes, scanning the directory on first use"""
+        if self._disk_sizes is None:
+            self._disk_sizes = {}
+            if self.cache_dir is not None:
+                for path in self.cache_dir.glob("*.json"):
+                    try:
+                        self._disk_sizes[path.name] = path.stat().st_size
+                    except OSError:
+                        continue
+            self._disk_size = sum(self._disk_sizes.values())
+        return self._disk_sizes
+
+    def _update_disk_size(self, path: Path, size: Optional[int]) -> None:
+        """
+        Update the total size for a written or removed entry file
+
+        Args:
+            path (Path): Entry file path
+            size (Optional[int]): Size of the written file, or None if removed
+        """
+        with self._disk_lock:
+            sizes = self._scan_disk_sizes()
+            self._disk_size -= sizes.pop(path.name, 0)
+            if size is not None:
+                sizes[path.name] = size
+                self._disk_size += size
+            if self._disk_size > self.max_size:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used entry files until under max_size"""
+        if self.cache_dir is None:
+            return
+        # Rescan, other processes may share the directory
+        entries = []
+        sizes: Dict[str, int] = {}
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            sizes[path.name] = stat.st_size
+        total_size = sum(sizes.values())
+
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            del sizes[path.name]
+            total_size -= size
+
+        self._disk_sizes = sizes
+        self._disk_size = total_size
+
+
+def get_response_cache(env: Optional[MacrosPlugin]) -> Optional[ResponseCache]:
+    """
+    Get the shared response cache configured in `extra.macros_utils.cache`
+
+    The cache directory is relative to mkdocs.yml. When only
+    `extra.macros_utils.prefetch` is enabled, a memory-only cache is returned
+    so prefetched responses can be read back at render time.
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+
+    Returns:
+        Optional[ResponseCache]: Cache instance, or None if caching is disabled
+    """
+    cache_config = get_settings(env, "cache")
+    cache_enabled = cache_config.get("enabled", False)
+    if not cache_enabled and not get_settings(env, "prefetch").get("enabled", False):
+        return None
+
+    cache_dir = None
+    if cache_enabled:
+        cache_dir = resolve_path(
+            cache_config.get("dir", DEFAULT_CACHE_DIR), get_config_file_path(env)
+        )
+    return get_cache(
+        cache_dir,
+        float(cache_config.get("ttl", DEFAULT_TTL)),
+        int(cache_config.get("max_size", DEFAULT_MAX_SIZE)),
+    )
+
+
+def get_cache(
+    cache_dir: Optional[Path],
+    ttl: float = DEFAULT_TTL,
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> ResponseCache:
+    """
+    Get the shared cache instance for the given settings
+
+    Args:
+        cache_dir (Optional[Path]): Cache directory, or None for a memory-only cache
+        ttl (float, optional): Entry lifetime in seconds. Defaults to one day.
+        max_size (int, optional): Maximum total size in bytes. Defaults to 50MB.
+
+    Returns:
+        ResponseCache: Cache instance
+    """
+    settings = (str(cache_dir) if cache_dir is not None else None, ttl, max_size)
+    if settings not in _caches:
+        _caches[settings] = ResponseCache(cache_dir, ttl, max_size)
+    return _caches[settings]
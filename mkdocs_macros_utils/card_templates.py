@@ -0,0 +1,130 @@
+"""
+MkDocs Macros Utils card templates
+
+Card markup lives in the Jinja templates of the `templates` directory. They are
+compiled once per build, and a template of the same name in the overrides
+directory (`overrides/macros-utils` by default) replaces the bundled one, so
+themes can change the markup without patching Python code.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import logging
+import jinja2
+from mkdocs_macros.plugin import MacrosPlugin
+
+from .settings import get_config_file_path, get_settings, resolve_path
+
+logger = logging.getLogger("mkdocs.plugins.macros-utils.templates")
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+DEFAULT_OVERRIDES_DIR = "overrides/macros-utils"
+
+LINK_CARD_TEMPLATE = "link_card.html"
+X_TWITTER_CARD_TEMPLATE = "x_twitter_card.html"
+TEMPLATE_NAMES = (LINK_CARD_TEMPLATE, X_TWITTER_CARD_TEMPLATE)
+
+
+class CardTemplates:
+    """
+    Compiled card templates
+
+    All templates are compiled when the set is created and rendered from the
+    compiled form afterwards; template files are not checked for changes.
+    Values are inserted as is (no HTML escaping), like the cards always did.
+    """
+
+    def __init__(self, overrides_dir: Optional[Path] = None) -> None:
+        """
+        Initialize and compile the templates
+
+        Args:
+            overrides_dir (Optional[Path], optional): Directory of templates
+                replacing the bundled ones. Defaults to None.
+
+        Raises:
+            jinja2.TemplateError: If a template cannot be compiled
+        """
+        search_path = [TEMPLATES_DIR]
+        overrides: Dict[str, Path] = {}
+        if overrides_dir and overrides_dir.is_dir():
+            search_path.insert(0, overrides_dir)
+            overrides = {
+                name: overrides_dir / name
+                for name in TEMPLATE_NAMES
+                if (overrides_dir / name).is_file()
+            }
+
+        self.environment = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(search_path),
+            autoescape=False,
+            auto_reload=False,
+            keep_trailing_newline=True,
+        )
+        self.overrides = sorted(overrides)
+        # Changes when an override is edited, so memoized cards are re-rendered
+        self.fingerprint: Tuple[Tuple[str, int, int], ...] = tuple(
+            (name, path.stat().st_mtime_ns, path.stat().st_size)
+            for name, path in sorted(overrides.items())
+        )
+        self._templates: Dict[str, jinja2.Template] = {
+            name: self.environment.get_template(name) for name in TEMPLATE_NAMES
+        }
+
+    def render(self, name: str, **context: Any) -> str:
+        """
+        Render a card template
+
+        Args:
+            name (str): Template name (e.g. "link_card.html")
+            **context: Template variables
+
+        Returns:
+            str: Rendered HTML
+        """
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = self.environment.get_template(name)
+        return template.render(**context)
+
+
+# Templates of the current build, bundled ones until configured
+_templates: Optional[CardTemplates] = None
+
+
+def get_templates() -> CardTemplates:
+    """Get the card templates of the current build"""
+    global _templates
+    if _templates is None:
+        _templates = CardTemplates()
+    return _templates
+
+
+def configure_templates(env: Optional[MacrosPlugin]) -> CardTemplates:
+    """
+    Compile the card templates configured in `extra.macros_utils.templates`
+
+    The overrides directory is relative to mkdocs.yml. Invalid overrides are
+    reported and the bundled templates are used instead.
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+
+    Returns:
+        CardTemplates: Card templates of the build
+    """
+    global _templates
+    templates_config = get_settings(env, "templates")
+    overrides_dir = resolve_path(
+        templates_config.get("overrides_dir", DEFAULT_OVERRIDES_DIR),
+        get_config_file_path(env),
+    )
+    try:
+        _templates = CardTemplates(overrides_dir)
+    except jinja2.TemplateError as e:
+        logger.error(f"Invalid card template in {overrides_dir}: {e}")
+        _templates = CardTemplates()
+
+    if _templates.overrides:
+        logger.info(f"Card templates overridden: {', '.join(_templates.overrides)}")
+    return _templates
@@ -3,9 +3,14 @@ MkDocs Macros Cards Debug Logger Module
 """
 
 import logging
-from typing import Optional, Any, Dict
+from typing import Callable, Optional, Any, Dict, Union
+from weakref import WeakKeyDictionary
 from mkdocs_macros.plugin import MacrosPlugin
 
+# Loggers resolved once per environment, keyed by module name
+_env_loggers: "WeakKeyDictionary[Any, Dict[str, DebugLogger]]" = WeakKeyDictionary()
+_default_loggers: Dict[str, "DebugLogger"] = {}
+
 
 class DebugLogger:
     """
@@ -27,14 +32,28 @@ class DebugLogger:
 
         Returns: Args: module_name (str): Module name of the logger.
             DebugLogger: Debug logger instance initialized.
+
+        Loggers are memoized per (module, env), so the debug settings are read
+        once per build rather than on every macro call.
         """
-        # Get debug configuration
-        debug_config = cls._get_debug_config(env)
+        try:
+            loggers = (
+                _default_loggers if env is None else _env_loggers.setdefault(env, {})
+            )
+        except TypeError:
+            # Environment cannot be weakly referenced, resolve every time
+            loggers = {}
+
+        logger = loggers.get(module_name)
+        if logger is None:
+            # Get debug configuration
+            debug_config = cls._get_debug_config(env)
 
-        # Get module-specific debug configuration (default is false)
-        module_debug = debug_config.get(module_name, False)
+            # Get module-specific debug configuration (default is false)
+            module_debug = debug_config.get(module_name, False)
 
-        return cls(module_name, module_debug)
+            logger = loggers[module_name] = cls(module_name, module_debug)
+        return logger
 
     @classmethod
     def _get_debug_config(cls, env: Optional[MacrosPlugin] = None) -> Dict[str, bool]:
@@ -71,19 +90,45 @@ class DebugLogger:
         self.logger.setLevel(logging.DEBUG if enabled else logging.WARNING)
         self.enabled = enabled
 
-    def log(self, message: str, data: Optional[Any] = None) -> None:
+    def log(
+        self,
+        message: Union[str, Callable[[], str]],
+        data: Optional[Any] = None,
+    ) -> None:
         """
         Output debugging information
 
+        Message and data may be callables, which are only evaluated when debug
+        logging is enabled.
+
         Args: Outputs debugging information.
-            message (str): log message
+            message (Union[str, Callable[[], str]]): log message
             data (Optional[Any], optional): additional log data. Defaults to None.
         """
         if not self.enabled:
             return
 
+        if callable(message):
+            message = message()
         self.logger.debug(f"{message}")
+        if callable(data):
+            data = data()
         if data is not None:
             # Convert data to string and output
             data_str = str(data) if not isinstance(data, str) else data
             self.logger.debug(f"        {data_str}")
+
+    def logf(self, message: str, *args: Any) -> None:
+        """
+        Output debugging information formatted with %-style arguments
+
+        The message is only formatted when debug logging is enabled.
+
+        Args:
+            message (str): log message format
+            *args: format arguments
+        """
+        if not self.enabled:
+            return
+
+        self.logger.debug(message, *args)
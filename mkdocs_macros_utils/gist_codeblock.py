@@ -2,22 +2,89 @@
 MkDocs Macros Plugin for fetching and displaying Gist code blocks.
 """
 
-from typing import Optional, Tuple, Dict
+from dataclasses import dataclass
+from typing import List, Optional, Set, Tuple, Dict
+import hashlib
+import json
+import os
 import re
-import requests
 from mkdocs_macros.plugin import MacrosPlugin
 from pathlib import Path
-from pygments.lexers import guess_lexer, TextLexer
 
 # Import debug logger
 from .debug_logger import DebugLogger
+from .cache import ResponseCache, get_response_cache
+from .http_client import HttpRequestError, cached_get, http_get
+from .incremental import track_macro
+from .lockfile import get_active_lock
+from .profiler import PHASE_NETWORK, PHASE_PARSE, phase, profile_macro, record_cache
+from .settings import get_settings
+from .singleflight import SingleFlight
+from .url_classifier import PROVIDER_GIST, PROVIDER_GIST_RAW, classify_url
+
+# Gist resolution modes
+RESOLVER_HTML = "html"
+RESOLVER_API = "api"
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_TOKEN_ENV = "GITHUB_TOKEN"
+# Characters analysed by guess_lexer, 0 for the whole content
+DEFAULT_LEXER_SAMPLE_SIZE = 0
+# Maximum size of a Gist file in bytes, 0 for no limit
+DEFAULT_MAX_CONTENT_SIZE = 1024 * 1024
+
+# Raw file links of a Gist page, e.g. href="/user/id/raw/rev/file.py"
+RAW_PATH_PATTERN = re.compile(r'href="(/[^/]+/[^/]+/raw/[^"]+)"')
+
+
+@dataclass
+class GistFile:
+    """File entry of a Gist"""
+
+    filename: str
+    raw_url: str
 
 
 class GistProcessor:
-    """Class for processing Gists"""
+    """Class for processing Gists
+
+    The processor can be shared by worker threads. Concurrent requests for the
+    same Gist manifest, raw file or language guess are coalesced, so only the
+    first caller does the work and the others wait for its result.
+    """
 
-    def __init__(self, logger: DebugLogger) -> None:
+    def __init__(
+        self,
+        logger: DebugLogger,
+        cache: Optional[ResponseCache] = None,
+        resolver: str = RESOLVER_HTML,
+        api_url: str = DEFAULT_API_URL,
+        api_token: Optional[str] = None,
+        lexer_sample_size: int = DEFAULT_LEXER_SAMPLE_SIZE,
+        max_content_size: int = DEFAULT_MAX_CONTENT_SIZE,
+    ) -> None:
         self.logger = logger
+        self.cache = cache
+        self.resolver = resolver
+        self.api_url = api_url.rstrip("/")
+        self.api_token = api_token
+        self.lexer_sample_size = lexer_sample_size
+        self.max_content_size = max_content_size
+        # Raw URLs of files cut to max_content_size
+        self.truncated_urls: Set[str] = set()
+        # Languages guessed by Pygments, keyed by hash of the analysed content
+        self.detected_languages: Dict[str, str] = {}
+        # Inline file contents returned by the Gist API, keyed by raw URL
+        self.inline_content: Dict[str, str] = {}
+        # File manifests, keyed by Gist page URL
+        self.manifests: Dict[str, List[GistFile]] = {}
+        # Manifest, content and language lookups in flight
+        self.manifest_flights: SingleFlight[Tuple[List[GistFile], Optional[str]]] = (
+            SingleFlight()
+        )
+        self.content_flights: SingleFlight[Tuple[Optional[str], Optional[str]]] = (
+            SingleFlight()
+        )
+        self.language_flights: SingleFlight[str] = SingleFlight()
         # Language and extension mappings
         self.lang_map: Dict[str, str] = {
             # Extension-based mappings
@@ -50,53 +117,178 @@ class GistProcessor:
         }
 
     def get_gist_info(
-        self, gist_url: str
+        self, gist_url: str, filename: Optional[str] = None
     ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-        """Get raw URL and metadata from Gist URL"""
+        """Get raw URL and metadata from Gist URL
+
+        Picks the file named `filename`, or the first file of the Gist.
+        """
         self.logger.log("Processing URL", gist_url)
 
-        # Return as is if already a raw URL
-        if gist_url.startswith("https://gist.githubusercontent.com/"):
-            filename = gist_url.split("/")[-1]
-            self.logger.log("Already raw URL", filename)
-            return gist_url, filename, None
+        files, error = self.get_gist_files(gist_url)
+        if error:
+            return None, None, error
 
-        # Extract username and Gist ID
-        pattern = r"https://gist\.github\.com/([^/]+)/([a-f0-9]+)"
-        match = re.match(pattern, gist_url)
+        if filename:
+            for gist_file in files:
+                if gist_file.filename == filename:
+                    return gist_file.raw_url, gist_file.filename, None
+            return None, None, f"File not found in Gist: {filename}"
 
-        if not match:
-            self.logger.log("Invalid URL format")
-            return None, None, "Invalid Gist URL format"
+        if not files:
+            return None, None, "Could not find raw file URL in Gist"
+        return files[0].raw_url, files[0].filename, None
+
+    def get_gist_files(self, gist_url: str) -> Tuple[List[GistFile], Optional[str]]:
+        """Get the file manifest of a Gist
+
+        The manifest is fetched once per Gist and reused for every file.
+        """
+        info = classify_url(gist_url)
 
-        username, gist_id = match.groups()
-        self.logger.log("Extracted info", f"username={username}, gist_id={gist_id}")
+        # Return as is if already a raw URL
+        if info.provider == PROVIDER_GIST_RAW:
+            self.logger.log("Already raw URL", info.filename)
+            return [GistFile(info.filename or "", gist_url)], None
 
+        if info.provider != PROVIDER_GIST:
+            self.logger.log("Invalid URL format")
+            return [], "Invalid Gist URL format"
+
+        gist_id = info.resource_id or ""
+        self.logger.logf("Extracted info: username=%s, gist_id=%s", info.user, gist_id)
+
+        page_url = info.canonical_url
+        if page_url in self.manifests:
+            self.logger.log("Using file manifest", page_url)
+            return self.manifests[page_url], None
+
+        return self.manifest_flights.do(
+            page_url, lambda: self.resolve_gist_files(gist_id, page_url)
+        )
+
+    def resolve_gist_files(
+        self, gist_id: str, page_url: str
+    ) -> Tuple[List[GistFile], Optional[str]]:
+        """Resolve the file manifest of a Gist with the configured resolver"""
+        # Another thread may have resolved it since the manifest was checked
+        if page_url in self.manifests:
+            return self.manifests[page_url], None
+
+        if self.resolver == RESOLVER_API:
+            files, error = self.get_gist_files_from_api(gist_id)
+        else:
+            files, error = self.get_gist_files_from_page(page_url)
+
+        if files:
+            self.manifests[page_url] = files
+        return files, error
+
+    def get_gist_files_from_page(
+        self, page_url: str
+    ) -> Tuple[List[GistFile], Optional[str]]:
+        """Get the file manifest by scanning the Gist page for raw links"""
+        raw_paths: List[str] = []
+        lock = get_active_lock()
+        if lock and lock.offline:
+            raw_paths = lock.lookup(page_url).splitlines()
+            self.logger.log("Got file info from lockfile", page_url)
+        elif self.cache:
+            entry = self.cache.get(page_url)
+            if entry:
+                raw_paths = entry.body.splitlines()
+                self.logger.log("Got file info from cache", page_url)
+                record_cache("response", True)
+
+        if not raw_paths:
+            try:
+                # Get information from Gist page
+                with phase(PHASE_NETWORK):
+                    response = http_get(page_url)
+                if response.status_code != 200:
+                    return [], f"Failed to fetch Gist: HTTP {response.status_code}"
+            except HttpRequestError as e:
+                return [], f"Request error: {str(e)}"
+
+            # Find filenames and raw URLs, keeping page order
+            with phase(PHASE_PARSE):
+                raw_paths = list(dict.fromkeys(RAW_PATH_PATTERN.findall(response.text)))
+            if not raw_paths:
+                return [], "Could not find raw file URL in Gist"
+
+            if self.cache:
+                record_cache("response", False)
+                self.cache.set(page_url, "\n".join(raw_paths))
+
+        if lock:
+            lock.record(page_url, "\n".join(raw_paths))
+
+        files = [
+            GistFile(
+                raw_path.split("/")[-1], f"https://gist.githubusercontent.com{raw_path}"
+            )
+            for raw_path in raw_paths
+        ]
+        self.logger.log(
+            "Got file info from page", lambda: ", ".join(f.filename for f in files)
+        )
+        return files, None
+
+    def get_gist_files_from_api(
+        self, gist_id: str
+    ) -> Tuple[List[GistFile], Optional[str]]:
+        """Get the file manifest from the Gist REST API
+
+        A single JSON request returns every file of the Gist. Contents of
+        files that are not truncated are kept so that fetching them later
+        does not need another request.
+        """
+        api_url, headers = self.get_api_request(gist_id)
         try:
-            # Get information from Gist page
-            response = requests.get(f"https://gist.github.com/{username}/{gist_id}")
-            if response.status_code != 200:
-                return None, None, f"Failed to fetch Gist: HTTP {response.status_code}"
-
-            # Find filename and raw URL
-            raw_button_match = re.search(
-                r'href="(/[^/]+/[^/]+/raw/[^"]+)"', response.text
+            result = cached_get(
+                api_url, self.cache, self.logger, timeout=10, headers=headers
             )
+        except HttpRequestError as e:
+            return [], f"Request error: {str(e)}"
 
-            if raw_button_match:
-                raw_path = raw_button_match.group(1)
-                raw_url = f"https://gist.githubusercontent.com{raw_path}"
-                filename = raw_path.split("/")[-1]
+        if result.status_code != 200 or result.text is None:
+            return [], f"Failed to fetch Gist: HTTP {result.status_code}"
 
-                self.logger.log(
-                    "Got file info from page", f"filename={filename}, raw_url={raw_url}"
-                )
-                return raw_url, filename, None
+        with phase(PHASE_PARSE):
+            return self.parse_api_files(result.text)
 
-            return None, None, "Could not find raw file URL in Gist"
+    def get_api_request(self, gist_id: str) -> Tuple[str, Dict[str, str]]:
+        """Get the Gist API URL and request headers of a Gist"""
+        headers = {"Accept": "application/vnd.github+json"}
+        if self.api_token:
+            headers["Authorization"] = f"Bearer {self.api_token}"
+        return f"{self.api_url}/gists/{gist_id}", headers
+
+    def parse_api_files(self, text: str) -> Tuple[List[GistFile], Optional[str]]:
+        """Get the file manifest from a Gist API response body"""
+        try:
+            file_infos = json.loads(text).get("files") or {}
+        except (ValueError, AttributeError):
+            return [], "Invalid Gist API response"
 
-        except requests.RequestException as e:
-            return None, None, f"Request error: {str(e)}"
+        files: List[GistFile] = []
+        for filename, file_info in file_infos.items():
+            raw_url = file_info.get("raw_url")
+            if not raw_url:
+                continue
+
+            content = file_info.get("content")
+            if content is not None and not file_info.get("truncated", False):
+                self.inline_content[raw_url] = content
+            files.append(GistFile(filename, raw_url))
+
+        if not files:
+            return [], "Could not find raw file URL in Gist"
+
+        self.logger.log(
+            "Got file info from API", lambda: ", ".join(f.filename for f in files)
+        )
+        return files, None
 
     def detect_language_from_filename(self, filename: str) -> str:
         """Detect language from filename"""
@@ -109,13 +301,17 @@ class GistProcessor:
 
         # Get language from mapping, default to 'text'
         detected_lang = self.lang_map.get(ext, "text")
-        self.logger.log(f"Language from filename: {detected_lang}")
+        self.logger.logf("Language from filename: %s", detected_lang)
         return detected_lang
 
     def detect_language_from_content(
         self, content: str, filename: Optional[str] = None
     ) -> str:
-        """Detect language from content"""
+        """Detect language from content
+
+        Languages guessed by Pygments are memoized by the hash of the analysed
+        content, and persisted in the response cache when one is configured.
+        """
         # First try to detect language from filename
         if filename:
             file_lang = self.detect_language_from_filename(filename)
@@ -123,7 +319,34 @@ class GistProcessor:
                 self.logger.log("Language detected from filename", file_lang)
                 return file_lang
 
-        # Language detection using Pygments
+        # Only the leading part of large files is analysed if configured
+        sample = content
+        if self.lexer_sample_size > 0:
+            sample = content[: self.lexer_sample_size]
+
+        digest = hashlib.sha256(sample.encode("utf-8")).hexdigest()
+        memo_key = f"language:{digest}"
+        if digest in self.detected_languages:
+            return self.detected_languages[digest]
+        if self.cache:
+            entry = self.cache.get(memo_key)
+            if entry:
+                self.logger.log("Reusing detected language", entry.body)
+                self.detected_languages[digest] = entry.body
+                return entry.body
+
+        with phase(PHASE_PARSE):
+            lang = self.language_flights.do(digest, lambda: self.guess_language(sample))
+        self.detected_languages[digest] = lang
+        if self.cache:
+            self.cache.set(memo_key, lang)
+        return lang
+
+    def guess_language(self, content: str) -> str:
+        """Guess language of content with Pygments"""
+        # Pygments is imported on first use to keep plugin startup fast
+        from pygments.lexers import guess_lexer, TextLexer
+
         try:
             lexer = guess_lexer(content)
 
@@ -139,7 +362,7 @@ class GistProcessor:
             return self.convert_pygments_to_markdown_lang(lang_name)
 
         except Exception as e:
-            self.logger.log("Error in language detection", str(e))
+            self.logger.log("Error in language detection", e)
             return "text"
 
     def convert_pygments_to_markdown_lang(self, pygments_name: str) -> str:
@@ -168,42 +391,190 @@ class GistProcessor:
         """Fetch content from raw Gist URL"""
         self.logger.log("Fetching content from", url)
 
+        if url in self.inline_content:
+            self.logger.log("Using inline content from Gist API", url)
+            return self.limit_content(url, self.inline_content[url]), None
+
+        return self.content_flights.do(url, lambda: self.fetch_raw_content(url))
+
+    def fetch_raw_content(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """Fetch content from raw Gist URL through the response cache"""
         try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                content_length = len(response.text)
-                self.logger.log(
-                    "Content fetched successfully", f"Length: {content_length} chars"
+            result = cached_get(
+                url,
+                self.cache,
+                self.logger,
+                timeout=10,
+                max_size=self.max_content_size or None,
+            )
+            if result.status_code == 200 and result.text is not None:
+                self.logger.logf(
+                    "Content fetched successfully: %d chars", len(result.text)
                 )
-                return response.text, None
+                return self.limit_content(url, result.text, result.truncated), None
 
-            self.logger.log(
-                "Failed to fetch content", f"Status code: {response.status_code}"
+            self.logger.logf(
+                "Failed to fetch content: status code %s", result.status_code
             )
-            return None, f"Failed to fetch Gist content: HTTP {response.status_code}"
-        except requests.RequestException as e:
-            self.logger.log("Error fetching content", str(e))
+            return None, f"Failed to fetch Gist content: HTTP {result.status_code}"
+        except HttpRequestError as e:
+            self.logger.log("Error fetching content", e)
             return None, f"Error fetching Gist content: {str(e)}"
 
+    def limit_content(self, url: str, content: str, truncated: bool = False) -> str:
+        """Cut content larger than max_content_size after its last whole line
+
+        `truncated` marks content whose download was already cut short, which
+        is always cut, whatever its length.
+        """
+        if not self.max_content_size:
+            return content
+        # UTF-8 needs at most 4 bytes per character
+        if not truncated and len(content) * 4 <= self.max_content_size:
+            return content
+        encoded = content.encode("utf-8")
+        if not truncated and len(encoded) <= self.max_content_size:
+            return content
+
+        content = encoded[: self.max_content_size].decode("utf-8", errors="ignore")
+        last_newline = content.rfind("\n")
+        if last_newline > 0:
+            content = content[:last_newline]
+        self.truncated_urls.add(url)
+        self.logger.logf(
+            "Content truncated to %d bytes: %s", self.max_content_size, url
+        )
+        return content
+
+    def render_truncation_notice(self, gist_url: str, indent: int = 0) -> str:
+        """Render the note below a truncated code block, linking the full Gist"""
+        size = self.max_content_size
+        limit = f"{size // 1024} KiB" if size >= 1024 else f"{size} bytes"
+        indent_spaces = " " * (4 * indent)
+        return (
+            f"\n{indent_spaces}*Truncated to the first {limit}. "
+            f"[View the full Gist]({gist_url})*\n"
+        )
+
+    def render_code_block(
+        self,
+        content: str,
+        filename: Optional[str],
+        indent: int = 0,
+        ext: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> str:
+        """Render Gist content as a Markdown code block
+
+        With a response cache, the rendered block is stored under a key derived
+        from the content hash, so unchanged Gists skip language detection,
+        unescaping and indentation on later builds.
+        """
+        memo_key = None
+        if self.cache:
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            memo_key = f"codeblock:{digest}:{filename}:{indent}:{ext}:{title}"
+            entry = self.cache.get(memo_key)
+            if entry:
+                self.logger.log("Reusing rendered code block", memo_key)
+                return entry.body
+
+        # Language detection logic
+        if ext:
+            # Prioritize user-specified extension
+            self.logger.log("Using specified extension", ext)
+            lang = ext
+        else:
+            # Detect language from extension and content
+            lang = self.detect_language_from_content(content, filename)
+
+        self.logger.log("Final language selection", lang)
+
+        # Unescape special characters
+        content = content.replace("\\$", "$")
+        content = content.replace("\\`", "`")
+        content = content.replace("\\{", "{")
+        content = content.replace("\\}", "}")
+
+        # Calculate indentation (4 spaces × level)
+        indent_spaces = " " * (4 * indent)
+        title_attr = f' title="{title}"' if title else ""
+
+        # Generate code block
+        code_block = [
+            "",  # Add empty line
+            f"{indent_spaces}```{lang}{title_attr}",
+            *[f"{indent_spaces}{line}" for line in content.splitlines()],
+            f"{indent_spaces}```",
+            "",  # Add empty line
+        ]
+        rendered = "\n".join(code_block)
+
+        if self.cache and memo_key:
+            self.cache.set(memo_key, rendered)
+        return rendered
+
+
+def create_processor(env: Optional[MacrosPlugin]) -> GistProcessor:
+    """
+    Create a GistProcessor configured from `extra.macros_utils.gist`
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+
+    Returns:
+        GistProcessor: Configured processor
+    """
+    gist_config = get_settings(env, "gist")
+    token_env = gist_config.get("token_env", DEFAULT_TOKEN_ENV)
+    return GistProcessor(
+        DebugLogger.create_logger("gist_codeblock", env),
+        get_response_cache(env),
+        resolver=gist_config.get("resolver", RESOLVER_HTML),
+        api_url=gist_config.get("api_url", DEFAULT_API_URL),
+        api_token=os.environ.get(token_env) if token_env else None,
+        lexer_sample_size=int(
+            gist_config.get("lexer_sample_size", DEFAULT_LEXER_SAMPLE_SIZE)
+        ),
+        max_content_size=int(
+            gist_config.get("max_content_size", DEFAULT_MAX_CONTENT_SIZE)
+        ),
+    )
+
 
 def define_env(env: MacrosPlugin) -> None:
     """
     Define gist_codeblock macro in MkDocs macro environment
     """
-    # Create debug logger
-    logger = DebugLogger.create_logger("gist_codeblock", env)
-    processor = GistProcessor(logger)
+    processor = create_processor(env)
+    logger = processor.logger
 
     @env.macro
+    @profile_macro
+    @track_macro
     def gist_codeblock(
-        gist_url: str, indent: int = 0, ext: Optional[str] = None
+        gist_url: str,
+        indent: int = 0,
+        ext: Optional[str] = None,
+        file: Optional[str] = None,
+        all_files: bool = False,
     ) -> str:
         """Macro to generate code block from Gist"""
         logger.log("\n=== Starting new Gist processing ===")
-        logger.log("Input parameters", f"URL={gist_url}, indent={indent}, ext={ext}")
+        logger.logf(
+            "Input parameters: URL=%s, indent=%s, ext=%s, file=%s, all_files=%s",
+            gist_url,
+            indent,
+            ext,
+            file,
+            all_files,
+        )
+
+        if all_files:
+            return render_all_files(gist_url, indent, ext)
 
         # Get raw URL and metadata
-        raw_url, filename, error = processor.get_gist_info(gist_url)
+        raw_url, filename, error = processor.get_gist_info(gist_url, file)
         if error:
             logger.log("Error getting Gist info", error)
             return f"Error: {error}"
@@ -211,7 +582,7 @@ def define_env(env: MacrosPlugin) -> None:
         if raw_url is None:
             return "Error: Failed to get raw URL"
 
-        logger.log("Got Gist info", f"raw_url={raw_url}, filename={filename}")
+        logger.logf("Got Gist info: raw_url=%s, filename=%s", raw_url, filename)
 
         # Get content
         content, error = processor.fetch_gist_content(raw_url)
@@ -222,34 +593,36 @@ def define_env(env: MacrosPlugin) -> None:
         if content is None:
             return "Error: Failed to fetch content"
 
-        # Language detection logic
-        if ext:
-            # Prioritize user-specified extension
-            logger.log("Using specified extension", ext)
-            lang = ext
-        else:
-            # Detect language from extension and content
-            lang = processor.detect_language_from_content(content, filename)
-
-        logger.log("Final language selection", lang)
+        code_block = processor.render_code_block(content, filename, indent, ext)
+        if raw_url in processor.truncated_urls:
+            code_block += processor.render_truncation_notice(gist_url, indent)
 
-        # Unescape special characters
-        content = content.replace("\\$", "$")
-        content = content.replace("\\`", "`")
-        content = content.replace("\\{", "{")
-        content = content.replace("\\}", "}")
+        logger.log("=== Gist processing completed ===\n")
+        return code_block
 
-        # Calculate indentation (4 spaces × level)
-        indent_spaces = " " * (4 * indent)
+    def render_all_files(gist_url: str, indent: int, ext: Optional[str]) -> str:
+        """Render every file of a Gist as titled code blocks"""
+        files, error = processor.get_gist_files(gist_url)
+        if error:
+            logger.log("Error getting Gist files", error)
+            return f"Error: {error}"
 
-        # Generate code block
-        code_block = [
-            "",  # Add empty line
-            f"{indent_spaces}```{lang}",
-            *[f"{indent_spaces}{line}" for line in content.splitlines()],
-            f"{indent_spaces}```",
-            "",  # Add empty line
-        ]
+        code_blocks = []
+        for gist_file in files:
+            content, error = processor.fetch_gist_content(gist_file.raw_url)
+            if error:
+                logger.log("Error fetching content", error)
+                return f"Error: {error}"
+            if content is None:
+                return "Error: Failed to fetch content"
+
+            code_blocks.append(
+                processor.render_code_block(
+                    content, gist_file.filename, indent, ext, title=gist_file.filename
+                )
+            )
+            if gist_file.raw_url in processor.truncated_urls:
+                code_blocks.append(processor.render_truncation_notice(gist_url, indent))
 
         logger.log("=== Gist processing completed ===\n")
-        return "\n".join(code_block)
+        return "\n".join(code_blocks)
@@ -0,0 +1,337 @@
+"""
+MkDocs Macros Utils HTTP client helpers
+
+`requests` is imported on first use, so sites that never fetch remote
+content do not pay for it at startup.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
+import threading
+from mkdocs_macros.plugin import MacrosPlugin
+
+from .cache import ResponseCache
+from .debug_logger import DebugLogger
+from .lockfile import get_active_lock
+from .profiler import PHASE_NETWORK, phase, record_cache
+from .settings import get_settings
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Session shared by all macros, recreated when its settings change
+_session: Optional["requests.Session"] = None
+_session_settings: Optional[Tuple[int, int, float]] = None
+_session_lock = threading.Lock()
+# Settings from mkdocs.yml, applied when the session is first used
+_configured_settings: Tuple[int, int, float] = (
+    DEFAULT_POOL_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_BACKOFF_FACTOR,
+)
+
+
+class HttpRequestError(Exception):
+    """Raised when an HTTP request fails (wraps requests.RequestException)"""
+
+
+def get_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+) -> "requests.Session":
+    """
+    Get the shared HTTP session
+
+    The session keeps connections alive in a pool per host and retries
+    failed requests with exponential backoff.
+
+    Args:
+        pool_size (int, optional): Connections kept per host. Defaults to 10.
+        max_retries (int, optional): Retries per request. Defaults to 3.
+        backoff_factor (float, optional): Retry backoff factor. Defaults to 0.5.
+
+    Returns:
+        requests.Session: Shared session
+    """
+    global _session, _session_settings
+
+    settings = (pool_size, max_retries, backoff_factor)
+    with _session_lock:
+        if _session is not None and _session_settings == settings:
+            return _session
+
+        if _session is not None:
+            _session.close()
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=("GET", "HEAD"),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        _session = session
+        _session_settings = settings
+        return session
+
+
+def configure_session(env: Optional[MacrosPlugin]) -> None:
+    """
+    Configure the shared HTTP session from `extra.macros_utils.http`
+
+    The session itself is created on the first request.
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+    """
+    global _configured_settings
+
+    http_config = get_settings(env, "http")
+    _configured_settings = (
+        int(http_config.get("pool_size", DEFAULT_POOL_SIZE)),
+        int(http_config.get("max_retries", DEFAULT_MAX_RETRIES)),
+        float(http_config.get("backoff_factor", DEFAULT_BACKOFF_FACTOR)),
+    )
+
+
+def get_configured_session() -> "requests.Session":
+    """
+    Get the shared HTTP session with the configured settings
+
+    Returns:
+        requests.Session: Shared session
+    """
+    return get_session(*_configured_settings)
+
+
+def http_get(url: str, **kwargs: Any) -> "requests.Response":
+    """
+    GET a URL with the shared HTTP session
+
+    Args:
+        url (str): URL to fetch
+        **kwargs: Extra arguments for requests.Session.get
+
+    Returns:
+        requests.Response: Response
+
+    Raises:
+        HttpRequestError: If the request fails
+    """
+    import requests
+
+    try:
+        return get_configured_session().get(url, **kwargs)
+    except requests.RequestException as e:
+        raise HttpRequestError(str(e)) from e
+
+
+def get_pool_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get connection pool statistics of the shared session
+
+    Returns:
+        Dict[str, Dict[str, int]]: Per-host connections opened, requests sent
+            and idle connections available
+    """
+    stats: Dict[str, Dict[str, int]] = {}
+    if _session is None:
+        return stats
+
+    for adapter in _session.adapters.values():
+        pool_manager = getattr(adapter, "poolmanager", None)
+        if pool_manager is None:
+            continue
+        for key in pool_manager.pools.keys():
+            pool = pool_manager.pools.get(key)
+            if pool is None:
+                continue
+            stats[f"{pool.scheme}://{pool.host}"] = {
+                "connections": pool.num_connections,
+                "requests": pool.num_requests,
+                "idle": pool.pool.qsize() if pool.pool else 0,
+            }
+    return stats
+
+
+@dataclass
+class FetchResult:
+    """Result of a (possibly cached) GET request"""
+
+    status_code: int
+    text: Optional[str] = None
+    from_cache: bool = False
+    truncated: bool = False
+
+
+def read_limited(response: "requests.Response", max_size: int) -> Tuple[str, bool]:
+    """
+    Read a streamed response body, aborting once it exceeds max_size bytes
+
+    A few bytes past the limit are kept, so the decoded text is still longer
+    than the limit when a multi-byte character is cut.
+
+    Args:
+        response (requests.Response): Response requested with stream=True
+        max_size (int): Maximum body size in bytes
+
+    Returns:
+        Tuple[str, bool]: Body and whether the download was aborted
+
+    Raises:
+        HttpRequestError: If the connection fails while reading the body
+    """
+    import requests
+
+    chunks = []
+    size = 0
+    truncated = False
+    try:
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_size + 3:
+                truncated = True
+                break
+    except requests.RequestException as e:
+        raise HttpRequestError(str(e)) from e
+    finally:
+        response.close()
+
+    content = b"".join(chunks)
+    if truncated:
+        content = content[: max_size + 4]
+    body = content.decode(
+        response.encoding or "utf-8", errors="ignore" if truncated else "replace"
+    )
+    return body, truncated
+
+
+def cached_get(
+    url: str,
+    cache: Optional[ResponseCache],
+    logger: DebugLogger,
+    timeout: Optional[float] = None,
+    headers: Optional[Dict[str, str]] = None,
+    max_size: Optional[int] = None,
+) -> FetchResult:
+    """
+    GET a URL through the response cache
+
+    Fresh cache entries are returned without network access. Expired entries
+    are revalidated with If-None-Match / If-Modified-Since, so unchanged
+    resources answer 304 and the cached body is reused. With `max_size`, the
+    body is streamed and the download aborted once it exceeds the limit; the
+    partial body is returned (and cached) with `truncated` set. A truncated
+    entry is only reused while it still holds more than `max_size` bytes, so
+    a larger limit fetches the resource again.
+
+    Args:
+        url (str): URL to fetch
+        cache (Optional[ResponseCache]): Response cache, or None to always fetch
+        logger (DebugLogger): Debug logger
+        timeout (Optional[float], optional): Request timeout in seconds. Defaults to None.
+        headers (Optional[Dict[str, str]], optional): Extra request headers.
+            Defaults to None.
+        max_size (Optional[int], optional): Maximum body size in bytes.
+            Defaults to None (no limit).
+
+    Returns:
+        FetchResult: Status code and body (body is None unless status is 200)
+
+    Raises:
+        HttpRequestError: If the request fails
+        OfflineResourceError: If offline and the URL is not in the lockfile
+    """
+    lock = get_active_lock()
+    if lock and lock.offline:
+        logger.log("Serving from lockfile", url)
+        record_cache("lockfile", True)
+        return FetchResult(
+            200, lock.lookup(url), from_cache=True, truncated=lock.is_truncated(url)
+        )
+
+    entry = cache.get(url, include_stale=True) if cache else None
+    if entry and entry.truncated:
+        if not max_size or len(entry.body.encode("utf-8")) <= max_size:
+            # Cut short by a smaller limit, so fetch the body again
+            logger.log("Ignoring cache entry truncated to a smaller limit", url)
+            entry = None
+    if cache and entry and entry.is_fresh(cache.ttl):
+        logger.log("Cache hit", url)
+        record_cache("response", True)
+        if lock:
+            lock.record(url, entry.body, entry.truncated)
+        return FetchResult(200, entry.body, from_cache=True, truncated=entry.truncated)
+
+    request_headers: Dict[str, str] = dict(headers or {})
+    if entry:
+        if entry.etag:
+            request_headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request_headers["If-Modified-Since"] = entry.last_modified
+        logger.log("Revalidating cache entry", url)
+
+    stream = max_size is not None and max_size > 0
+    with phase(PHASE_NETWORK):
+        response = http_get(
+            url, headers=request_headers, timeout=timeout, stream=stream
+        )
+    if logger.enabled:
+        logger.log("Connection pool stats", get_pool_stats())
+
+    if cache and entry and response.status_code == 304:
+        logger.log("Not modified, reusing cached body", url)
+        record_cache("response", True)
+        if stream:
+            response.close()
+        cache.set(url, entry.body, entry.etag, entry.last_modified, entry.truncated)
+        if lock:
+            lock.record(url, entry.body, entry.truncated)
+        return FetchResult(200, entry.body, from_cache=True, truncated=entry.truncated)
+
+    if cache:
+        record_cache("response", False)
+    if response.status_code != 200:
+        if stream:
+            response.close()
+        return FetchResult(response.status_code)
+
+    truncated = False
+    if stream:
+        with phase(PHASE_NETWORK):
+            text, truncated = read_limited(response, cast(int, max_size))
+        if truncated:
+            logger.logf("Download aborted after %d bytes: %s", max_size, url)
+    else:
+        text = response.text
+
+    if cache:
+        cache.set(
+            url,
+            text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            truncated=truncated,
+        )
+    if lock:
+        lock.record(url, text, truncated)
+    return FetchResult(200, text, truncated=truncated)
@@ -0,0 +1,219 @@
+"""
+MkDocs Macros Utils incremental rebuilds for `mkdocs serve`
+
+The dependency tracker records the macro results of each page. When
+`mkdocs serve` rebuilds the site, pages whose Markdown did not change reuse
+their previous macro results, so only edited pages run their macros (and
+network requests) again. Error output and results that macros mark as not
+reusable (e.g. cards rendered without a remote resource that failed to load)
+are computed again on the next build.
+"""
+
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import hashlib
+import json
+import logging
+from mkdocs_macros.plugin import MacrosPlugin
+
+from .card_templates import get_templates
+from .profiler import record_cache
+from .settings import get_settings
+
+logger = logging.getLogger("mkdocs.plugins.macros-utils.incremental")
+
+# Macros report failures as output starting with this prefix
+ERROR_PREFIX = "Error: "
+
+
+@dataclass
+class PageRecord:
+    """Macro results of a page"""
+
+    digest: str
+    results: Dict[Hashable, str] = field(default_factory=dict)
+
+
+class DependencyTracker:
+    """Tracks macro results per page across rebuilds"""
+
+    def __init__(self) -> None:
+        self.enabled = True
+        self.pages: Dict[str, PageRecord] = {}
+        self.reused_pages = 0
+        self.rendered_pages = 0
+        self._fingerprint: Optional[str] = None
+        self._current: Optional[PageRecord] = None
+        self._reusing = False
+        self._reusable = True
+
+    def start_build(self, fingerprint: str) -> None:
+        """
+        Start a build, forgetting all pages if the configuration changed
+
+        Args:
+            fingerprint (str): Fingerprint of the site configuration
+        """
+        if fingerprint != self._fingerprint:
+            self.pages.clear()
+            self._fingerprint = fingerprint
+        self.reused_pages = 0
+        self.rendered_pages = 0
+
+    def begin_page(self, src_path: str, digest: str) -> bool:
+        """
+        Start rendering a page
+
+        Args:
+            src_path (str): Page source path
+            digest (str): Hash of the page source
+
+        Returns:
+            bool: True if the previous macro results of the page are reused
+        """
+        record = self.pages.get(src_path)
+        self._reusing = record is not None and record.digest == digest
+        if record is None or not self._reusing:
+            record = self.pages[src_path] = PageRecord(digest)
+            self.rendered_pages += 1
+        else:
+            self.reused_pages += 1
+        self._current = record
+        return self._reusing
+
+    def end_page(self) -> None:
+        """Finish rendering the current page"""
+        self._current = None
+        self._reusing = False
+
+    def call(self, key: Hashable, render: Callable[[], str]) -> str:
+        """
+        Run a macro, or reuse its result from the previous build of the page
+
+        Args:
+            key (Hashable): Macro name and arguments
+            render (Callable[[], str]): Function running the macro
+
+        Returns:
+            str: Macro result
+        """
+        record = self._current
+        if record is None:
+            return render()
+        if self._reusing and key in record.results:
+            record_cache("incremental", True)
+            return record.results[key]
+        record_cache("incremental", False)
+
+        self._reusable = True
+        result = render()
+        if (
+            self._reusable
+            and isinstance(result, str)
+            and not result.startswith(ERROR_PREFIX)
+        ):
+            record.results[key] = result
+        return result
+
+    def mark_not_reusable(self) -> None:
+        """Keep the result of the running macro from being reused"""
+        self._reusable = False
+
+
+# Tracker shared by all rebuilds of the process
+_tracker = DependencyTracker()
+
+
+def get_tracker() -> DependencyTracker:
+    """Get the dependency tracker of the process"""
+    return _tracker
+
+
+def mark_not_reusable() -> None:
+    """
+    Render the running macro again on the next build of its page
+
+    Macros call this for degraded output, such as a card whose remote
+    resource failed to load, which must not be reused once the network is back.
+    """
+    _tracker.mark_not_reusable()
+
+
+def configure_tracker(env: MacrosPlugin) -> DependencyTracker:
+    """
+    Configure the tracker from `extra.macros_utils.incremental` for a build
+
+    Pages are forgotten when the site URL, the `extra` settings or the card
+    template overrides change, so card templates must be configured first.
+
+    Args:
+        env (MacrosPlugin): MkDocs macro environment
+
+    Returns:
+        DependencyTracker: Dependency tracker
+    """
+    _tracker.enabled = bool(get_settings(env, "incremental").get("enabled", True))
+    fingerprint = json.dumps(
+        {
+            "site_url": env.conf.get("site_url"),
+            "extra": env.variables.get("extra", {}),
+            "templates": get_templates().fingerprint,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    _tracker.start_build(hashlib.sha256(fingerprint.encode("utf-8")).hexdigest())
+    return _tracker
+
+
+def page_digest(env: MacrosPlugin) -> str:
+    """
+    Hash the Markdown source and metadata of the page being rendered
+
+    Args:
+        env (MacrosPlugin): MkDocs macro environment
+
+    Returns:
+        str: Page digest
+    """
+    meta = json.dumps(getattr(env.page, "meta", {}), sort_keys=True, default=str)
+    source = f"{meta}\n{env.markdown}"
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def begin_page(env: MacrosPlugin) -> None:
+    """Start tracking the page being rendered (on_pre_page_macros)"""
+    if not _tracker.enabled or env.page is None:
+        return
+    src_path = env.page.file.src_path
+    if _tracker.begin_page(src_path, page_digest(env)):
+        logger.debug(f"Reusing macro results of unchanged page: {src_path}")
+
+
+def end_page(env: MacrosPlugin) -> None:
+    """Stop tracking the page being rendered (on_post_page_macros)"""
+    _tracker.end_page()
+
+
+def track_macro(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Decorator reusing the results of a macro on unchanged pages
+
+    Args:
+        func (Callable[..., str]): Macro function
+
+    Returns:
+        Callable[..., str]: Wrapped macro function
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        key: Tuple[Any, ...] = (func.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+        return _tracker.call(key, lambda: func(*args, **kwargs))
+
+    return wrapper
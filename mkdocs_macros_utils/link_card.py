@@ -2,17 +2,48 @@
 MkDocs Macros Plugin for displaying custom link cards.
 """
 
-from typing import Optional
-from urllib.parse import urlparse
-import requests
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
 from mkdocs_macros.plugin import MacrosPlugin
 
 # Import debug logger
 from .debug_logger import DebugLogger
+from .cache import ResponseCache, get_response_cache
+from .card_templates import LINK_CARD_TEMPLATE, get_templates
+from .http_client import HttpRequestError, cached_get
+from .incremental import mark_not_reusable, track_macro
+from .profiler import profile_macro
+from .render_memo import config_fingerprint, get_render_memo
+from .settings import get_settings
+from .url_classifier import classify_url, match_domain
+from .url_classifier import clean_url as clean_url  # Public API of link_card
+
+
+ICONS_DIR = Path(__file__).parent / "static" / "icons"
+
+# Default domain to icon registry. Values are names of icons bundled in
+# static/icons, or Gist SVG paths in the form "user_id/gist_id/filename".
+DEFAULT_ICONS: Dict[str, str] = {
+    "github.com": "github",
+    "hatenablog.com": "7rikazhexde/1b1079ee3793f9223173347b0bc6ab3b/hatenablog-logotype.svg",
+}
+
+# Gist SVG contents fetched during the current build, keyed by SVG path
+_gist_icons: Dict[str, Optional[str]] = {}
+
+
+def get_gist_raw_url(user_id: str, gist_id: str, filename: str) -> str:
+    """Get the raw URL of a Gist file"""
+    return f"https://gist.githubusercontent.com/{user_id}/{gist_id}/raw/{filename}"
 
 
 def get_gist_content(
-    user_id: str, gist_id: str, filename: str, logger: DebugLogger
+    user_id: str,
+    gist_id: str,
+    filename: str,
+    logger: DebugLogger,
+    cache: Optional[ResponseCache] = None,
 ) -> Optional[str]:
     """
     Fetch content from a Gist
@@ -22,98 +53,152 @@ def get_gist_content(
         gist_id (str): Gist ID
         filename (str): Filename
         logger (DebugLogger): Debug logger
+        cache (Optional[ResponseCache], optional): Response cache. Defaults to None.
 
     Returns:
         Optional[str]: SVG content or None
+
+    Raises:
+        OfflineResourceError: If offline and the SVG is not in the lockfile
     """
-    logger.log(
-        f"Fetching Gist content: User={user_id}, ID={gist_id}, Filename={filename}"
+    logger.logf(
+        "Fetching Gist content: User=%s, ID=%s, Filename=%s", user_id, gist_id, filename
     )
     try:
-        url = f"https://gist.githubusercontent.com/{user_id}/{gist_id}/raw/{filename}"
-        response = requests.get(url)
-        if response.status_code == 200:
+        url = get_gist_raw_url(user_id, gist_id, filename)
+        result = cached_get(url, cache, logger)
+        if result.status_code == 200:
             logger.log("Gist content fetched successfully")
-            return response.text
-        logger.log(f"Failed to fetch Gist content. Status code: {response.status_code}")
+            return result.text
+        logger.logf("Failed to fetch Gist content. Status code: %s", result.status_code)
         return None
-    except Exception as e:
-        logger.log(f"Error fetching Gist content: {e}")
+    except HttpRequestError as e:
+        logger.logf("Error fetching Gist content: %s", e)
         return None
 
 
-def get_svg_content(url: str, logger: DebugLogger) -> Optional[str]:
+@lru_cache(maxsize=None)
+def load_bundled_icon(name: str) -> Optional[str]:
     """
-    Get appropriate SVG content based on URL
+    Load an icon bundled with the package
 
     Args:
-        url (str): Target URL
+        name (str): Icon name (file name in static/icons without extension)
+
+    Returns:
+        Optional[str]: SVG content or None
+    """
+    try:
+        return (ICONS_DIR / f"{name}.svg").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def get_icon_registry(env: Optional[MacrosPlugin]) -> Dict[str, str]:
+    """
+    Get the domain to icon registry
+
+    Entries in `extra.macros_utils.link_card.icons` override the defaults,
+    and an empty value disables the icon of a domain.
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+
+    Returns:
+        Dict[str, str]: Icon source by domain
+    """
+    icons = dict(DEFAULT_ICONS)
+    icons.update(get_settings(env, "link_card").get("icons") or {})
+    return {domain: source for domain, source in icons.items() if source}
+
+
+def get_icon_content(
+    source: str, logger: DebugLogger, cache: Optional[ResponseCache] = None
+) -> Optional[str]:
+    """
+    Get the SVG content of an icon source
+
+    Bundled icons are read once per process and Gist icons once per build.
+
+    Args:
+        source (str): Bundled icon name or "user_id/gist_id/filename"
         logger (DebugLogger): Debug logger
+        cache (Optional[ResponseCache], optional): Response cache. Defaults to None.
 
     Returns:
         Optional[str]: SVG content or None
     """
-    logger.log(f"Detecting SVG for URL: {url}")
-    if "github.com" in url:
-        logger.log("Using GitHub SVG")
-        return get_gist_content(
-            "7rikazhexde",
-            "d418315080179e7c1bd9a7a4366b81f6",
-            "github-cutom-icon.svg",
-            logger,
-        )
-    elif "hatenablog.com" in url:
-        logger.log("Using Hatena Blog SVG")
-        return get_gist_content(
-            "7rikazhexde",
-            "1b1079ee3793f9223173347b0bc6ab3b",
-            "hatenablog-logotype.svg",
-            logger,
+    if "/" not in source:
+        logger.logf("Using bundled icon: %s", source)
+        return load_bundled_icon(source)
+
+    if source not in _gist_icons:
+        parts = source.split("/")
+        if len(parts) != 3:
+            logger.logf("Error: Invalid icon source: %s", source)
+            return None
+        user_id, gist_id, filename = parts
+        _gist_icons[source] = get_gist_content(
+            user_id, gist_id, filename, logger, cache
         )
-    logger.log("No matching SVG found")
-    return None
+    return _gist_icons[source]
 
 
-def extract_domain_for_display(url: str) -> str:
+def find_icon_source(url: str, icons: Dict[str, str]) -> Optional[str]:
     """
-    Extract display domain portion from URL
+    Find the icon source registered for the host name of a URL
 
     Args:
-        url (str): Complete URL
+        url (str): Target URL
+        icons (Dict[str, str]): Domain to icon registry
 
     Returns:
-        str: Display domain portion
+        Optional[str]: Icon source or None
     """
-    parsed = urlparse(url)
-    if parsed.netloc:
-        if "github.com" in parsed.netloc:
-            return parsed.netloc
-        elif "hatenablog.com" in parsed.netloc:
-            return parsed.netloc
-        return parsed.netloc
-    return url
+    # Prefer the most specific domain, e.g. gist.github.com over github.com
+    return match_domain(classify_url(url).host, icons)
 
 
-def clean_url(url: str) -> str:
+def get_svg_content(
+    url: str,
+    logger: DebugLogger,
+    cache: Optional[ResponseCache] = None,
+    icons: Optional[Dict[str, str]] = None,
+) -> Optional[str]:
     """
-    Normalize URL (handle trailing slashes, multiple slashes, etc.)
+    Get appropriate SVG content based on URL
 
     Args:
-        url (str): Input URL
+        url (str): Target URL
+        logger (DebugLogger): Debug logger
+        cache (Optional[ResponseCache], optional): Response cache. Defaults to None.
+        icons (Optional[Dict[str, str]], optional): Domain to icon registry.
+            Defaults to DEFAULT_ICONS.
 
     Returns:
-        str: Normalized URL
+        Optional[str]: SVG content or None
+    """
+    logger.logf("Detecting SVG for URL: %s", url)
+    source = find_icon_source(url, DEFAULT_ICONS if icons is None else icons)
+    if source:
+        logger.logf("Using SVG: %s", source)
+        return get_icon_content(source, logger, cache)
+
+    logger.log("No matching SVG found")
+    return None
+
+
+def extract_domain_for_display(url: str) -> str:
     """
-    # Split the URL into scheme and the rest
-    parts = url.split("://", 1)
+    Extract display domain portion from URL
 
-    if len(parts) > 1:
-        scheme, rest = parts[0], parts[1]
-        # Remove trailing slash and consolidate multiple slashes
-        cleaned_rest = "/".join(filter(bool, rest.split("/")))
-        return f"{scheme}://{cleaned_rest}"
+    Args:
+        url (str): Complete URL
 
-    return url
+    Returns:
+        str: Display domain portion
+    """
+    return classify_url(url).netloc or url
 
 
 def create_link_card(
@@ -125,6 +210,7 @@ def create_link_card(
     external: bool = False,
     svg_path: Optional[str] = None,
     env: Optional[MacrosPlugin] = None,
+    logger: Optional[DebugLogger] = None,
 ) -> str:
     """
     Create a link card
@@ -138,19 +224,30 @@ def create_link_card(
         external (bool, optional): External link flag. Defaults to False.
         svg_path (Optional[str], optional): Custom SVG path in format "user_id/gist_id/filename". Defaults to None.
         env (Optional[MacrosPlugin], optional): MkDocs macro environment. Defaults to None.
+        logger (Optional[DebugLogger], optional): Debug logger. Created from env if not specified.
 
     Returns:
         str: Rendered link card HTML
     """
-    logger = DebugLogger.create_logger("link_card", env)
-    logger.log("Creating link card", {"url": url, "title": title})
+    logger = logger or DebugLogger.create_logger("link_card", env)
+    logger.log("Creating link card", lambda: {"url": url, "title": title})
 
     if not title:
         logger.log("Error: Title is required")
         raise ValueError("`title` is required for creating a link card.")
 
-    # Normalize URL
-    clean_target_url = clean_url(url)
+    # Reuse the card if it was already rendered with the same configuration
+    memo = get_render_memo("link_card", env)
+    memo_key = (url, title, description, image_path, domain, external, svg_path)
+    fingerprint = config_fingerprint(env, "link_card", logger.enabled)
+    if memo:
+        html = memo.get(memo_key, fingerprint)
+        if html is not None:
+            logger.log("Reusing rendered link card")
+            return html
+
+    # Normalize URL (classification is memoized per URL)
+    clean_target_url = classify_url(url).normalized_url
 
     # Determine display domain
     display_domain = domain or extract_domain_for_display(url)
@@ -177,32 +274,32 @@ def create_link_card(
         else:
             final_image_path = f"{base_url.rstrip('/')}/{default_image}"
 
-        logger.log(f"Image path: {final_image_path}")
+        logger.logf("Image path: %s", final_image_path)
 
     # Get and process SVG content
+    cache = get_response_cache(env)
     svg_content = None
+    icon_expected = bool(svg_path)
     if svg_path:
-        logger.log(f"Using custom SVG path: {svg_path}")
+        logger.logf("Using custom SVG path: %s", svg_path)
         parts = svg_path.split("/")  # 形式: "user_id/gist_id/filename"
         if len(parts) != 3:
             logger.log(
                 "Error: Invalid SVG path format. Expected: user_id/gist_id/filename"
             )
-            error_html = f'''
-<div class="custom-link-card" onclick="window.location='{clean_target_url}'" role="link" tabindex="0">
-    <div class="custom-link-card-content">
-        <div class="custom-link-card-title" aria-label="{title}">{title}</div>
-        <div class="custom-link-card-description">Error: Invalid SVG path format</div>
-        <a href="{clean_target_url}" class="custom-link-card-domain">{display_domain}</a>
-    </div>
-</div>
-'''
-            return error_html
+            return get_templates().render(
+                LINK_CARD_TEMPLATE,
+                url=clean_target_url,
+                title=title,
+                description="Error: Invalid SVG path format",
+                domain=display_domain,
+            )
 
-        user_id, gist_id, filename = parts
-        svg_content = get_gist_content(user_id, gist_id, filename, logger)
+        svg_content = get_icon_content(svg_path, logger, cache)
     else:
-        svg_content = get_svg_content(clean_target_url, logger)
+        icons = get_icon_registry(env)
+        icon_expected = find_icon_source(clean_target_url, icons) is not None
+        svg_content = get_svg_content(clean_target_url, logger, cache, icons)
 
     svg_html = ""
     if svg_content:
@@ -214,33 +311,24 @@ def create_link_card(
         )
 
     # Generate HTML
-    html = f'''
-<div class="custom-link-card" onclick="window.location='{
-        clean_target_url
-    }'" role="link" tabindex="0">
-    <div class="custom-link-card-content">
-        <div class="custom-link-card-title" aria-label="{title}">{title}</div>
-        <div class="custom-link-card-description">{description}</div>
-        <a href="{clean_target_url}" class="custom-link-card-domain">{
-        display_domain
-    }</a>
-    </div>
-    {
-        "<div class='custom-link-card-image'>" + svg_html + "</div>"
-        if svg_html
-        else "<img src='"
-        + final_image_path
-        + "' alt='"
-        + title
-        + "' class='custom-link-card-image'>"
-        if final_image_path
-        else ""
-    }
-</div>
-'''
+    html = get_templates().render(
+        LINK_CARD_TEMPLATE,
+        url=clean_target_url,
+        title=title,
+        description=description,
+        domain=display_domain,
+        svg=svg_html,
+        image=final_image_path,
+    )
 
     logger.log("Link card created successfully")
     logger.log(html)
+
+    # Cards missing their icon are rendered again once it can be fetched
+    if icon_expected and not svg_content:
+        mark_not_reusable()
+    elif memo:
+        memo.set(memo_key, fingerprint, html)
     return html
 
 
@@ -251,8 +339,13 @@ def define_env(env: MacrosPlugin) -> None:
     Args:
         env (MacrosPlugin): Macro plugin environment
     """
+    # Fetch Gist icons again on each build
+    _gist_icons.clear()
+    logger = DebugLogger.create_logger("link_card", env)
 
     @env.macro
+    @profile_macro
+    @track_macro
     def link_card(
         url: str,
         title: str,
@@ -286,4 +379,5 @@ def define_env(env: MacrosPlugin) -> None:
             external=external,
             svg_path=svg_path,
             env=env,
+            logger=logger,
         )
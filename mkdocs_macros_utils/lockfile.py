@@ -0,0 +1,319 @@
+"""
+MkDocs Macros Utils lockfile of remote content for offline builds
+
+Run `python -m mkdocs_macros_utils.lockfile refresh` to build the site once
+with network access and record every remote resource used by the macros.
+Builds with `extra.macros_utils.offline.enabled` then read those resources
+from the lockfile and never touch the network.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+import argparse
+import hashlib
+import json
+import logging
+import tempfile
+import threading
+from mkdocs_macros.plugin import MacrosPlugin
+
+from .settings import get_config_file_path, get_settings, resolve_path
+
+logger = logging.getLogger("mkdocs.plugins.macros-utils.lockfile")
+
+LOCKFILE_VERSION = 1
+DEFAULT_LOCKFILE = "macros-utils.lock.json"
+DEFAULT_BLOB_DIR = "macros-utils-blobs"
+
+MODE_OFFLINE = "offline"
+MODE_RECORD = "record"
+
+# Lock used by all macros of the current build
+_active_lock: Optional["RemoteLock"] = None
+
+
+class OfflineResourceError(Exception):
+    """Raised when an offline build needs a resource missing from the lockfile"""
+
+
+class RemoteLock:
+    """
+    Lockfile mapping remote URLs to content-addressed blobs
+
+    The lockfile maps each URL to the SHA-256 of its content, and the content
+    itself is stored in `blob_dir` under that hash. Content cut short by a
+    download size limit is marked as truncated.
+    """
+
+    def __init__(
+        self, lock_path: Path, blob_dir: Path, mode: str = MODE_OFFLINE
+    ) -> None:
+        """
+        Initialize the lock
+
+        Args:
+            lock_path (Path): Lockfile path
+            blob_dir (Path): Directory of content blobs
+            mode (str, optional): "offline" to serve from the lockfile, or
+                "record" to record fetched resources. Defaults to "offline".
+        """
+        self.lock_path = Path(lock_path)
+        self.blob_dir = Path(blob_dir)
+        self.mode = mode
+        self.resources: Dict[str, str] = {}
+        # URLs whose locked content was cut short by a size limit
+        self.truncated: Set[str] = set()
+        self._recorded: Dict[str, Tuple[str, bool]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def offline(self) -> bool:
+        """Return True if resources must be served from the lockfile"""
+        return self.mode == MODE_OFFLINE
+
+    def load(self) -> "RemoteLock":
+        """
+        Load the lockfile if it exists
+
+        Returns:
+            RemoteLock: This lock
+        """
+        if not self.lock_path.exists():
+            return self
+
+        data = json.loads(self.lock_path.read_text(encoding="utf-8"))
+        resources = data.get("resources", {})
+        self.resources = {url: entry["sha256"] for url, entry in resources.items()}
+        self.truncated = {
+            url for url, entry in resources.items() if entry.get("truncated", False)
+        }
+        return self
+
+    def lookup(self, url: str) -> str:
+        """
+        Get the locked content of a URL
+
+        Args:
+            url (str): Remote URL
+
+        Returns:
+            str: Locked content
+
+        Raises:
+            OfflineResourceError: If the URL or its blob is missing
+        """
+        digest = self.resources.get(url)
+        if digest is None:
+            message = f"Remote resource not in lockfile: {url}"
+            logger.error(message)
+            raise OfflineResourceError(message)
+
+        blob_path = self.blob_dir / digest
+        try:
+            body = blob_path.read_text(encoding="utf-8")
+        except OSError:
+            message = f"Locked content missing for {url}: {blob_path}"
+            logger.error(message)
+            raise OfflineResourceError(message)
+
+        if hashlib.sha256(body.encode("utf-8")).hexdigest() != digest:
+            message = f"Locked content does not match its hash for {url}"
+            logger.error(message)
+            raise OfflineResourceError(message)
+        return body
+
+    def is_truncated(self, url: str) -> bool:
+        """
+        Return True if the locked content of a URL was cut short by a size limit
+
+        Args:
+            url (str): Remote URL
+
+        Returns:
+            bool: Whether the locked content is truncated
+        """
+        return url in self.truncated
+
+    def record(self, url: str, body: str, truncated: bool = False) -> None:
+        """
+        Record the content of a URL (record mode only)
+
+        Args:
+            url (str): Remote URL
+            body (str): Content
+            truncated (bool, optional): Whether the content was cut short by a
+                size limit. Defaults to False.
+        """
+        if self.mode != MODE_RECORD:
+            return
+        with self._lock:
+            self._recorded[url] = (body, truncated)
+
+    def save(self) -> int:
+        """
+        Write the recorded resources to the lockfile and blob directory
+
+        Blobs no longer referenced by the lockfile are removed.
+
+        Returns:
+            int: Number of locked resources
+        """
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+
+        resources: Dict[str, Dict[str, Any]] = {}
+        digests: Set[str] = set()
+        for url in sorted(self._recorded):
+            body, truncated = self._recorded[url]
+            digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+            (self.blob_dir / digest).write_text(body, encoding="utf-8")
+            resources[url] = {"sha256": digest}
+            if truncated:
+                resources[url]["truncated"] = True
+            digests.add(digest)
+
+        for blob_path in self.blob_dir.iterdir():
+            if blob_path.is_file() and blob_path.name not in digests:
+                blob_path.unlink()
+
+        self.lock_path.write_text(
+            json.dumps(
+                {"version": LOCKFILE_VERSION, "resources": resources},
+                indent=2,
+                ensure_ascii=False,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        self.resources = {url: entry["sha256"] for url, entry in resources.items()}
+        self.truncated = {
+            url for url, entry in resources.items() if "truncated" in entry
+        }
+        return len(resources)
+
+
+def get_active_lock() -> Optional[RemoteLock]:
+    """Get the lock used by the current build, if any"""
+    return _active_lock
+
+
+def set_active_lock(lock: Optional[RemoteLock]) -> None:
+    """Set the lock used by the current build"""
+    global _active_lock
+    _active_lock = lock
+
+
+def configure_lock(env: Optional[MacrosPlugin]) -> Optional[RemoteLock]:
+    """
+    Activate the offline lock configured in `extra.macros_utils.offline`
+
+    A lock in record mode (set by the refresh command) is kept as is.
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+
+    Returns:
+        Optional[RemoteLock]: Active lock, or None if offline mode is disabled
+    """
+    if _active_lock is not None and _active_lock.mode == MODE_RECORD:
+        return _active_lock
+
+    offline_config = get_settings(env, "offline")
+    if not offline_config.get("enabled", False):
+        set_active_lock(None)
+        return None
+
+    config_file_path = get_config_file_path(env)
+    lock = RemoteLock(
+        resolve_path(
+            offline_config.get("lockfile", DEFAULT_LOCKFILE), config_file_path
+        ),
+        resolve_path(
+            offline_config.get("blob_dir", DEFAULT_BLOB_DIR), config_file_path
+        ),
+    ).load()
+    set_active_lock(lock)
+    logger.info(f"Offline mode: {len(lock.resources)} locked remote resources")
+    return lock
+
+
+def refresh(
+    config_file: Optional[str] = None,
+    lock_path: Optional[str] = None,
+    blob_dir: Optional[str] = None,
+) -> int:
+    """
+    Build the site once and record every remote resource into the lockfile
+
+    Paths default to `extra.macros_utils.offline` settings of the site, which
+    are relative to its mkdocs.yml.
+
+    Args:
+        config_file (Optional[str], optional): mkdocs.yml path. Defaults to None.
+        lock_path (Optional[str], optional): Lockfile path. Defaults to None.
+        blob_dir (Optional[str], optional): Blob directory. Defaults to None.
+
+    Returns:
+        int: Number of locked resources
+    """
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config
+
+    with tempfile.TemporaryDirectory() as site_dir:
+        config = load_config(config_file=config_file, site_dir=site_dir)
+        offline_config = (config["extra"].get("macros_utils") or {}).get(
+            "offline"
+        ) or {}
+        config_file_path = config["config_file_path"]
+        lock = RemoteLock(
+            Path(lock_path)
+            if lock_path
+            else resolve_path(
+                offline_config.get("lockfile", DEFAULT_LOCKFILE), config_file_path
+            ),
+            Path(blob_dir)
+            if blob_dir
+            else resolve_path(
+                offline_config.get("blob_dir", DEFAULT_BLOB_DIR), config_file_path
+            ),
+            mode=MODE_RECORD,
+        )
+
+        set_active_lock(lock)
+        try:
+            config.plugins.on_startup(command="build", dirty=False)
+            try:
+                build(config)
+            finally:
+                config.plugins.on_shutdown()
+        finally:
+            set_active_lock(None)
+
+    count = lock.save()
+    logger.info(f"Locked {count} remote resources in {lock.lock_path}")
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Manage the lockfile of remote content used by mkdocs-macros-utils."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    refresh_parser = subparsers.add_parser(
+        "refresh", help="Build the site and record all remote resources"
+    )
+    refresh_parser.add_argument(
+        "-f", "--config-file", default=None, help="Path to mkdocs.yml"
+    )
+    refresh_parser.add_argument("--lockfile", default=None, help="Lockfile path")
+    refresh_parser.add_argument(
+        "--blob-dir", default=None, help="Directory of content blobs"
+    )
+    args = parser.parse_args()
+
+    if args.command == "refresh":
+        count = refresh(args.config_file, args.lockfile, args.blob_dir)
+        print(f"Locked {count} remote resources")
+
+
+if __name__ == "__main__":
+    main()
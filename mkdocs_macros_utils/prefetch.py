@@ -0,0 +1,164 @@
+"""
+MkDocs Macros Utils prefetch of remote resources used by macros
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+import logging
+import re
+from mkdocs_macros.plugin import MacrosPlugin
+
+from .cache import ResponseCache, get_response_cache
+from .debug_logger import DebugLogger
+from .gist_codeblock import GistProcessor, create_processor
+from .link_card import get_gist_content
+from .settings import get_settings
+
+logger = logging.getLogger("mkdocs.plugins.macros-utils.prefetch")
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_HOST_RATE_LIMIT = 0.0
+
+# Prefetch backends
+BACKEND_THREADS = "threads"
+BACKEND_ASYNC = "async"
+
+# Jinja raw blocks are not rendered, so macros inside them are skipped
+RAW_BLOCK_PATTERN = re.compile(
+    r"\{%-?\s*raw\s*-?%\}.*?\{%-?\s*endraw\s*-?%\}", re.DOTALL
+)
+# Jinja expressions, e.g. {{ gist_codeblock("...") }}
+JINJA_EXPRESSION_PATTERN = re.compile(r"\{\{(.*?)\}\}", re.DOTALL)
+GIST_CODEBLOCK_PATTERN = re.compile(
+    r"\bgist_codeblock\(\s*(?:gist_url\s*=\s*)?[\"']([^\"']+)[\"']"
+)
+LINK_CARD_PATTERN = re.compile(r"\blink_card\(")
+SVG_PATH_PATTERN = re.compile(r"\bsvg_path\s*=\s*[\"']([^\"']+)[\"']")
+
+
+def extract_remote_targets(markdown: str) -> Tuple[Set[str], Set[str]]:
+    """
+    Extract remote resources referenced by macros in a Markdown source
+
+    Args:
+        markdown (str): Markdown source
+
+    Returns:
+        Tuple[Set[str], Set[str]]: Gist URLs and link card SVG paths
+    """
+    gist_urls: Set[str] = set()
+    svg_paths: Set[str] = set()
+
+    markdown = RAW_BLOCK_PATTERN.sub("", markdown)
+    for expression in JINJA_EXPRESSION_PATTERN.findall(markdown):
+        gist_urls.update(GIST_CODEBLOCK_PATTERN.findall(expression))
+        if LINK_CARD_PATTERN.search(expression):
+            svg_paths.update(SVG_PATH_PATTERN.findall(expression))
+
+    return gist_urls, svg_paths
+
+
+def collect_remote_targets(docs_dir: Path) -> Tuple[List[str], List[str]]:
+    """
+    Collect remote resources referenced by macros across all pages
+
+    Args:
+        docs_dir (Path): Documentation directory
+
+    Returns:
+        Tuple[List[str], List[str]]: Sorted Gist URLs and link card SVG paths
+    """
+    gist_urls: Set[str] = set()
+    svg_paths: Set[str] = set()
+
+    for page in docs_dir.rglob("*.md"):
+        try:
+            markdown = page.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Skipping unreadable page {page}: {e}")
+            continue
+        page_gists, page_svgs = extract_remote_targets(markdown)
+        gist_urls.update(page_gists)
+        svg_paths.update(page_svgs)
+
+    return sorted(gist_urls), sorted(svg_paths)
+
+
+def _prefetch_gist(processor: GistProcessor, gist_url: str) -> None:
+    """Resolve a Gist URL and fetch the content of its files into the cache"""
+    files, error = processor.get_gist_files(gist_url)
+    if error:
+        logger.warning(f"Failed to prefetch Gist {gist_url}: {error}")
+        return
+    for gist_file in files:
+        _, error = processor.fetch_gist_content(gist_file.raw_url)
+        if error:
+            logger.warning(f"Failed to prefetch Gist {gist_url}: {error}")
+
+
+def _prefetch_svg(svg_path: str, cache: ResponseCache, debug: DebugLogger) -> None:
+    """Fetch a link card SVG into the cache"""
+    parts = svg_path.split("/")
+    if len(parts) != 3:
+        return
+    user_id, gist_id, filename = parts
+    if get_gist_content(user_id, gist_id, filename, debug, cache) is None:
+        logger.warning(f"Failed to prefetch SVG {svg_path}")
+
+
+def prefetch_remote_resources(env: MacrosPlugin) -> int:
+    """
+    Resolve every remote resource used by the macros concurrently
+
+    Scans all pages for `gist_codeblock(...)` and `link_card(..., svg_path=...)`
+    calls and fetches them into the shared response cache, so the macros only
+    read from memory at render time. Resources are fetched with a bounded
+    thread pool, or scheduled from an event loop with the "async" backend.
+
+    Args:
+        env (MacrosPlugin): MkDocs macro environment
+
+    Returns:
+        int: Number of remote resources prefetched
+    """
+    prefetch_config = get_settings(env, "prefetch")
+    cache: Optional[ResponseCache] = get_response_cache(env)
+    if not prefetch_config.get("enabled", False) or cache is None:
+        return 0
+
+    gist_urls, svg_paths = collect_remote_targets(Path(env.conf["docs_dir"]))
+    max_workers = int(prefetch_config.get("max_workers", DEFAULT_MAX_WORKERS))
+
+    processor = create_processor(env)
+    svg_logger = DebugLogger.create_logger("link_card", env)
+    if prefetch_config.get("backend", BACKEND_THREADS) == BACKEND_ASYNC:
+        # asyncio is imported only when the async backend is used
+        from .async_backend import prefetch_async
+
+        total = prefetch_async(
+            processor,
+            gist_urls,
+            svg_paths,
+            svg_logger,
+            int(prefetch_config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)),
+            float(prefetch_config.get("host_rate_limit", DEFAULT_HOST_RATE_LIMIT)),
+        )
+        logger.info(f"Prefetched {total} remote resources with the async backend")
+        return total
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_prefetch_gist, processor, url) for url in gist_urls]
+        futures += [
+            pool.submit(_prefetch_svg, path, cache, svg_logger) for path in svg_paths
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Prefetch failed: {e}")
+
+    total = len(gist_urls) + len(svg_paths)
+    logger.info(f"Prefetched {total} remote resources")
+    return total
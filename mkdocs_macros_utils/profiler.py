@@ -0,0 +1,369 @@
+"""
+MkDocs Macros Utils build-time profiling of macros
+
+When `extra.macros_utils.profile.enabled` is set, every macro call is timed
+and split into network, parse and render phases. Cache hits, per-page macro
+time and the slowest pages are collected, and a JSON and Markdown report is
+written at the end of the build.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import json
+import logging
+import threading
+import time
+from mkdocs_macros.plugin import MacrosPlugin
+
+from .settings import get_config_file_path, get_settings, resolve_path
+
+logger = logging.getLogger("mkdocs.plugins.macros-utils.profiler")
+
+DEFAULT_REPORT = "macros-utils-profile"
+DEFAULT_SLOWEST_PAGES = 10
+
+PHASE_NETWORK = "network"
+PHASE_PARSE = "parse"
+
+
+def _ms(seconds: float) -> float:
+    """Convert seconds to milliseconds rounded for reports"""
+    return round(seconds * 1000, 3)
+
+
+def _ratio(hits: int, misses: int) -> Optional[float]:
+    """Get a hit ratio, or None without lookups"""
+    total = hits + misses
+    return round(hits / total, 3) if total else None
+
+
+@dataclass
+class MacroStats:
+    """Timing and cache statistics of a macro"""
+
+    calls: int = 0
+    total: float = 0.0
+    network: float = 0.0
+    parse: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the statistics for the report"""
+        return {
+            "calls": self.calls,
+            "total_ms": _ms(self.total),
+            "network_ms": _ms(self.network),
+            "parse_ms": _ms(self.parse),
+            "render_ms": _ms(max(self.total - self.network - self.parse, 0.0)),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": _ratio(self.cache_hits, self.cache_misses),
+        }
+
+
+@dataclass
+class PageStats:
+    """Macro time spent on a page"""
+
+    calls: int = 0
+    total: float = 0.0
+    macros: Dict[str, float] = field(default_factory=dict)
+
+
+class MacroProfiler:
+    """Collects macro statistics for one build"""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.report_path = Path(DEFAULT_REPORT)
+        self.slowest_pages = DEFAULT_SLOWEST_PAGES
+        self.macros: Dict[str, MacroStats] = {}
+        self.pages: Dict[str, PageStats] = {}
+        self.caches: Dict[str, List[int]] = {}
+        self.current_page: Optional[str] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> List[MacroStats]:
+        """Get the macros being run by the current thread"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def reset(self) -> None:
+        """Forget all statistics"""
+        self.macros.clear()
+        self.pages.clear()
+        self.caches.clear()
+        self.current_page = None
+
+    def run(self, name: str, func: Callable[[], str]) -> str:
+        """
+        Run a macro and record its time
+
+        Args:
+            name (str): Macro name
+            func (Callable[[], str]): Function running the macro
+
+        Returns:
+            str: Macro result
+        """
+        stats = self.macros.setdefault(name, MacroStats())
+        stack = self._stack()
+        stack.append(stats)
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            stats.calls += 1
+            stats.total += elapsed
+            if self.current_page is not None:
+                page = self.pages.setdefault(self.current_page, PageStats())
+                page.calls += 1
+                page.total += elapsed
+                page.macros[name] = page.macros.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a network or parse phase of the running macro
+
+        Args:
+            name (str): PHASE_NETWORK or PHASE_PARSE
+        """
+        stack = self._stack() if self.enabled else None
+        if not stack:
+            yield
+            return
+
+        stats = stack[-1]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            setattr(stats, name, getattr(stats, name) + elapsed)
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """
+        Record a cache lookup of the running macro
+
+        Args:
+            cache (str): Cache name
+            hit (bool): True on a cache hit
+        """
+        if not self.enabled:
+            return
+        stack = self._stack()
+        if not stack:
+            return
+
+        stats = stack[-1]
+        with self._lock:
+            counts = self.caches.setdefault(cache, [0, 0])
+            counts[0 if hit else 1] += 1
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the profile report
+
+        Returns:
+            Dict[str, Any]: Macro, cache and slowest page statistics
+        """
+        slowest = sorted(self.pages.items(), key=lambda item: -item[1].total)
+        return {
+            "macros": {
+                name: stats.to_dict() for name, stats in sorted(self.macros.items())
+            },
+            "caches": {
+                name: {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_ratio": _ratio(hits, misses),
+                }
+                for name, (hits, misses) in sorted(self.caches.items())
+            },
+            "slowest_pages": [
+                {
+                    "page": src_path,
+                    "calls": page.calls,
+                    "total_ms": _ms(page.total),
+                    "macros_ms": {
+                        name: _ms(elapsed)
+                        for name, elapsed in sorted(page.macros.items())
+                    },
+                }
+                for src_path, page in slowest[: self.slowest_pages]
+            ],
+        }
+
+    def write_report(self) -> Path:
+        """
+        Write the report as JSON and Markdown files
+
+        Returns:
+            Path: Path of the Markdown report
+        """
+        report = self.report()
+        json_path = self.report_path.with_suffix(".json")
+        markdown_path = self.report_path.with_suffix(".md")
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        markdown_path.write_text(render_markdown(report), encoding="utf-8")
+        return markdown_path
+
+
+def render_markdown(report: Dict[str, Any]) -> str:
+    """
+    Render the profile report as Markdown tables
+
+    Args:
+        report (Dict[str, Any]): Report built by MacroProfiler.report
+
+    Returns:
+        str: Markdown report
+    """
+
+    def ratio(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.1%}"
+
+    lines = [
+        "# Macro profile",
+        "",
+        "| Macro | Calls | Total (ms) | Network (ms) | Parse (ms) | Render (ms) "
+        "| Cache hit ratio |",
+        "| --- | ---: | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    for name, stats in report["macros"].items():
+        lines.append(
+            f"| {name} | {stats['calls']} | {stats['total_ms']:.1f} "
+            f"| {stats['network_ms']:.1f} | {stats['parse_ms']:.1f} "
+            f"| {stats['render_ms']:.1f} | {ratio(stats['cache_hit_ratio'])} |"
+        )
+
+    lines += [
+        "",
+        "## Caches",
+        "",
+        "| Cache | Hits | Misses | Hit ratio |",
+        "| --- | ---: | ---: | ---: |",
+    ]
+    for name, stats in report["caches"].items():
+        lines.append(
+            f"| {name} | {stats['hits']} | {stats['misses']} "
+            f"| {ratio(stats['hit_ratio'])} |"
+        )
+
+    lines += [
+        "",
+        "## Slowest pages",
+        "",
+        "| Page | Calls | Macro time (ms) |",
+        "| --- | ---: | ---: |",
+    ]
+    for page in report["slowest_pages"]:
+        lines.append(f"| {page['page']} | {page['calls']} | {page['total_ms']:.1f} |")
+
+    return "\n".join(lines) + "\n"
+
+
+# Profiler of the current build
+_profiler = MacroProfiler()
+
+
+def get_profiler() -> MacroProfiler:
+    """Get the profiler of the current build"""
+    return _profiler
+
+
+def configure_profiler(env: Optional[MacrosPlugin]) -> MacroProfiler:
+    """
+    Configure the profiler from `extra.macros_utils.profile` for a build
+
+    The report path is relative to mkdocs.yml.
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+
+    Returns:
+        MacroProfiler: Profiler
+    """
+    profile_config = get_settings(env, "profile")
+    _profiler.enabled = bool(profile_config.get("enabled", False))
+    _profiler.report_path = resolve_path(
+        profile_config.get("report", DEFAULT_REPORT), get_config_file_path(env)
+    )
+    _profiler.slowest_pages = int(
+        profile_config.get("slowest_pages", DEFAULT_SLOWEST_PAGES)
+    )
+    _profiler.reset()
+    return _profiler
+
+
+def phase(name: str) -> Any:
+    """Time a network or parse phase of the running macro"""
+    return _profiler.phase(name)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Record a cache lookup of the running macro"""
+    _profiler.record_cache(cache, hit)
+
+
+def begin_page(env: MacrosPlugin) -> None:
+    """Attribute macro time to the page being rendered (on_pre_page_macros)"""
+    if _profiler.enabled and env.page is not None:
+        _profiler.current_page = env.page.file.src_path
+
+
+def end_page(env: MacrosPlugin) -> None:
+    """Stop attributing macro time to a page (on_post_page_macros)"""
+    _profiler.current_page = None
+
+
+def write_report(env: MacrosPlugin) -> Optional[Path]:
+    """
+    Write the profile report at the end of the build (on_post_build)
+
+    Args:
+        env (MacrosPlugin): MkDocs macro environment
+
+    Returns:
+        Optional[Path]: Path of the Markdown report, or None if disabled
+    """
+    if not _profiler.enabled:
+        return None
+    path = _profiler.write_report()
+    logger.info(f"Macro profile written to {path}")
+    return path
+
+
+def profile_macro(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Decorator timing a macro when profiling is enabled
+
+    Args:
+        func (Callable[..., str]): Macro function
+
+    Returns:
+        Callable[..., str]: Wrapped macro function
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        if not _profiler.enabled:
+            return func(*args, **kwargs)
+        return _profiler.run(func.__name__, lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,142 @@
+"""
+MkDocs Macros Utils memo of rendered macro output
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import json
+import threading
+from mkdocs_macros.plugin import MacrosPlugin
+
+from .card_templates import get_templates
+from .profiler import record_cache
+from .settings import get_settings
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Memos shared by all pages and rebuilds, keyed by macro name
+_memos: Dict[str, "RenderMemo"] = {}
+
+
+class RenderMemo:
+    """
+    LRU memo of rendered macro output
+
+    Entries are keyed by the macro arguments. All entries are dropped when the
+    configuration fingerprint given with a lookup differs from the previous one,
+    so changing mkdocs.yml during `mkdocs serve` re-renders every card.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize the memo
+
+        Args:
+            max_entries (int, optional): Maximum number of entries. Defaults to 1024.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._fingerprint: Optional[Hashable] = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of memoized entries"""
+        return len(self._entries)
+
+    def _check_fingerprint(self, fingerprint: Hashable) -> None:
+        """Drop all entries if the configuration changed (lock must be held)"""
+        if fingerprint != self._fingerprint:
+            self._entries.clear()
+            self._fingerprint = fingerprint
+
+    def get(self, key: Hashable, fingerprint: Hashable) -> Optional[str]:
+        """
+        Get rendered output
+
+        Args:
+            key (Hashable): Macro arguments
+            fingerprint (Hashable): Configuration the output depends on
+
+        Returns:
+            Optional[str]: Rendered output, or None if not memoized
+        """
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+            output = self._entries.get(key)
+            if output is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        record_cache("render_memo", output is not None)
+        return output
+
+    def set(self, key: Hashable, fingerprint: Hashable, output: str) -> None:
+        """
+        Store rendered output, evicting the least recently used entries
+
+        Args:
+            key (Hashable): Macro arguments
+            fingerprint (Hashable): Configuration the output depends on
+            output (str): Rendered output
+        """
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+            self._entries[key] = output
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._fingerprint = None
+
+
+def get_render_memo(name: str, env: Optional[MacrosPlugin]) -> Optional[RenderMemo]:
+    """
+    Get the memo of a macro configured in `extra.macros_utils.render_memo`
+
+    Args:
+        name (str): Macro name
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+
+    Returns:
+        Optional[RenderMemo]: Memo, or None if memoization is disabled
+    """
+    memo_config = get_settings(env, "render_memo")
+    if not memo_config.get("enabled", True):
+        return None
+
+    max_entries = int(memo_config.get("max_entries", DEFAULT_MAX_ENTRIES))
+    memo = _memos.get(name)
+    if memo is None:
+        memo = _memos[name] = RenderMemo(max_entries)
+    memo.max_entries = max_entries
+    return memo
+
+
+def config_fingerprint(
+    env: Optional[MacrosPlugin], section: str, debug: bool
+) -> Tuple[str, bool, str, Hashable]:
+    """
+    Get the configuration rendered output of a macro depends on
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+        section (str): Settings section of the macro in `extra.macros_utils`
+        debug (bool): Debug logging flag of the macro
+
+    Returns:
+        Tuple[str, bool, str, Hashable]: Site URL, debug flag, macro settings
+            and overridden card templates
+    """
+    site_url = ""
+    if env and hasattr(env, "conf"):
+        site_url = env.conf.get("site_url", "") or ""
+    settings = json.dumps(get_settings(env, section), sort_keys=True, default=str)
+    return site_url, debug, settings, get_templates().fingerprint
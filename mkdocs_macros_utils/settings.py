@@ -0,0 +1,69 @@
+"""
+MkDocs Macros Utils settings helpers
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+from mkdocs_macros.plugin import MacrosPlugin
+
+# Key under `extra` holding all macros-utils settings
+SETTINGS_KEY = "macros_utils"
+
+
+def get_settings(env: Optional[MacrosPlugin], section: str) -> Dict[str, Any]:
+    """
+    Get a settings section from `extra.macros_utils`
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+        section (str): Section name (e.g. "cache")
+
+    Returns:
+        Dict[str, Any]: Section settings, empty if not configured
+    """
+    if not env:
+        return {}
+
+    settings = env.variables.get("extra", {}).get(SETTINGS_KEY) or {}
+    section_settings = settings.get(section) or {}
+
+    if not isinstance(section_settings, dict):
+        return {}
+    return section_settings
+
+
+def get_config_file_path(env: Optional[MacrosPlugin]) -> Optional[str]:
+    """
+    Get the path of the site's mkdocs.yml
+
+    Args:
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+
+    Returns:
+        Optional[str]: Config file path, or None if unknown
+    """
+    if not env:
+        return None
+    config_file_path = env.conf.get("config_file_path")
+    return str(config_file_path) if config_file_path else None
+
+
+def resolve_path(path: str, config_file_path: Optional[str] = None) -> Path:
+    """
+    Resolve a path setting relative to the directory of mkdocs.yml
+
+    Like MkDocs does for its own paths, so `mkdocs build -f sub/mkdocs.yml`
+    finds the same files from any working directory.
+
+    Args:
+        path (str): Path as written in the settings
+        config_file_path (Optional[str], optional): mkdocs.yml path.
+            Defaults to None (relative to the working directory).
+
+    Returns:
+        Path: Resolved path
+    """
+    resolved = Path(path)
+    if resolved.is_absolute() or not config_file_path:
+        return resolved
+    return Path(config_file_path).parent / resolved
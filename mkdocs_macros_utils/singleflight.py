@@ -0,0 +1,69 @@
+"""
+MkDocs Macros Utils coalescing of concurrent calls for the same key
+"""
+
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+import threading
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """Call in flight and its outcome"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """
+    Runs a function once per key among concurrent callers
+
+    The first caller of a key runs the function, and callers asking for the
+    same key while it is running wait for it and share its result (or
+    exception). Once the call finishes the key is forgotten, so later calls
+    run the function again.
+    """
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._calls: Dict[Hashable, _Call[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Run func, or wait for the call of the same key already in flight
+
+        Args:
+            key (Hashable): Call key (e.g. a URL)
+            func (Callable[[], T]): Function to run
+
+        Returns:
+            T: Result of func
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
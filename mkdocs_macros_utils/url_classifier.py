@@ -0,0 +1,187 @@
+"""
+MkDocs Macros Utils URL classification shared by all macros
+
+Each URL is parsed once, dispatched by host name to the classifier of its
+provider (Gist page, raw Gist file, X/Twitter post) and the typed result is
+memoized, so macros called many times with the same URLs never re-parse them.
+"""
+
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+from urllib.parse import SplitResult, urlsplit, urlunsplit
+import re
+
+PROVIDER_GIST = "gist"
+PROVIDER_GIST_RAW = "gist_raw"
+PROVIDER_TWEET = "tweet"
+PROVIDER_WEB = "web"
+PROVIDER_INVALID = "invalid"
+
+CACHE_SIZE = 8192
+
+GIST_ID_PATTERN = re.compile(r"[a-f0-9]+")
+TWEET_USER_PATTERN = re.compile(r"\w+")
+TWEET_ID_PATTERN = re.compile(r"\d+")
+
+# Post URLs are canonicalized to twitter.com, which the widget script expects
+TWEET_HOSTS = {
+    "twitter.com": "twitter.com",
+    "mobile.twitter.com": "mobile.twitter.com",
+    "x.com": "twitter.com",
+    "mobile.x.com": "mobile.twitter.com",
+}
+
+
+@dataclass(frozen=True)
+class UrlInfo:
+    """Classification of a URL"""
+
+    url: str
+    provider: str
+    host: str = ""
+    netloc: str = ""
+    normalized_url: str = ""
+    canonical_url: str = ""
+    user: Optional[str] = None
+    resource_id: Optional[str] = None
+    filename: Optional[str] = None
+
+
+def clean_url(url: str) -> str:
+    """
+    Normalize URL (handle trailing slashes, multiple slashes, etc.)
+
+    Args:
+        url (str): Input URL
+
+    Returns:
+        str: Normalized URL
+    """
+    # Split the URL into scheme and the rest
+    parts = url.split("://", 1)
+
+    if len(parts) > 1:
+        scheme, rest = parts[0], parts[1]
+        # Remove trailing slash and consolidate multiple slashes
+        cleaned_rest = "/".join(filter(bool, rest.split("/")))
+        return f"{scheme}://{cleaned_rest}"
+
+    return url
+
+
+def _classify_gist(info: UrlInfo, parts: SplitResult) -> UrlInfo:
+    """Classify a Gist page URL, e.g. https://gist.github.com/user/0123abcd"""
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if (
+        parts.scheme != "https"
+        or len(segments) < 2
+        or not GIST_ID_PATTERN.fullmatch(segments[1])
+    ):
+        return info
+
+    user, gist_id = segments[0], segments[1]
+    return replace(
+        info,
+        provider=PROVIDER_GIST,
+        canonical_url=f"https://gist.github.com/{user}/{gist_id}",
+        user=user,
+        resource_id=gist_id,
+    )
+
+
+def _classify_gist_raw(info: UrlInfo, parts: SplitResult) -> UrlInfo:
+    """Classify a raw Gist file URL on gist.githubusercontent.com"""
+    if parts.scheme != "https":
+        return info
+
+    segments = parts.path.split("/")
+    return replace(
+        info,
+        provider=PROVIDER_GIST_RAW,
+        canonical_url=info.url,
+        user=segments[1] if len(segments) > 2 else None,
+        resource_id=segments[2] if len(segments) > 3 else None,
+        filename=segments[-1],
+    )
+
+
+def _classify_tweet(info: UrlInfo, parts: SplitResult) -> UrlInfo:
+    """Classify an X/Twitter post URL, e.g. https://x.com/user/status/123"""
+    segments = parts.path.split("/")
+    if len(segments) < 4 or segments[2] != "status":
+        return info
+    status_id = TWEET_ID_PATTERN.match(segments[3])
+    if not TWEET_USER_PATTERN.fullmatch(segments[1]) or not status_id:
+        return info
+
+    return replace(
+        info,
+        provider=PROVIDER_TWEET,
+        canonical_url=urlunsplit(parts._replace(netloc=TWEET_HOSTS[info.host])),
+        user=segments[1],
+        resource_id=status_id.group(),
+    )
+
+
+# Provider classifiers by host name
+HOST_CLASSIFIERS: Dict[str, Callable[[UrlInfo, SplitResult], UrlInfo]] = {
+    "gist.github.com": _classify_gist,
+    "gist.githubusercontent.com": _classify_gist_raw,
+    **{host: _classify_tweet for host in TWEET_HOSTS},
+}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def classify_url(url: str) -> UrlInfo:
+    """
+    Classify a URL by provider
+
+    Args:
+        url (str): URL as written in the page
+
+    Returns:
+        UrlInfo: Provider, host, normalized and canonical URL, and the user,
+            resource ID (Gist or post ID) and file name when the provider has them
+    """
+    normalized_url = clean_url(url)
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return UrlInfo(url, PROVIDER_INVALID, normalized_url=normalized_url)
+
+    host = (parts.hostname or "").lower()
+    info = UrlInfo(
+        url,
+        PROVIDER_WEB,
+        host=host,
+        netloc=parts.netloc,
+        normalized_url=normalized_url,
+        canonical_url=normalized_url,
+    )
+    if parts.scheme not in ("http", "https") or not host:
+        return replace(info, provider=PROVIDER_INVALID)
+
+    classifier = HOST_CLASSIFIERS.get(host)
+    return classifier(info, parts) if classifier else info
+
+
+def match_domain(host: str, domains: Dict[str, str]) -> Optional[str]:
+    """
+    Find the value of the most specific domain matching a host name
+
+    The host name and its parent domains are looked up in turn, e.g.
+    "gist.github.com" then "github.com" then "com".
+
+    Args:
+        host (str): Lowercase host name
+        domains (Dict[str, str]): Values by domain
+
+    Returns:
+        Optional[str]: Value of the matching domain, or None
+    """
+    while host:
+        if host in domains:
+            return domains[host]
+        _, _, host = host.partition(".")
+    return None
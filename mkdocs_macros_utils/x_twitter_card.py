@@ -3,11 +3,34 @@ MkDocs Macros Plugin for displaying X/Twitter link cards.
 """
 
 from typing import Optional
-from mkdocs_macros.plugin import MacrosPlugin
+from urllib.parse import urlencode
+import json
+import logging
 import re
+from mkdocs_macros.plugin import MacrosPlugin
 
 # Import debug logger
 from .debug_logger import DebugLogger
+from .cache import get_cache
+from .card_templates import X_TWITTER_CARD_TEMPLATE, get_templates
+from .http_client import HttpRequestError, cached_get
+from .incremental import mark_not_reusable, track_macro
+from .profiler import PHASE_PARSE, phase, profile_macro
+from .render_memo import config_fingerprint, get_render_memo
+from .settings import get_config_file_path, get_settings, resolve_path
+from .url_classifier import PROVIDER_TWEET, classify_url
+
+plugin_logger = logging.getLogger("mkdocs.plugins.macros-utils.x-twitter-card")
+
+DEFAULT_OEMBED_URL = "https://publish.twitter.com/oembed"
+DEFAULT_OEMBED_CACHE_DIR = ".cache/macros-utils/oembed"
+DEFAULT_OEMBED_TTL = 30 * 24 * 60 * 60  # seconds
+OEMBED_TIMEOUT = 10  # seconds
+# Widgets are created once posts come within this margin of the viewport
+DEFAULT_ROOT_MARGIN = "200px 0px"
+
+# The embed script is left to x-twitter-widget.js, even if the endpoint sends it
+SCRIPT_PATTERN = re.compile(r"<script\b.*?</script\s*>", re.IGNORECASE | re.DOTALL)
 
 
 def validate_x_twitter_url(url: str, logger: DebugLogger) -> bool:
@@ -21,18 +44,11 @@ def validate_x_twitter_url(url: str, logger: DebugLogger) -> bool:
     Returns:
         bool: True if URL is valid, False otherwise
     """
-    # Check URL patterns
-    valid_patterns = [
-        r"https?://(?:mobile\.)?twitter\.com/\w+/status/\d+",
-        r"https?://(?:mobile\.)?x\.com/\w+/status/\d+",
-    ]
-
-    for pattern in valid_patterns:
-        if re.match(pattern, url):
-            logger.log(f"Valid X/Twitter URL: {url}")
-            return True
-
-    logger.log(f"Invalid X/Twitter URL: {url}")
+    if classify_url(url).provider == PROVIDER_TWEET:
+        logger.logf("Valid X/Twitter URL: %s", url)
+        return True
+
+    logger.logf("Invalid X/Twitter URL: %s", url)
     return False
 
 
@@ -48,27 +64,93 @@ def standardize_twitter_url(url: str, logger: DebugLogger) -> str:
         str: Standardized URL
     """
     # Convert x.com to twitter.com
-    standardized_url = url.replace("x.com", "twitter.com")
+    info = classify_url(url)
+    standardized_url = info.canonical_url if info.provider == PROVIDER_TWEET else url
 
-    logger.log(f"URL standardization: {url} -> {standardized_url}")
+    logger.logf("URL standardization: %s -> %s", url, standardized_url)
     return standardized_url
 
 
-def create_x_twitter_card(url: str, env: Optional[MacrosPlugin] = None) -> str:
+def get_oembed_html(
+    url: str, env: Optional[MacrosPlugin], logger: DebugLogger
+) -> Optional[str]:
+    """
+    Get the static oEmbed markup of a post
+
+    The endpoint and the on-disk cache of the responses (relative to
+    mkdocs.yml) are configured in `extra.macros_utils.x_twitter_card`, so each
+    post is requested once.
+
+    Args:
+        url (str): Standardized post URL
+        env (Optional[MacrosPlugin]): MkDocs macro environment
+        logger (DebugLogger): Debug logger
+
+    Returns:
+        Optional[str]: Post markup without scripts, or None if the post could
+            not be resolved
+    """
+    card_config = get_settings(env, "x_twitter_card")
+    endpoint = card_config.get("oembed_url", DEFAULT_OEMBED_URL)
+    request_url = f"{endpoint}?" + urlencode(
+        {"url": url, "omit_script": "true", "dnt": "true"}
+    )
+    cache = get_cache(
+        resolve_path(
+            card_config.get("oembed_cache_dir", DEFAULT_OEMBED_CACHE_DIR),
+            get_config_file_path(env),
+        ),
+        float(card_config.get("oembed_ttl", DEFAULT_OEMBED_TTL)),
+    )
+
+    try:
+        result = cached_get(request_url, cache, logger, timeout=OEMBED_TIMEOUT)
+    except HttpRequestError as e:
+        plugin_logger.warning(f"Failed to pre-render {url}: {e}")
+        return None
+    if result.text is None:
+        plugin_logger.warning(f"Failed to pre-render {url}: HTTP {result.status_code}")
+        return None
+
+    with phase(PHASE_PARSE):
+        try:
+            html = json.loads(result.text)["html"]
+        except (ValueError, KeyError, TypeError):
+            plugin_logger.warning(f"Failed to pre-render {url}: invalid oEmbed data")
+            return None
+        return SCRIPT_PATTERN.sub("", str(html)).strip()
+
+
+def create_x_twitter_card(
+    url: str,
+    env: Optional[MacrosPlugin] = None,
+    logger: Optional[DebugLogger] = None,
+) -> str:
     """
     Generate widget HTML from X tweet URL
 
     Args:
         url (str): X tweet URL
         env (Optional[MacrosPlugin], optional): MkDocs macro environment
+        logger (Optional[DebugLogger], optional): Debug logger. Created from env if not specified.
 
     Returns:
         str: Widget HTML
     """
     # Create debug logger
-    logger = DebugLogger.create_logger("x_twitter_card", env)
+    logger = logger or DebugLogger.create_logger("x_twitter_card", env)
 
-    logger.log("Creating X/Twitter card", {"url": url})
+    logger.log("Creating X/Twitter card", lambda: {"url": url})
+
+    # Reuse the card if it was already rendered with the same configuration
+    memo = get_render_memo("x_twitter_card", env)
+    memo_key = url
+    fingerprint = config_fingerprint(env, "x_twitter_card", logger.enabled)
+    if memo:
+        html = memo.get(memo_key, fingerprint)
+        if html is not None:
+            logger.log("Reusing rendered X/Twitter card")
+            return html
 
     # URL validation
     if not validate_x_twitter_url(url, logger):
@@ -78,16 +160,30 @@ def create_x_twitter_card(url: str, env: Optional[MacrosPlugin] = None) -> str:
     # Standardize URL
     url = standardize_twitter_url(url, logger)
 
+    # Inline the post markup when pre-rendering is enabled
+    card_config = get_settings(env, "x_twitter_card")
+    prerender = card_config.get("prerender", False)
+    oembed_html = get_oembed_html(url, env, logger) if prerender else None
+
+    # Lazy widgets are created by x-twitter-widget.js near the viewport
+    root_margin = None
+    if card_config.get("lazy", True):
+        root_margin = card_config.get("root_margin", DEFAULT_ROOT_MARGIN)
+
     # Generate widget HTML
-    html = f"""
-    <div class="x-twitter-embed" data-url="{url}">
-        <blockquote class="twitter-tweet">
-            <a href="{url}"></a>
-        </blockquote>
-    </div>
-    """
+    html = get_templates().render(
+        X_TWITTER_CARD_TEMPLATE,
+        url=url,
+        oembed_html=oembed_html,
+        root_margin=root_margin,
+    )
 
     logger.log("X/Twitter card HTML generated successfully")
+    # Cards missing their pre-rendered post are rendered again on the next build
+    if prerender and not oembed_html:
+        mark_not_reusable()
+    elif memo:
+        memo.set(memo_key, fingerprint, html)
     return html
 
 
@@ -98,8 +194,11 @@ def define_env(env: MacrosPlugin) -> None:
     Args:
         env (MacrosPlugin): Macro plugin environment
     """
+    logger = DebugLogger.create_logger("x_twitter_card", env)
 
     @env.macro
+    @profile_macro
+    @track_macro
     def x_twitter_card(url: str) -> str:
         """
         MkDocs macro to generate widget HTML from X tweet URL
@@ -110,4 +209,4 @@ def define_env(env: MacrosPlugin) -> None:
         Returns:
             str: Widget HTML
         """
-        return create_x_twitter_card(url, env)
+        return create_x_twitter_card(url, env, logger)
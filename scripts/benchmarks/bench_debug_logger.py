@@ -0,0 +1,103 @@
+"""
+Benchmark the per-call debug logger overhead of card macros
+
+Renders 10k link cards and X/Twitter cards with debug logging disabled and
+the rendered-card memo off, comparing a logger created on every call with
+the logger memoized per environment.
+
+Usage:
+    python scripts/benchmarks/bench_debug_logger.py --cards 10000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+from mkdocs_macros_utils.debug_logger import DebugLogger
+from mkdocs_macros_utils.link_card import create_link_card
+from mkdocs_macros_utils.x_twitter_card import create_x_twitter_card
+
+
+class BenchEnv:
+    """Minimal macro environment with debug logging disabled"""
+
+    def __init__(self) -> None:
+        self.conf: Dict[str, Any] = {"site_url": "https://example.com/"}
+        self.variables: Dict[str, Any] = {
+            "extra": {
+                "debug": {"link_card": False, "x_twitter_card": False},
+                "macros_utils": {"render_memo": {"enabled": False}},
+            }
+        }
+
+
+def uncached_logger(module_name: str, env: Any) -> DebugLogger:
+    """Create a logger the way it was done before memoization"""
+    config = DebugLogger._get_debug_config(env)
+    return DebugLogger(module_name, config.get(module_name, False))
+
+
+def measure(label: str, func: Callable[[int], Any], count: int) -> float:
+    """Call func `count` times and print the time per call in microseconds"""
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    per_call = (time.perf_counter() - start) / count * 1_000_000
+    print(f"{label:<40} {per_call:8.2f} us/call")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark debug logger overhead of card macros."
+    )
+    parser.add_argument("--cards", type=int, default=10000, help="Cards per run")
+    args = parser.parse_args()
+
+    env = BenchEnv()
+    count = args.cards
+
+    uncached = measure(
+        "create_logger (uncached)",
+        lambda i: uncached_logger("link_card", env),
+        count,
+    )
+    cached = measure(
+        "create_logger (memoized)",
+        lambda i: DebugLogger.create_logger("link_card", env),
+        count,
+    )
+    print(f"Logger overhead saved: {uncached - cached:.2f} us/call")
+
+    for label, logger in [
+        ("uncached", None),
+        ("resolved in define_env", DebugLogger.create_logger("link_card", env)),
+    ]:
+        measure(
+            f"link_card ({label})",
+            lambda i: create_link_card(
+                url=f"https://example.org/{i}",
+                title="Title",
+                external=True,
+                env=env,  # type: ignore[arg-type]
+                logger=logger or uncached_logger("link_card", env),
+            ),
+            count,
+        )
+    for label, logger in [
+        ("uncached", None),
+        ("resolved in define_env", DebugLogger.create_logger("x_twitter_card", env)),
+    ]:
+        measure(
+            f"x_twitter_card ({label})",
+            lambda i: create_x_twitter_card(
+                f"https://x.com/user/status/{i}",
+                env,  # type: ignore[arg-type]
+                logger or uncached_logger("x_twitter_card", env),
+            ),
+            count,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark language detection of Gists without a known file extension
+
+Compares guessing on the whole content, on a bounded prefix, and memoized
+lookups of content that was already analysed.
+
+Usage:
+    python scripts/benchmarks/bench_language_detection.py --lines 5000
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from mkdocs_macros_utils.debug_logger import DebugLogger
+from mkdocs_macros_utils.gist_codeblock import GistProcessor
+
+PYTHON_SNIPPET = '''def fibonacci(n: int) -> int:
+    """Return the n-th Fibonacci number"""
+    if n < 2:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)
+
+'''
+
+
+def make_content(lines: int) -> str:
+    """Create a Python source of about `lines` lines"""
+    snippet_lines = PYTHON_SNIPPET.count("\n")
+    return "#!/usr/bin/env python\n" + PYTHON_SNIPPET * (lines // snippet_lines)
+
+
+def measure(label: str, func: Callable[[], str], repeat: int) -> float:
+    """Run func `repeat` times and print the mean time in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        lang = func()
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    print(f"{label:<32} {elapsed:10.3f} ms  ({lang})")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark language detection of large Gists."
+    )
+    parser.add_argument("--lines", type=int, default=5000, help="Lines per Gist")
+    parser.add_argument("--sample-size", type=int, default=4096, help="Prefix size")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions")
+    args = parser.parse_args()
+
+    content = make_content(args.lines)
+    logger = DebugLogger("benchmark")
+    print(f"Content: {content.count(chr(10))} lines, {len(content)} chars")
+
+    full = measure(
+        "guess_lexer on full content",
+        lambda: GistProcessor(logger).detect_language_from_content(content),
+        args.repeat,
+    )
+    sampled = measure(
+        f"guess_lexer on {args.sample_size} chars",
+        lambda: GistProcessor(
+            logger, lexer_sample_size=args.sample_size
+        ).detect_language_from_content(content),
+        args.repeat,
+    )
+    processor = GistProcessor(logger)
+    processor.detect_language_from_content(content)
+    memoized = measure(
+        "memoized by content hash",
+        lambda: processor.detect_language_from_content(content),
+        args.repeat,
+    )
+
+    print(f"Speedup (bounded sample): {full / sampled:.1f}x")
+    print(f"Speedup (memoized):       {full / memoized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Benchmark macro rendering, remote Gist resolution and plugin file hooks
+
+Exercises the hot paths of the plugin at realistic scales:
+
+- `create_link_card` and `create_x_twitter_card`, with and without the
+  rendered-card memo
+- `gist_codeblock` against a local mock Gist server serving Gists of various
+  sizes, without a cache and with the memory cache
+- `copy_static_files` when the static files are up to date
+- `on_files` on file collections of 1k to 100k files
+
+Results can be saved as JSON and compared with a previous run, so
+regressions in hot paths show up as slowdown ratios.
+
+Usage:
+    python scripts/benchmarks/bench_macros.py --scales 1000,10000,100000
+    python scripts/benchmarks/bench_macros.py --save before.json
+    python scripts/benchmarks/bench_macros.py --compare before.json
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from mkdocs.structure.files import File, Files
+
+import mkdocs_macros_utils
+from mkdocs_macros_utils import gist_codeblock, http_client, render_memo
+from mkdocs_macros_utils import cache as response_cache
+from mkdocs_macros_utils.link_card import create_link_card
+from mkdocs_macros_utils.x_twitter_card import create_x_twitter_card
+
+from gist_server import MockGistServer, make_content
+
+GIST_SIZES = {"small": 1_000, "medium": 50_000, "large": 500_000}
+
+
+class BenchEnv:
+    """Minimal macro environment collecting registered macros"""
+
+    def __init__(self, macros_utils: Optional[Dict[str, Any]] = None) -> None:
+        self.conf: Dict[str, Any] = {"site_url": "https://example.com/"}
+        self.variables: Dict[str, Any] = {
+            "extra": {"debug": {}, "macros_utils": macros_utils or {}}
+        }
+        self.macros: Dict[str, Callable[..., str]] = {}
+
+    def macro(self, func: Callable[..., str]) -> Callable[..., str]:
+        self.macros[func.__name__] = func
+        return func
+
+
+def reset_state() -> None:
+    """Forget memoized cards and cached responses between runs"""
+    render_memo._memos.clear()
+    response_cache._caches.clear()
+
+
+def measure(
+    results: List[Dict[str, Any]], name: str, func: Callable[[int], Any], count: int
+) -> None:
+    """Call func `count` times and record the time per call"""
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / count * 1_000_000
+    results.append({"name": name, "count": count, "us_per_call": per_call})
+    print(f"{name:<44} {count:>8} {elapsed * 1000:10.1f} ms {per_call:10.2f} us/call")
+
+
+def bench_cards(results: List[Dict[str, Any]], count: int) -> None:
+    """Render unique cards, then the same cards again"""
+    for enabled in (False, True):
+        reset_state()
+        env = BenchEnv({"render_memo": {"enabled": enabled}})
+        label = "memo" if enabled else "no memo"
+        for run in ("first", "repeat") if enabled else ("first",):
+            measure(
+                results,
+                f"link_card ({label}, {run})",
+                lambda i: create_link_card(
+                    f"https://example.com/posts/{i}",
+                    f"Post {i}",
+                    "Description",
+                    env=env,
+                ),
+                count,
+            )
+            measure(
+                results,
+                f"x_twitter_card ({label}, {run})",
+                lambda i: create_x_twitter_card(
+                    f"https://x.com/user/status/{i}", env=env
+                ),
+                count,
+            )
+
+
+def bench_gists(results: List[Dict[str, Any]], count: int, distinct: int) -> None:
+    """Render Gists of each size from the local mock server"""
+    with MockGistServer() as server:
+        urls = {
+            size: [
+                server.add_gist(
+                    f"{size_index:x}{i:07x}", {f"bench_{i}.py": make_content(chars)}
+                )
+                for i in range(distinct)
+            ]
+            for size_index, (size, chars) in enumerate(GIST_SIZES.items())
+        }
+
+        for cached in (False, True):
+            reset_state()
+            settings: Dict[str, Any] = {
+                "gist": {"resolver": "api", "api_url": server.url, "token_env": ""}
+            }
+            if cached:
+                settings["prefetch"] = {"enabled": True}
+            env = BenchEnv(settings)
+            http_client.configure_session(env)
+            gist_codeblock.define_env(env)
+            macro = env.macros["gist_codeblock"]
+
+            label = "memory cache" if cached else "no cache"
+            for size, size_urls in urls.items():
+                measure(
+                    results,
+                    f"gist_codeblock ({size}, {label})",
+                    lambda i: macro(size_urls[i % distinct]),
+                    count,
+                )
+        print(f"Mock Gist server requests: {server.requests}")
+
+
+def bench_static_files(results: List[Dict[str, Any]], count: int) -> None:
+    """Check up-to-date static files, as done on every (re)build"""
+    plugin_dir = Path(mkdocs_macros_utils.__file__).parent
+    with tempfile.TemporaryDirectory() as docs_dir:
+        mkdocs_macros_utils.copy_static_files(plugin_dir, Path(docs_dir))
+        measure(
+            results,
+            "copy_static_files (up to date)",
+            lambda i: mkdocs_macros_utils.copy_static_files(plugin_dir, Path(docs_dir)),
+            count,
+        )
+
+
+def make_files(count: int) -> Files:
+    """Create a file collection with a few plugin static files"""
+    files = [
+        File(f"section{i % 100}/page{i}.md", "docs", "site", True) for i in range(count)
+    ]
+    files += [
+        File(
+            os.path.join(mkdocs_macros_utils.MACROS_UTILS_DIR, css),
+            "docs",
+            "site",
+            True,
+        )
+        for css in mkdocs_macros_utils.MACROS_UTILS_CSS
+    ]
+    return Files(files)
+
+
+def bench_on_files(results: List[Dict[str, Any]], scale: int) -> None:
+    """Filter a file collection of `scale` files"""
+    files = make_files(scale)
+    repeat = max(1_000_000 // scale, 1)
+    measure(
+        results,
+        f"on_files ({scale} files)",
+        lambda i: mkdocs_macros_utils.on_files(files, {}),  # type: ignore[arg-type]
+        repeat,
+    )
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: Path) -> None:
+    """Print the slowdown of each benchmark against a saved run"""
+    baseline = {
+        (entry["name"], entry["count"]): entry["us_per_call"]
+        for entry in json.loads(baseline_path.read_text(encoding="utf-8"))
+    }
+    print(f"\nCompared with {baseline_path} (>1.00x is slower):")
+    for entry in results:
+        before = baseline.get((entry["name"], entry["count"]))
+        if before:
+            ratio = entry["us_per_call"] / before
+            print(f"{entry['name']:<44} {entry['count']:>8} {ratio:8.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark macro rendering and plugin hooks."
+    )
+    parser.add_argument(
+        "--scales",
+        default="1000,10000",
+        help="Comma-separated numbers of card calls and files (e.g. 1000,100000)",
+    )
+    parser.add_argument(
+        "--gist-calls", type=int, default=200, help="gist_codeblock calls per size"
+    )
+    parser.add_argument(
+        "--distinct-gists", type=int, default=20, help="Distinct Gists per size"
+    )
+    parser.add_argument(
+        "--copies", type=int, default=1000, help="copy_static_files calls"
+    )
+    parser.add_argument("--save", type=Path, help="Write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="Compare with saved results")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    print(f"{'Benchmark':<44} {'Calls':>8} {'Total':>13} {'Per call':>18}")
+    for scale in [int(value) for value in args.scales.split(",")]:
+        bench_cards(results, scale)
+        bench_on_files(results, scale)
+    bench_gists(results, args.gist_calls, args.distinct_gists)
+    bench_static_files(results, args.copies)
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
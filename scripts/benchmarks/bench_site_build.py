@@ -0,0 +1,195 @@
+"""
+Benchmark a full MkDocs build of a synthetic large site
+
+Generates a site of N pages with M macro calls each, in a configurable mix of
+link cards, Gist code blocks and X/Twitter cards. Gists are served by a local
+mock Gist API server, so the build never touches the network. The site is
+built once with macro profiling enabled, and the total build time, the time
+spent in each macro and the peak RSS of the process are reported.
+
+Usage:
+    python scripts/benchmarks/bench_site_build.py --pages 5000 --calls 10
+    python scripts/benchmarks/bench_site_build.py --mix 1:3:1 --distinct-gists 500
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+import argparse
+import json
+import random
+import resource
+import sys
+import tempfile
+import time
+
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+
+from gist_server import MockGistServer, make_content
+
+MACROS = ("link_card", "gist_codeblock", "x_twitter_card")
+
+
+def parse_mix(mix: str) -> Tuple[int, int, int]:
+    """Parse a "link_card:gist_codeblock:x_twitter_card" weight ratio"""
+    weights = tuple(int(weight) for weight in mix.split(":"))
+    if len(weights) != 3 or sum(weights) <= 0 or min(weights) < 0:
+        raise argparse.ArgumentTypeError(f"Invalid mix: {mix}")
+    return weights  # type: ignore[return-value]
+
+
+def macro_call(macro: str, index: int, gist_urls: List[str]) -> str:
+    """Build the Markdown of a macro call"""
+    if macro == "link_card":
+        # Every tenth card uses the bundled GitHub icon
+        if index % 10 == 0:
+            return (
+                f'{{{{ link_card(url="https://github.com/bench/repo{index}", '
+                f'title="Repository {index}") }}}}'
+            )
+        return (
+            f'{{{{ link_card(url="https://example.com/posts/{index}", '
+            f'title="Post {index}", description="Synthetic link card") }}}}'
+        )
+    if macro == "gist_codeblock":
+        return f'{{{{ gist_codeblock("{gist_urls[index % len(gist_urls)]}") }}}}'
+    return f'{{{{ x_twitter_card("https://x.com/bench/status/{index}") }}}}'
+
+
+def generate_site(
+    root: Path,
+    args: argparse.Namespace,
+    server: MockGistServer,
+) -> Tuple[Path, Dict[str, int]]:
+    """
+    Write the synthetic pages and mkdocs.yml
+
+    Returns:
+        Tuple[Path, Dict[str, int]]: mkdocs.yml path and macro call counts
+    """
+    rng = random.Random(args.seed)
+    gist_urls = [
+        server.add_gist(
+            f"{i:08x}", {f"snippet_{i}.py": make_content(rng.choice(args.gist_sizes))}
+        )
+        for i in range(args.distinct_gists)
+    ]
+
+    docs_dir = root / "docs"
+    counts = dict.fromkeys(MACROS, 0)
+    call_index = 0
+    for page in range(args.pages):
+        page_dir = docs_dir / f"section{page % 50}"
+        page_dir.mkdir(parents=True, exist_ok=True)
+        lines = [f"# Page {page}", ""]
+        for macro in rng.choices(MACROS, weights=args.mix, k=args.calls):
+            lines += [macro_call(macro, call_index, gist_urls), ""]
+            counts[macro] += 1
+            call_index += 1
+        (page_dir / f"page{page}.md").write_text("\n".join(lines), encoding="utf-8")
+    (docs_dir / "index.md").write_text("# Synthetic site\n", encoding="utf-8")
+
+    macros_utils: Dict[str, Any] = {
+        "gist": {"resolver": "api", "api_url": server.url, "token_env": ""},
+        "prefetch": {"enabled": args.prefetch},
+        "profile": {"enabled": True, "report": str(root / "profile")},
+    }
+    config = {
+        "site_name": "Synthetic site",
+        "site_url": "https://example.com/",
+        "theme": {"name": args.theme},
+        "plugins": [{"macros": {"modules": ["mkdocs_macros_utils"]}}],
+        "extra": {"macros_utils": macros_utils},
+    }
+    config_file = root / "mkdocs.yml"
+    # JSON is a subset of YAML
+    config_file.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    return config_file, counts
+
+
+def peak_rss_mb() -> float:
+    """Get the peak resident set size of the process in MiB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark a full build of a synthetic site using all macros."
+    )
+    parser.add_argument("--pages", type=int, default=1000, help="Number of pages")
+    parser.add_argument("--calls", type=int, default=10, help="Macro calls per page")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=(2, 1, 1),
+        help="link_card:gist_codeblock:x_twitter_card weights. Defaults to 2:1:1",
+    )
+    parser.add_argument(
+        "--distinct-gists", type=int, default=200, help="Distinct Gists served"
+    )
+    parser.add_argument(
+        "--gist-sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[500, 5_000, 50_000],
+        help="Comma-separated Gist sizes in characters",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Mock server latency in seconds"
+    )
+    parser.add_argument(
+        "--prefetch", action="store_true", help="Enable prefetch of remote content"
+    )
+    parser.add_argument("--theme", default="mkdocs", help="MkDocs theme name")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--keep", type=Path, help="Generate the site in this directory and keep it"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, MockGistServer(args.latency) as server:
+        root = args.keep or Path(tmp)
+        root.mkdir(parents=True, exist_ok=True)
+
+        start = time.perf_counter()
+        config_file, counts = generate_site(root, args, server)
+        generated = time.perf_counter() - start
+        rss_before = peak_rss_mb()
+
+        config = load_config(config_file=str(config_file), site_dir=str(root / "site"))
+        start = time.perf_counter()
+        config.plugins.on_startup(command="build", dirty=False)
+        try:
+            build(config)
+        finally:
+            config.plugins.on_shutdown()
+        elapsed = time.perf_counter() - start
+
+        report = json.loads((root / "profile.json").read_text(encoding="utf-8"))
+
+        print(
+            f"Site: {args.pages} pages x {args.calls} calls "
+            f"({', '.join(f'{name}={count}' for name, count in counts.items())})"
+        )
+        print(f"Generated in:       {generated:10.2f} s")
+        print(f"Build time:         {elapsed:10.2f} s")
+        print(f"Per page:           {elapsed / max(args.pages, 1) * 1000:10.2f} ms")
+        print(f"Peak RSS:           {peak_rss_mb():10.1f} MiB")
+        print(f"Peak RSS increase:  {peak_rss_mb() - rss_before:10.1f} MiB")
+        print(f"Mock server hits:   {server.requests:10d}")
+        print()
+        print(
+            f"{'Macro':<16} {'Calls':>8} {'Total (ms)':>12} {'Network (ms)':>13} "
+            f"{'Per call (ms)':>14}"
+        )
+        for name, stats in report["macros"].items():
+            per_call = stats["total_ms"] / max(stats["calls"], 1)
+            print(
+                f"{name:<16} {stats['calls']:>8} {stats['total_ms']:>12.1f} "
+                f"{stats['network_ms']:>13.1f} {per_call:>14.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
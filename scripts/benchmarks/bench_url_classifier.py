@@ -0,0 +1,121 @@
+"""
+Benchmark URL classification of the macros
+
+Compares the per-call regex matching and URL parsing the macros used to do
+with the shared classifier, both on first sight of each URL (cold) and on
+URLs already classified (warm), over a mix of Gist, raw Gist, X/Twitter and
+plain web URLs.
+
+Usage:
+    python scripts/benchmarks/bench_url_classifier.py --urls 100000
+    python scripts/benchmarks/bench_url_classifier.py --distinct 2000
+"""
+
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+import argparse
+import random
+import re
+import time
+
+from mkdocs_macros_utils.link_card import DEFAULT_ICONS
+from mkdocs_macros_utils.url_classifier import CACHE_SIZE, classify_url, match_domain
+
+GIST_URL_PATTERN = re.compile(r"https://gist\.github\.com/([^/]+)/([a-f0-9]+)")
+TWEET_PATTERNS = [
+    r"https?://(?:mobile\.)?twitter\.com/\w+/status/\d+",
+    r"https?://(?:mobile\.)?x\.com/\w+/status/\d+",
+]
+
+
+def make_urls(count: int, distinct: int, seed: int) -> List[str]:
+    """Create `count` URLs drawn from `distinct` URLs of every provider"""
+    rng = random.Random(seed)
+    templates = [
+        "https://gist.github.com/user{i}/{i:08x}",
+        "https://gist.githubusercontent.com/user{i}/{i:08x}/raw/rev/file{i}.py",
+        "https://x.com/user{i}/status/{i}",
+        "https://twitter.com/user{i}/status/{i}?s=20",
+        "https://github.com/user{i}/repo{i}/",
+        "https://blog{i}.hatenablog.com//entry/{i}",
+        "https://example.com/posts/{i}",
+    ]
+    pool = [rng.choice(templates).format(i=i) for i in range(distinct)]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def classify_legacy(url: str) -> Optional[str]:
+    """Classify a URL the way the macros did before, parsing it per call"""
+    for pattern in TWEET_PATTERNS:
+        if re.match(pattern, url):
+            return url.replace("x.com", "twitter.com")
+    if url.startswith("https://gist.githubusercontent.com/"):
+        return url.split("/")[-1]
+    match = GIST_URL_PATTERN.match(url)
+    if match:
+        return match.group(2)
+
+    parsed = urlparse(url)
+    hostname = parsed.hostname or ""
+    for domain in sorted(DEFAULT_ICONS, key=len, reverse=True):
+        if hostname == domain or hostname.endswith(f".{domain}"):
+            return DEFAULT_ICONS[domain]
+    return parsed.netloc
+
+
+def classify_unified(url: str) -> Optional[str]:
+    """Classify a URL with the shared classifier"""
+    info = classify_url(url)
+    return (
+        info.canonical_url
+        or info.filename
+        or info.resource_id
+        or match_domain(info.host, DEFAULT_ICONS)
+        or info.netloc
+    )
+
+
+def measure(label: str, func: Callable[[str], Optional[str]], urls: List[str]) -> float:
+    """Classify all URLs and print the total and per-URL time"""
+    start = time.perf_counter()
+    for url in urls:
+        func(url)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<28} {elapsed * 1000:10.1f} ms  "
+        f"{elapsed / len(urls) * 1_000_000:8.3f} us/URL"
+    )
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark URL classification of the macros."
+    )
+    parser.add_argument("--urls", type=int, default=100_000, help="URLs classified")
+    parser.add_argument(
+        "--distinct",
+        type=int,
+        default=CACHE_SIZE // 2,
+        help="Distinct URLs among them",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    urls = make_urls(args.urls, args.distinct, args.seed)
+    print(f"URLs: {len(urls)} ({len(set(urls))} distinct)")
+
+    timings: Dict[str, float] = {}
+    timings["legacy"] = measure("Regex and urlparse per call", classify_legacy, urls)
+    classify_url.cache_clear()
+    timings["cold"] = measure(
+        "Classifier (cold)", classify_unified, list(dict.fromkeys(urls))
+    )
+    timings["warm"] = measure("Classifier (warm)", classify_unified, urls)
+
+    print(f"Speedup (warm): {timings['legacy'] / timings['warm']:.1f}x")
+    print(f"Cache: {classify_url.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Local mock of the GitHub Gist API used by the benchmarks
+
+Serves `GET /gists/<gist_id>` like the Gist REST API, with every file marked
+as truncated so its content is downloaded from `GET /raw/<gist_id>/<filename>`.
+Point `extra.macros_utils.gist.api_url` at `MockGistServer.url` and use the
+"api" resolver to render `gist_codeblock` without network access.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Dict, Optional, Tuple, Type
+import json
+import threading
+
+PYTHON_LINE = "print('hello, mkdocs-macros-utils')  # benchmark line\n"
+
+
+def make_content(size: int) -> str:
+    """Create a Python source of about `size` characters"""
+    return PYTHON_LINE * max(size // len(PYTHON_LINE), 1)
+
+
+class MockGistServer:
+    """Threaded local HTTP server serving Gists from memory"""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """
+        Initialize the server
+
+        Args:
+            latency (float, optional): Delay added to every response in seconds.
+                Defaults to 0.0.
+        """
+        self.gists: Dict[str, Dict[str, str]] = {}
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    threading.Event().wait(server.latency)
+
+                status, body, content_type = server.respond(self.path)
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def add_gist(self, gist_id: str, files: Dict[str, str]) -> str:
+        """
+        Register a Gist
+
+        Args:
+            gist_id (str): Hexadecimal Gist ID
+            files (Dict[str, str]): File contents keyed by filename
+
+        Returns:
+            str: Gist page URL to pass to `gist_codeblock`
+        """
+        self.gists[gist_id] = files
+        return f"https://gist.github.com/bench/{gist_id}"
+
+    def respond(self, path: str) -> Tuple[int, str, str]:
+        """Build the status, body and content type of a request path"""
+        parts = path.strip("/").split("/")
+        if len(parts) == 2 and parts[0] == "gists" and parts[1] in self.gists:
+            gist_id = parts[1]
+            files = {
+                filename: {
+                    "filename": filename,
+                    "raw_url": f"{self.url}/raw/{gist_id}/{filename}",
+                    "size": len(content),
+                    "truncated": True,
+                }
+                for filename, content in self.gists[gist_id].items()
+            }
+            return 200, json.dumps({"id": gist_id, "files": files}), "application/json"
+        if len(parts) == 3 and parts[0] == "raw":
+            content = self.gists.get(parts[1], {}).get(parts[2])
+            if content is not None:
+                return 200, content, "text/plain; charset=utf-8"
+        return 404, "Not Found", "text/plain"
+
+    def __enter__(self) -> "MockGistServer":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.server.shutdown()
+        self.server.server_close()
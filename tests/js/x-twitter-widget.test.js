@@ -203,9 +203,12 @@ describe("X-Twitter-Widget", () => {
       jest.advanceTimersByTime(200);
 
       const container = document.querySelector(".x-twitter-embed");
-      const blockquote = container.querySelector("blockquote");
+      const blockquote = container.querySelector(
+        ".x-twitter-rendering:not([hidden]) blockquote"
+      );
       expect(blockquote).toBeTruthy();
       expect(blockquote.getAttribute("data-theme")).toBe("dark");
+      expect(container.getAttribute("data-theme")).toBe("dark");
     });
 
     /** Test theme detection from document element attribute */
@@ -234,10 +237,10 @@ describe("X-Twitter-Widget", () => {
   });
 
   /**
-   * Test suite for tweet recreation functionality
+   * Test suite for tweet rendering functionality
    * Verifies correct tweet widget creation and error handling
    */
-  describe("recreateTweet", () => {
+  describe("renderTweet", () => {
     /** Test blockquote creation with correct attributes */
     test("creates blockquote with correct attributes", () => {
       initializeModule();
@@ -389,6 +392,263 @@ describe("X-Twitter-Widget", () => {
     });
   });
 
+  /**
+   * Test suite for viewport-based lazy loading
+   * Verifies that tweets with a root margin are rendered near the viewport only
+   */
+  describe("lazy loading", () => {
+    /** Observers created by the module */
+    let observers;
+
+    /**
+     * Get the containers observed by the module's lazy loading observers
+     * @returns {HTMLElement[]} Observed containers
+     */
+    function observedContainers() {
+      return observers
+        .filter((observer) => observer.options)
+        .flatMap((observer) => Array.from(observer.targets));
+    }
+
+    /**
+     * Get the shown tweet blockquote of a container, unless it is pending
+     * @param {HTMLElement} container - Tweet container
+     * @returns {HTMLElement|null} Blockquote handed to widgets.js
+     */
+    function tweetOf(container) {
+      return container.querySelector(
+        ".x-twitter-rendering:not([hidden]) blockquote.twitter-tweet"
+      );
+    }
+
+    /**
+     * Simulate containers coming near the viewport
+     * @param {HTMLElement[]} containers - Containers intersecting the root margin
+     */
+    function scrollNear(containers) {
+      observers.forEach((observer) => {
+        const entries = containers
+          .filter((container) => observer.targets.has(container))
+          .map((container) => ({ isIntersecting: true, target: container }));
+        observer.callback(entries, observer);
+      });
+    }
+
+    /** Install a mock IntersectionObserver and lazy tweets */
+    beforeEach(() => {
+      observers = [];
+      global.IntersectionObserver = class {
+        constructor(callback, options) {
+          this.callback = callback;
+          this.options = options;
+          this.targets = new Set();
+          observers.push(this);
+        }
+
+        observe(target) {
+          this.targets.add(target);
+        }
+
+        unobserve(target) {
+          this.targets.delete(target);
+        }
+      };
+
+      document.body.innerHTML = [1, 2, 3]
+        .map(
+          (id) => `
+        <div class="x-twitter-embed" data-url="https://twitter.com/example/status/${id}"
+          data-root-margin="300px 0px">
+          <blockquote class="twitter-tweet">
+            <a href="https://twitter.com/example/status/${id}"></a>
+          </blockquote>
+        </div>`
+        )
+        .join("");
+    });
+
+    /** Remove the mock IntersectionObserver */
+    afterEach(() => {
+      delete global.IntersectionObserver;
+    });
+
+    /** Test that lazy tweets are observed instead of rendered */
+    test("observes lazy tweets with their root margin", () => {
+      initializeModule();
+
+      expect(observers).toHaveLength(1);
+      expect(observers[0].options.rootMargin).toBe("300px 0px");
+      expect(observedContainers()).toHaveLength(3);
+      expect(global.twttr.widgets.load).not.toHaveBeenCalled();
+    });
+
+    /** Test that widgets.js cannot render lazy tweets on its own */
+    test("marks the markup of lazy tweets pending", () => {
+      initializeModule();
+
+      expect(document.querySelector("blockquote.twitter-tweet")).toBeNull();
+      expect(
+        document.querySelectorAll("blockquote.x-twitter-pending")
+      ).toHaveLength(3);
+    });
+
+    /** Test that only tweets near the viewport are rendered */
+    test("renders tweets as they come near the viewport", () => {
+      initializeModule();
+      const containers = document.querySelectorAll(".x-twitter-embed");
+
+      scrollNear([containers[0]]);
+
+      expect(tweetOf(containers[0])).toBeTruthy();
+      expect(tweetOf(containers[1])).toBeNull();
+      expect(global.twttr.widgets.load).toHaveBeenCalledTimes(1);
+      expect(observedContainers()).toHaveLength(2);
+    });
+
+    /** Test that widgets.js is downloaded once the first tweet is near */
+    test("defers the Twitter script until a tweet is near", () => {
+      delete global.twttr;
+      const appendChildSpy = jest.spyOn(document.head, "appendChild");
+      initializeModule();
+
+      const scripts = () =>
+        appendChildSpy.mock.calls.filter(
+          (call) => call[0].tagName === "SCRIPT"
+        );
+      expect(scripts()).toHaveLength(0);
+
+      const containers = document.querySelectorAll(".x-twitter-embed");
+      scrollNear([containers[0], containers[1]]);
+      expect(scripts()).toHaveLength(1);
+
+      global.twttr = {
+        widgets: {
+          load: jest.fn().mockResolvedValue(true),
+        },
+      };
+      scripts()[0][0].onload();
+
+      expect(global.twttr.widgets.load).toHaveBeenCalledTimes(2);
+      appendChildSpy.mockRestore();
+    });
+
+    /** Test that theme changes leave tweets that were never rendered alone */
+    test("skips unrendered lazy tweets on color scheme change", () => {
+      document.body.insertAdjacentHTML(
+        "beforeend",
+        '<form data-md-component="palette"></form>'
+      );
+      initializeModule();
+      const containers = document.querySelectorAll(".x-twitter-embed");
+      scrollNear([containers[0]]);
+      // The rendered tweet then scrolls into the viewport
+      scrollNear([containers[0]]);
+
+      document.documentElement.setAttribute("data-md-color-scheme", "slate");
+      document
+        .querySelector('[data-md-component="palette"]')
+        .dispatchEvent(new Event("change"));
+      jest.advanceTimersByTime(200);
+
+      const blockquote = tweetOf(containers[0]);
+      expect(blockquote.getAttribute("data-theme")).toBe("dark");
+      expect(tweetOf(containers[1])).toBeNull();
+      expect(tweetOf(containers[2])).toBeNull();
+    });
+
+    /**
+     * Test suite for color scheme changes of rendered tweets
+     * Verifies that only visible tweets are switched and renderings are reused
+     */
+    describe("theme switching", () => {
+      /** Rendered tweet containers */
+      let containers;
+
+      /**
+       * Simulate rendered tweets entering or leaving the viewport
+       * @param {HTMLElement[]} targets - Containers whose visibility changes
+       * @param {boolean} isIntersecting - Whether they are now visible
+       */
+      function setVisible(targets, isIntersecting) {
+        const observer = observers.find((candidate) => !candidate.options);
+        const entries = targets.map((target) => ({ isIntersecting, target }));
+        observer.callback(entries, observer);
+      }
+
+      /**
+       * Switch the Material color scheme
+       * @param {string} scheme - 'slate' or 'default'
+       */
+      function switchScheme(scheme) {
+        document.documentElement.setAttribute("data-md-color-scheme", scheme);
+        document
+          .querySelector('[data-md-component="palette"]')
+          .dispatchEvent(new Event("change"));
+        jest.advanceTimersByTime(200);
+      }
+
+      /** Render the first two tweets, the first one visible */
+      beforeEach(() => {
+        document.body.insertAdjacentHTML(
+          "beforeend",
+          '<form data-md-component="palette"></form>'
+        );
+        initializeModule();
+        containers = Array.from(document.querySelectorAll(".x-twitter-embed"));
+        scrollNear([containers[0], containers[1]]);
+        setVisible([containers[0]], true);
+        setVisible([containers[1]], false);
+        global.twttr.widgets.load.mockClear();
+      });
+
+      /** Test that off-screen tweets keep their rendering */
+      test("re-renders only visible tweets", () => {
+        switchScheme("slate");
+
+        expect(tweetOf(containers[0]).getAttribute("data-theme")).toBe("dark");
+        expect(tweetOf(containers[1]).getAttribute("data-theme")).toBe("light");
+        expect(containers[1].getAttribute("data-theme")).toBe("light");
+        expect(global.twttr.widgets.load).toHaveBeenCalledTimes(1);
+      });
+
+      /** Test that off-screen tweets switch when they become visible */
+      test("switches deferred tweets when they become visible", () => {
+        switchScheme("slate");
+        setVisible([containers[1]], true);
+
+        expect(tweetOf(containers[1]).getAttribute("data-theme")).toBe("dark");
+        expect(global.twttr.widgets.load).toHaveBeenCalledTimes(2);
+      });
+
+      /** Test that switching back shows the first rendering again */
+      test("reuses the rendering of a theme shown before", () => {
+        const lightTweet = tweetOf(containers[0]);
+
+        switchScheme("slate");
+        switchScheme("default");
+
+        expect(tweetOf(containers[0])).toBe(lightTweet);
+        expect(
+          containers[0].querySelectorAll(".x-twitter-rendering")
+        ).toHaveLength(2);
+        expect(global.twttr.widgets.load).toHaveBeenCalledTimes(1);
+      });
+
+      /** Test that tweets already in the requested theme are left alone */
+      test("skips tweets already in the requested theme", () => {
+        const lightTweet = tweetOf(containers[0]);
+
+        switchScheme("default");
+
+        expect(tweetOf(containers[0])).toBe(lightTweet);
+        expect(
+          containers[0].querySelectorAll(".x-twitter-rendering")
+        ).toHaveLength(1);
+        expect(global.twttr.widgets.load).not.toHaveBeenCalled();
+      });
+    });
+  });
+
   /**
    * Test suite for debugging functionality
    * Verifies logging and debug mode behavior
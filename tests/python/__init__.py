@@ -1,3 +1,3 @@
-from python.conftest import MockMacrosPlugin
+from python.conftest import MockMacrosPlugin, StubServer, mock_requests_get
 
-__all__ = ["MockMacrosPlugin"]
+__all__ = ["MockMacrosPlugin", "StubServer", "mock_requests_get"]
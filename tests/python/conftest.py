@@ -3,11 +3,23 @@ Common test configurations and fixtures for MkDocs Macros Utils tests.
 This module provides shared test utilities including mock classes and fixtures.
 """
 
-from typing import Any, Callable, Dict, List, Optional, Type
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+import threading
 import pytest
 from pytest import Config
+from mkdocs_macros_utils import cache as cache_module
+from mkdocs_macros_utils import card_templates
+from mkdocs_macros_utils import http_client
+from mkdocs_macros_utils import incremental
+from mkdocs_macros_utils import profiler
+from mkdocs_macros_utils import link_card
+from mkdocs_macros_utils import render_memo
+from mkdocs_macros_utils.cache import ResponseCache
 from mkdocs_macros_utils.debug_logger import DebugLogger
 from mkdocs_macros_utils.gist_codeblock import GistProcessor, define_env
+from mkdocs_macros_utils.lockfile import set_active_lock
 
 
 class MockMacrosPlugin:
@@ -53,6 +65,19 @@ class MockMacrosPlugin:
         return f
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_caches() -> None:
+    """Drop response caches shared between macros so tests stay isolated"""
+    cache_module._caches.clear()
+    http_client.configure_session(None)
+    link_card._gist_icons.clear()
+    render_memo._memos.clear()
+    incremental._tracker = incremental.DependencyTracker()
+    profiler._profiler = profiler.MacroProfiler()
+    card_templates._templates = None
+    set_active_lock(None)
+
+
 @pytest.fixture
 def mock_logger() -> DebugLogger:
     """Debug logger fixture for testing
@@ -99,6 +124,19 @@ def processor(mock_logger: DebugLogger) -> GistProcessor:
     return GistProcessor(mock_logger)
 
 
+@pytest.fixture
+def response_cache(tmp_path: Path) -> ResponseCache:
+    """Response cache fixture backed by a temporary directory
+
+    Args:
+        tmp_path: Pytest temporary directory fixture
+
+    Returns:
+        ResponseCache: An empty response cache instance
+    """
+    return ResponseCache(tmp_path / "cache")
+
+
 @pytest.fixture
 def mock_response() -> Type[Any]:
     """HTTP response mock fixture
@@ -108,14 +146,86 @@ def mock_response() -> Type[Any]:
     """
 
     class MockResponse:
-        def __init__(self, text: str = "", status_code: int = 200) -> None:
+        def __init__(
+            self,
+            text: str = "",
+            status_code: int = 200,
+            headers: Optional[Dict[str, str]] = None,
+        ) -> None:
             self.text = text
             self.status_code = status_code
+            self.headers = headers or {}
             self._content = text.encode() if isinstance(text, str) else text
+            self.encoding = "utf-8"
+
+        def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+            for start in range(0, len(self._content), chunk_size):
+                yield self._content[start : start + chunk_size]
+
+        def close(self) -> None:
+            pass
 
     return MockResponse
 
 
+class StubServer:
+    """Local HTTP server serving canned responses for tests
+
+    Responses are registered per path in `routes` as (status, body, headers),
+    and every request path is recorded in `requests`.
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[str, Any] = {}
+        self.requests: List[str] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                stub.requests.append(self.path)
+                status, body, headers = stub.routes.get(self.path, (404, "", {}))
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    def add(
+        self,
+        path: str,
+        body: str,
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Register a response for a path"""
+        self.routes[path] = (status, body, headers or {})
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubServer]:
+    """Local HTTP stub server fixture
+
+    Yields:
+        StubServer: A running stub server, shut down after the test
+    """
+    server = StubServer()
+    server.thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
 def pytest_configure(config: Config) -> None:
     """Configure pytest with custom markers
 
@@ -0,0 +1,181 @@
+"""
+Tests for the asyncio prefetch backend in MkDocs Macros Utils
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List
+import asyncio
+import json
+import time
+from mkdocs_macros_utils.async_backend import (
+    AsyncPrefetcher,
+    HostRateLimiter,
+    prefetch_gist,
+)
+from mkdocs_macros_utils.cache import ResponseCache, get_response_cache
+from mkdocs_macros_utils.debug_logger import DebugLogger
+from mkdocs_macros_utils.gist_codeblock import RESOLVER_API, GistProcessor
+from mkdocs_macros_utils.gist_codeblock import define_env as define_gist_env
+from mkdocs_macros_utils.prefetch import prefetch_remote_resources
+from tests.python import MockMacrosPlugin, StubServer
+
+
+def add_gist(stub_server: StubServer, gist_id: str) -> None:
+    """Serve a Gist with one inline and one truncated file from the stub API"""
+    files: Dict[str, Any] = {
+        "main.py": {
+            "raw_url": f"{stub_server.url}/raw/{gist_id}/main.py",
+            "truncated": True,
+        },
+        "util.sh": {
+            "raw_url": f"{stub_server.url}/raw/{gist_id}/util.sh",
+            "content": "echo util",
+        },
+    }
+    stub_server.add(f"/gists/{gist_id}", json.dumps({"files": files}))
+    stub_server.add(f"/raw/{gist_id}/main.py", f"print('{gist_id}')")
+
+
+def make_processor(
+    stub_server: StubServer, cache: ResponseCache, mock_logger: DebugLogger
+) -> GistProcessor:
+    """Create a processor resolving Gists with the stub API"""
+    return GistProcessor(
+        mock_logger, cache=cache, resolver=RESOLVER_API, api_url=stub_server.url
+    )
+
+
+def run_prefetch(processor: GistProcessor, gist_urls: List[str]) -> List[List[str]]:
+    """Prefetch Gists one after another, returning the errors of each"""
+
+    async def prefetch() -> List[List[str]]:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            prefetcher = AsyncPrefetcher(executor, 4, 0)
+            return [
+                await prefetch_gist(prefetcher, processor, gist_url)
+                for gist_url in gist_urls
+            ]
+
+    return asyncio.run(prefetch())
+
+
+# -- Async Prefetch Tests ------------------------------
+def test_prefetch_gist_fills_cache(
+    stub_server: StubServer, response_cache: ResponseCache, mock_logger: DebugLogger
+) -> None:
+    """Test that the manifest and truncated files are cached, inline ones skipped"""
+    add_gist(stub_server, "abc123")
+    processor = make_processor(stub_server, response_cache, mock_logger)
+
+    assert run_prefetch(processor, ["https://gist.github.com/u/abc123"]) == [[]]
+    assert sorted(stub_server.requests) == ["/gists/abc123", "/raw/abc123/main.py"]
+    entry = response_cache.get(f"{stub_server.url}/raw/abc123/main.py")
+    assert entry is not None
+    assert entry.body == "print('abc123')"
+
+    # A new processor is served from the cache
+    processor = make_processor(stub_server, response_cache, mock_logger)
+    run_prefetch(processor, ["https://gist.github.com/u/abc123"])
+    assert len(stub_server.requests) == 2
+
+
+def test_prefetch_gist_errors(
+    stub_server: StubServer, response_cache: ResponseCache, mock_logger: DebugLogger
+) -> None:
+    """Test that failures are reported as errors"""
+    add_gist(stub_server, "abc123")
+    del stub_server.routes["/raw/abc123/main.py"]
+    processor = make_processor(stub_server, response_cache, mock_logger)
+
+    assert run_prefetch(
+        processor,
+        [
+            "https://gist.github.com/u/abc123",
+            "https://gist.github.com/u/fff000",
+            "https://example.com/not-a-gist",
+        ],
+    ) == [
+        ["Failed to fetch Gist content: HTTP 404"],
+        ["Failed to fetch Gist: HTTP 404"],
+        ["Invalid Gist URL format"],
+    ]
+
+
+def test_host_rate_limiter() -> None:
+    """Test that requests to one host are spaced, other hosts are not"""
+    limiter = HostRateLimiter(rate=20)
+
+    async def wait_all() -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(limiter.wait("a") for _ in range(3)))
+        await limiter.wait("b")
+        return time.perf_counter() - start
+
+    # Third request to "a" waits two intervals of 50ms
+    assert 0.09 <= asyncio.run(wait_all()) < 0.5
+    assert HostRateLimiter(rate=0).interval == 0.0
+
+
+def test_rate_limited_host_does_not_hold_slots() -> None:
+    """Test that a request waiting for its host leaves the slot to other hosts"""
+    order: List[str] = []
+
+    async def fetch_all() -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            prefetcher = AsyncPrefetcher(executor, 1, 5)
+            await asyncio.gather(
+                *(
+                    prefetcher.run(url, partial(order.append, url))
+                    for url in [
+                        "https://a.test/1",
+                        "https://a.test/2",
+                        "https://b.test/1",
+                    ]
+                )
+            )
+
+    asyncio.run(fetch_all())
+
+    assert order == ["https://a.test/1", "https://b.test/1", "https://a.test/2"]
+
+
+# -- Prefetch Backend Tests ------------------------------
+def test_async_backend_serves_macros_from_memory(
+    stub_server: StubServer, tmp_path: Path
+) -> None:
+    """Test that the async backend prefetches Gists rendered by the macro"""
+    gist_ids = [f"{i:06x}" for i in range(20)]
+    for gist_id in gist_ids:
+        add_gist(stub_server, gist_id)
+    (tmp_path / "index.md").write_text(
+        "\n".join(
+            f'{{{{ gist_codeblock("https://gist.github.com/u/{gist_id}") }}}}'
+            for gist_id in gist_ids
+        )
+    )
+    env = MockMacrosPlugin(
+        conf={"docs_dir": str(tmp_path)},
+        debug_settings={
+            "extra": {
+                "macros_utils": {
+                    "prefetch": {
+                        "enabled": True,
+                        "backend": "async",
+                        "max_concurrency": 8,
+                    },
+                    "gist": {"resolver": "api", "api_url": stub_server.url},
+                }
+            }
+        },
+    )
+
+    assert prefetch_remote_resources(env) == 20
+    assert len(stub_server.requests) == 40
+    assert get_response_cache(env) is not None
+
+    define_gist_env(env)
+    result = getattr(env, "gist_codeblock")(f"https://gist.github.com/u/{gist_ids[-1]}")
+    assert f"print('{gist_ids[-1]}')" in result
+    assert len(stub_server.requests) == 40
@@ -0,0 +1,162 @@
+"""
+Tests for the response cache module in MkDocs Macros Utils
+"""
+
+import os
+from pathlib import Path
+import pytest
+from pytest import MonkeyPatch
+from pytest_mock import MockerFixture
+from mkdocs_macros_utils import cache as cache_module
+from mkdocs_macros_utils.cache import ResponseCache, get_response_cache
+from tests.python import MockMacrosPlugin
+
+
+# -- Entry Storage Tests ------------------------------
+def test_set_and_get(response_cache: ResponseCache) -> None:
+    """Test storing and reading back an entry"""
+    response_cache.set("https://example.com/a", "body")
+
+    entry = response_cache.get("https://example.com/a")
+    assert entry is not None
+    assert entry.body == "body"
+    assert response_cache.get("https://example.com/b") is None
+
+
+def test_entries_are_content_addressed(response_cache: ResponseCache) -> None:
+    """Test that entry files are named after the key hash"""
+    response_cache.set("https://example.com/a", "body")
+
+    assert response_cache.cache_dir is not None
+    files = list(response_cache.cache_dir.glob("*.json"))
+    assert len(files) == 1
+    assert "example.com" not in files[0].name
+
+
+def test_expired_entry(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Test that entries older than the TTL are ignored"""
+    cache = ResponseCache(tmp_path, ttl=10)
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1000.0)
+    cache.set("key", "body")
+
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1011.0)
+    assert cache.get("key") is None
+
+
+def test_corrupt_entry_is_discarded(response_cache: ResponseCache) -> None:
+    """Test that unreadable entry files are removed"""
+    response_cache.set("key", "body")
+    assert response_cache.cache_dir is not None
+    path = next(response_cache.cache_dir.glob("*.json"))
+    path.write_text("{not json")
+
+    reloaded = ResponseCache(response_cache.cache_dir)
+    assert reloaded.get("key") is None
+    assert not path.exists()
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    """Test that least recently used entries are evicted over max_size"""
+    cache = ResponseCache(tmp_path, max_size=500)
+    cache.set("first", "x" * 100)
+    cache.set("second", "y" * 100)
+    for path, mtime in zip(sorted(tmp_path.glob("*.json")), (100, 200)):
+        os.utime(path, (mtime, mtime))
+
+    # Touch "first" so "second" becomes the least recently used entry
+    reloaded = ResponseCache(tmp_path, max_size=500)
+    assert reloaded.get("first") is not None
+    reloaded.set("third", "z" * 100)
+
+    on_disk = ResponseCache(tmp_path, max_size=500)
+    assert on_disk.get("first") is not None
+    assert on_disk.get("second") is None
+    assert on_disk.get("third") is not None
+
+
+def test_directory_scanned_only_for_eviction(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Test that writes keep a running size instead of scanning the directory"""
+    glob = mocker.spy(Path, "glob")
+    cache = ResponseCache(tmp_path, max_size=1000)
+    for i in range(5):
+        cache.set(f"key{i}", "x" * 50)
+    assert glob.call_count == 1
+
+    cache.set("large", "y" * 600)
+    assert glob.call_count == 2
+    assert cache._disk_size <= 1000
+    assert sum(path.stat().st_size for path in tmp_path.glob("*.json")) == (
+        cache._disk_size
+    )
+
+
+def test_memory_layer_lru_eviction() -> None:
+    """Test that the in-memory layer is bounded by max_size"""
+    cache = ResponseCache(None, max_size=250)
+    cache.set("first", "x" * 100)
+    cache.set("second", "y" * 100)
+    assert cache.get("first") is not None
+    cache.set("third", "z" * 100)
+
+    assert cache.get("first") is not None
+    assert cache.get("second") is None
+    assert cache.get("third") is not None
+
+
+def test_clear(response_cache: ResponseCache) -> None:
+    """Test removing all entries"""
+    response_cache.set("key", "body")
+    response_cache.clear()
+    assert response_cache.get("key") is None
+
+
+# -- Configuration Tests ------------------------------
+def test_get_response_cache_memory_only_for_prefetch() -> None:
+    """Test that prefetching alone enables a memory-only cache"""
+    env = MockMacrosPlugin(
+        debug_settings={"extra": {"macros_utils": {"prefetch": {"enabled": True}}}}
+    )
+
+    cache = get_response_cache(env)
+    assert cache is not None
+    assert cache.cache_dir is None
+
+
+def test_get_response_cache_disabled_by_default(mock_env: MockMacrosPlugin) -> None:
+    """Test that caching is disabled unless configured"""
+    assert get_response_cache(mock_env) is None
+    assert get_response_cache(None) is None
+
+
+@pytest.mark.parametrize("ttl", [60, 120])
+def test_get_response_cache_from_settings(tmp_path: Path, ttl: int) -> None:
+    """Test cache creation from extra.macros_utils.cache settings"""
+    env = MockMacrosPlugin(
+        debug_settings={
+            "extra": {
+                "macros_utils": {
+                    "cache": {"enabled": True, "dir": str(tmp_path), "ttl": ttl}
+                }
+            }
+        }
+    )
+
+    cache = get_response_cache(env)
+    assert cache is not None
+    assert cache.cache_dir == tmp_path
+    assert cache.ttl == ttl
+    assert get_response_cache(env) is cache
+
+
+def test_get_response_cache_relative_to_config_file(tmp_path: Path) -> None:
+    """Test that the cache directory is relative to mkdocs.yml"""
+    env = MockMacrosPlugin(
+        conf={"config_file_path": str(tmp_path / "site" / "mkdocs.yml")},
+        debug_settings={"extra": {"macros_utils": {"cache": {"enabled": True}}}},
+    )
+
+    cache = get_response_cache(env)
+    assert cache is not None
+    assert cache.cache_dir == tmp_path / "site" / ".cache" / "macros-utils"
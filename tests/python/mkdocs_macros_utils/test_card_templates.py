@@ -0,0 +1,147 @@
+"""
+Tests for the card templates module in MkDocs Macros Utils
+"""
+
+from pathlib import Path
+import logging
+import pytest
+from mkdocs_macros_utils import card_templates
+from mkdocs_macros_utils.card_templates import (
+    LINK_CARD_TEMPLATE,
+    X_TWITTER_CARD_TEMPLATE,
+    CardTemplates,
+    configure_templates,
+    get_templates,
+)
+from mkdocs_macros_utils.link_card import create_link_card
+from mkdocs_macros_utils.x_twitter_card import create_x_twitter_card
+from tests.python import MockMacrosPlugin
+
+
+def make_env(overrides_dir: Path) -> MockMacrosPlugin:
+    """Create an environment with a templates overrides directory"""
+    return MockMacrosPlugin(
+        debug_settings={
+            "extra": {
+                "macros_utils": {"templates": {"overrides_dir": str(overrides_dir)}}
+            }
+        }
+    )
+
+
+# -- Bundled Template Tests ------------------------------
+def test_bundled_link_card_template() -> None:
+    """Test that the bundled link card renders an image or an icon"""
+    templates = CardTemplates()
+    context = {
+        "url": "https://example.com",
+        "title": "Title",
+        "description": "Description",
+        "domain": "example.com",
+    }
+
+    with_image = templates.render(LINK_CARD_TEMPLATE, image="site.png", **context)
+    with_svg = templates.render(LINK_CARD_TEMPLATE, svg="<svg></svg>", **context)
+
+    assert with_image.startswith('\n<div class="custom-link-card"')
+    assert "<img src='site.png' alt='Title' class='custom-link-card-image'>" in (
+        with_image
+    )
+    assert "<div class='custom-link-card-image'><svg></svg></div>" in with_svg
+    assert "<img" not in with_svg
+
+
+def test_bundled_x_twitter_card_template() -> None:
+    """Test that the bundled X/Twitter card embeds the post URL"""
+    url = "https://twitter.com/user/status/1"
+
+    html = CardTemplates().render(X_TWITTER_CARD_TEMPLATE, url=url)
+
+    assert f'<div class="x-twitter-embed" data-url="{url}">' in html
+    assert f'<a href="{url}"></a>' in html
+
+
+def test_templates_do_not_escape_values() -> None:
+    """Test that values are inserted as is, like the f-string cards did"""
+    html = CardTemplates().render(
+        LINK_CARD_TEMPLATE,
+        url="https://example.com",
+        title="Title",
+        description="<b>bold</b> & more",
+        domain="example.com",
+    )
+
+    assert "<b>bold</b> & more" in html
+
+
+# -- Override Tests ------------------------------
+def test_override_replaces_bundled_template(tmp_path: Path) -> None:
+    """Test that a template in the overrides directory is used"""
+    (tmp_path / X_TWITTER_CARD_TEMPLATE).write_text(
+        '<div class="my-tweet">{{ url }}</div>', encoding="utf-8"
+    )
+
+    configure_templates(make_env(tmp_path))
+    html = create_x_twitter_card("https://x.com/user/status/1")
+
+    assert html == '<div class="my-tweet">https://twitter.com/user/status/1</div>'
+    assert get_templates().overrides == [X_TWITTER_CARD_TEMPLATE]
+    # Templates without an override keep the bundled markup
+    assert "custom-link-card" in create_link_card("https://example.com", "Title")
+
+
+def test_missing_overrides_dir_uses_bundled_templates(tmp_path: Path) -> None:
+    """Test that a missing overrides directory is not an error"""
+    templates = configure_templates(make_env(tmp_path / "missing"))
+
+    assert templates.overrides == []
+    assert templates.fingerprint == ()
+
+
+def test_overrides_dir_relative_to_config_file(tmp_path: Path) -> None:
+    """Test that the overrides directory is found next to mkdocs.yml"""
+    overrides_dir = tmp_path / "overrides" / "macros-utils"
+    overrides_dir.mkdir(parents=True)
+    (overrides_dir / LINK_CARD_TEMPLATE).write_text("custom", encoding="utf-8")
+    env = MockMacrosPlugin(conf={"config_file_path": str(tmp_path / "mkdocs.yml")})
+
+    templates = configure_templates(env)
+
+    assert templates.overrides == [LINK_CARD_TEMPLATE]
+    assert templates.render(LINK_CARD_TEMPLATE) == "custom"
+
+
+def test_invalid_override_falls_back_to_bundled(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a template syntax error is reported and ignored"""
+    (tmp_path / LINK_CARD_TEMPLATE).write_text("{% if %}", encoding="utf-8")
+
+    with caplog.at_level(logging.ERROR):
+        templates = configure_templates(make_env(tmp_path))
+
+    assert templates.overrides == []
+    assert "Invalid card template" in caplog.text
+
+
+def test_edited_override_invalidates_render_memo(tmp_path: Path) -> None:
+    """Test that memoized cards are re-rendered after an override changes"""
+    override = tmp_path / X_TWITTER_CARD_TEMPLATE
+    override.write_text("v1 {{ url }}", encoding="utf-8")
+    env = make_env(tmp_path)
+    url = "https://x.com/user/status/1"
+
+    configure_templates(env)
+    assert create_x_twitter_card(url, env).startswith("v1")
+
+    override.write_text("version2 {{ url }}", encoding="utf-8")
+    configure_templates(env)
+    assert create_x_twitter_card(url, env).startswith("version2")
+
+
+def test_get_templates_defaults_to_bundled() -> None:
+    """Test that macros render without configured templates"""
+    card_templates._templates = None
+
+    assert get_templates().overrides == []
+    assert get_templates() is get_templates()
@@ -96,3 +96,73 @@ def test_logger_name_format() -> None:
     module_name = "test_module"
     logger = DebugLogger(module_name)
     assert logger.logger.name == f"mkdocs.plugins.macros-utils.{module_name}"
+
+
+@pytest.mark.debug
+def test_create_logger_memoized_per_env(mock_env: MockMacrosPlugin) -> None:
+    """Test that loggers are created once per module and environment"""
+    logger = DebugLogger.create_logger("link_card", mock_env)
+
+    assert DebugLogger.create_logger("link_card", mock_env) is logger
+    assert DebugLogger.create_logger("gist_codeblock", mock_env) is not logger
+    assert DebugLogger.create_logger("link_card", MockMacrosPlugin()) is not logger
+    assert DebugLogger.create_logger("link_card") is DebugLogger.create_logger(
+        "link_card"
+    )
+
+
+@pytest.mark.debug
+def test_create_logger_reads_settings_once(mock_env: MockMacrosPlugin) -> None:
+    """Test that debug settings are resolved on the first call only"""
+    logger = DebugLogger.create_logger("link_card", mock_env)
+    mock_env.variables["extra"]["debug"]["link_card"] = False
+
+    assert DebugLogger.create_logger("link_card", mock_env) is logger
+    assert logger.enabled is True
+
+
+class StrCounter:
+    """Object counting how often it is converted to a string"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __str__(self) -> str:
+        self.calls += 1
+        return "counted"
+
+
+@pytest.mark.debug
+def test_log_lazy_callables(caplog: LogCaptureFixture) -> None:
+    """Test that callables are only evaluated when debug is enabled"""
+    calls = []
+
+    def message() -> str:
+        calls.append("message")
+        return "Lazy message"
+
+    def data() -> dict:
+        calls.append("data")
+        return {"key": "value"}
+
+    DebugLogger("test_module", enabled=False).log(message, data)
+    assert calls == []
+
+    DebugLogger("test_module", enabled=True).log(message, data)
+    assert calls == ["message", "data"]
+    assert caplog.records[0].message == "Lazy message"
+    assert "{'key': 'value'}" in caplog.records[1].message
+
+
+@pytest.mark.debug
+def test_logf_formats_only_when_enabled(caplog: LogCaptureFixture) -> None:
+    """Test that %-style arguments are formatted only when debug is enabled"""
+    counter = StrCounter()
+
+    DebugLogger("test_module", enabled=False).logf("Value: %s", counter)
+    assert counter.calls == 0
+    assert len(caplog.records) == 0
+
+    DebugLogger("test_module", enabled=True).logf("Value: %s", counter)
+    assert counter.calls > 0
+    assert caplog.records[0].message == "Value: counted"
@@ -2,13 +2,22 @@
 Tests for Gist codeblock module in MkDocs Macros Utils
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Optional, Tuple, Type, cast
+import json
+import threading
 from pytest import MonkeyPatch
 from pytest_mock import MockerFixture
 import requests
-from mkdocs_macros_utils.gist_codeblock import GistProcessor
+from mkdocs_macros_utils.cache import ResponseCache
+from mkdocs_macros_utils.gist_codeblock import (
+    GistProcessor,
+    RESOLVER_API,
+    create_processor,
+    define_env,
+)
 from mkdocs_macros_utils.debug_logger import DebugLogger
-from tests.python import MockMacrosPlugin
+from tests.python import MockMacrosPlugin, StubServer, mock_requests_get
 
 
 # -- Language Detection Tests ------------------------------
@@ -81,7 +90,7 @@ def test_get_gist_info_success(
 ) -> None:
     """Test successful Gist URL processing"""
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "get",
         lambda *args, **kwargs: mock_response(
             '<a href="/user/123456/raw/file.py">Raw</a>'
@@ -119,7 +128,9 @@ def test_get_gist_info_error_cases(
     for response_args, url, expected_error in test_cases:
         if response_args is not None:
             monkeypatch.setattr(
-                requests, "get", lambda *args, **kwargs: mock_response(*response_args)
+                requests.Session,
+                "get",
+                lambda *args, **kwargs: mock_response(*response_args),
             )
 
         raw_url, filename, error = processor.get_gist_info(url)
@@ -136,7 +147,7 @@ def test_get_gist_info_request_exception(
     def mock_get(*args: Any, **kwargs: Any) -> None:
         raise requests.RequestException("Connection error")
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     raw_url, filename, error = processor.get_gist_info(
         "https://gist.github.com/user/123456"
     )
@@ -158,7 +169,9 @@ def test_fetch_gist_content_cases(
 
     for response_args, expected_content, expected_error in test_cases:
         monkeypatch.setattr(
-            requests, "get", lambda *args, **kwargs: mock_response(*response_args)
+            requests.Session,
+            "get",
+            lambda *args, **kwargs: mock_response(*response_args),
         )
 
         content, error = processor.fetch_gist_content("https://test.url")
@@ -176,13 +189,289 @@ def test_fetch_gist_content_request_exception(
     def mock_get(*args: Any, **kwargs: Any) -> None:
         raise requests.RequestException("Connection timeout")
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     content, error = processor.fetch_gist_content("https://test.url")
 
     assert content is None
     assert "Error fetching Gist content: Connection timeout" in str(error)
 
 
+# -- Response Cache Tests ------------------------------
+def test_gist_processor_uses_response_cache(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    response_cache: ResponseCache,
+    mock_response: Type[Any],
+) -> None:
+    """Test that a warm cache resolves a Gist without network access"""
+    responses = [
+        mock_response('<a href="/user/123/raw/test.py">Raw</a>'),
+        mock_response("print('cached')"),
+    ]
+    monkeypatch.setattr(requests.Session, "get", mock_requests_get(responses))
+
+    cold = GistProcessor(mock_logger, response_cache)
+    raw_url, _, _ = cold.get_gist_info("https://gist.github.com/user/123")
+    assert raw_url is not None
+    cold.fetch_gist_content(raw_url)
+
+    def fail_get(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("network access on warm cache")
+
+    monkeypatch.setattr(requests.Session, "get", fail_get)
+    warm = GistProcessor(mock_logger, response_cache)
+    raw_url, filename, error = warm.get_gist_info("https://gist.github.com/user/123")
+    assert error is None
+    assert filename == "test.py"
+    assert raw_url == "https://gist.githubusercontent.com/user/123/raw/test.py"
+    assert warm.fetch_gist_content(raw_url) == ("print('cached')", None)
+
+
+def test_gist_processor_does_not_cache_errors(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    response_cache: ResponseCache,
+    mock_response: Type[Any],
+) -> None:
+    """Test that failed fetches are not stored in the cache"""
+    monkeypatch.setattr(
+        requests.Session, "get", lambda *args, **kwargs: mock_response("", 500)
+    )
+    processor = GistProcessor(mock_logger, response_cache)
+    processor.fetch_gist_content("https://test.url")
+
+    assert response_cache.get("https://test.url") is None
+
+
+def test_render_code_block_reuses_cached_output(
+    mocker: MockerFixture, mock_logger: DebugLogger, response_cache: ResponseCache
+) -> None:
+    """Test that unchanged content skips re-processing"""
+    processor = GistProcessor(mock_logger, response_cache)
+    first = processor.render_code_block("x = 1", "test.py", indent=1)
+
+    detect = mocker.spy(processor, "detect_language_from_content")
+    second = processor.render_code_block("x = 1", "test.py", indent=1)
+
+    assert second == first
+    assert "    ```python" in second
+    detect.assert_not_called()
+
+
+# -- Gist API Resolution Tests ------------------------------
+def gist_api_payload(stub_server: StubServer, truncated: bool = False) -> str:
+    """Build a Gist API response with two files"""
+    return json.dumps(
+        {
+            "id": "abc123",
+            "files": {
+                "main.py": {
+                    "filename": "main.py",
+                    "language": "Python",
+                    "raw_url": f"{stub_server.url}/raw/main.py",
+                    "truncated": truncated,
+                    "content": "print('api')",
+                },
+                "util.sh": {
+                    "filename": "util.sh",
+                    "language": "Shell",
+                    "raw_url": f"{stub_server.url}/raw/util.sh",
+                    "truncated": False,
+                    "content": "echo util",
+                },
+            },
+        }
+    )
+
+
+def test_get_gist_info_from_api(
+    stub_server: StubServer, mock_logger: DebugLogger
+) -> None:
+    """Test that one API request resolves both the raw URL and the content"""
+    stub_server.add("/gists/abc123", gist_api_payload(stub_server))
+    processor = GistProcessor(
+        mock_logger, resolver=RESOLVER_API, api_url=stub_server.url
+    )
+
+    raw_url, filename, error = processor.get_gist_info(
+        "https://gist.github.com/user/abc123"
+    )
+    content, fetch_error = processor.fetch_gist_content(str(raw_url))
+
+    assert error is None
+    assert fetch_error is None
+    assert filename == "main.py"
+    assert raw_url == f"{stub_server.url}/raw/main.py"
+    assert content == "print('api')"
+    assert stub_server.requests == ["/gists/abc123"]
+
+
+def test_get_gist_info_from_api_truncated(
+    stub_server: StubServer, mock_logger: DebugLogger
+) -> None:
+    """Test that truncated files are fetched from their raw URL"""
+    stub_server.add("/gists/abc123", gist_api_payload(stub_server, truncated=True))
+    stub_server.add("/raw/main.py", "print('full')")
+    processor = GistProcessor(
+        mock_logger, resolver=RESOLVER_API, api_url=stub_server.url
+    )
+
+    raw_url, _, _ = processor.get_gist_info("https://gist.github.com/user/abc123")
+    content, _ = processor.fetch_gist_content(str(raw_url))
+
+    assert content == "print('full')"
+    assert stub_server.requests == ["/gists/abc123", "/raw/main.py"]
+
+
+def test_get_gist_info_from_api_errors(
+    stub_server: StubServer, mock_logger: DebugLogger
+) -> None:
+    """Test API error handling"""
+    stub_server.add("/gists/abc123", "not json")
+    stub_server.add("/gists/def456", json.dumps({"files": {}}))
+    processor = GistProcessor(
+        mock_logger, resolver=RESOLVER_API, api_url=stub_server.url
+    )
+
+    test_cases = [
+        ("https://gist.github.com/user/abc123", "Invalid Gist API response"),
+        ("https://gist.github.com/user/def456", "Could not find raw file URL in Gist"),
+        ("https://gist.github.com/user/fff", "Failed to fetch Gist: HTTP 404"),
+    ]
+    for url, expected_error in test_cases:
+        raw_url, filename, error = processor.get_gist_info(url)
+        assert error == expected_error
+        assert raw_url is None
+        assert filename is None
+
+
+def test_create_processor_from_settings(monkeypatch: MonkeyPatch) -> None:
+    """Test processor configuration from extra.macros_utils.gist"""
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    env = MockMacrosPlugin(
+        debug_settings={
+            "extra": {
+                "macros_utils": {
+                    "gist": {
+                        "resolver": "api",
+                        "api_url": "http://stub/",
+                        "lexer_sample_size": 4096,
+                        "max_content_size": 2048,
+                    }
+                }
+            }
+        }
+    )
+
+    processor = create_processor(env)
+
+    assert processor.resolver == RESOLVER_API
+    assert processor.api_url == "http://stub"
+    assert processor.api_token == "secret"
+    assert processor.lexer_sample_size == 4096
+    assert processor.max_content_size == 2048
+
+
+# -- Multi-file Gist Tests ------------------------------
+MULTI_FILE_PAGE = (
+    '<a href="/user/123/raw/rev/main.py">Raw</a>'
+    '<a href="/user/123/raw/rev/util.sh">Raw</a>'
+    '<a href="/user/123/raw/rev/main.py">Raw</a>'
+)
+
+
+def test_get_gist_files_from_page(
+    monkeypatch: MonkeyPatch, processor: GistProcessor, mock_response: Type[Any]
+) -> None:
+    """Test that all files are listed once, in page order"""
+    monkeypatch.setattr(
+        requests.Session, "get", mock_requests_get([mock_response(MULTI_FILE_PAGE)])
+    )
+
+    files, error = processor.get_gist_files("https://gist.github.com/user/123")
+
+    assert error is None
+    assert [f.filename for f in files] == ["main.py", "util.sh"]
+    assert files[1].raw_url == (
+        "https://gist.githubusercontent.com/user/123/raw/rev/util.sh"
+    )
+
+
+def test_get_gist_info_by_filename_uses_one_fetch(
+    monkeypatch: MonkeyPatch, processor: GistProcessor, mock_response: Type[Any]
+) -> None:
+    """Test that selecting several files reuses the same manifest"""
+    # Only one response is available, a second page fetch would fail
+    monkeypatch.setattr(
+        requests.Session, "get", mock_requests_get([mock_response(MULTI_FILE_PAGE)])
+    )
+    url = "https://gist.github.com/user/123"
+
+    _, first, _ = processor.get_gist_info(url)
+    _, second, _ = processor.get_gist_info(url, "util.sh")
+    raw_url, missing, error = processor.get_gist_info(url, "missing.txt")
+
+    assert first == "main.py"
+    assert second == "util.sh"
+    assert raw_url is None
+    assert missing is None
+    assert error == "File not found in Gist: missing.txt"
+
+
+def test_gist_codeblock_file_option(
+    monkeypatch: MonkeyPatch, env: MockMacrosPlugin, mock_response: Type[Any]
+) -> None:
+    """Test rendering a specific file of a Gist"""
+    responses = [mock_response(MULTI_FILE_PAGE), mock_response("echo util")]
+    monkeypatch.setattr(requests.Session, "get", mock_requests_get(responses))
+
+    result = cast(Any, env).gist_codeblock(
+        "https://gist.github.com/user/123", file="util.sh"
+    )
+
+    assert "```bash" in result
+    assert "echo util" in result
+
+
+def test_gist_codeblock_all_files(
+    monkeypatch: MonkeyPatch, env: MockMacrosPlugin, mock_response: Type[Any]
+) -> None:
+    """Test rendering every file of a Gist with titles"""
+    responses = [
+        mock_response(MULTI_FILE_PAGE),
+        mock_response("print('main')"),
+        mock_response("echo util"),
+    ]
+    monkeypatch.setattr(requests.Session, "get", mock_requests_get(responses))
+
+    result = cast(Any, env).gist_codeblock(
+        "https://gist.github.com/user/123", indent=1, all_files=True
+    )
+    lines = result.splitlines()
+
+    assert '    ```python title="main.py"' in lines
+    assert "    print('main')" in lines
+    assert '    ```bash title="util.sh"' in lines
+    assert "    echo util" in lines
+
+
+def test_gist_codeblock_all_files_error(
+    monkeypatch: MonkeyPatch, env: MockMacrosPlugin, mock_response: Type[Any]
+) -> None:
+    """Test error reporting in all-files mode"""
+    responses = [mock_response(MULTI_FILE_PAGE), mock_response("", 404)]
+    monkeypatch.setattr(requests.Session, "get", mock_requests_get(responses))
+    casted_env = cast(Any, env)
+
+    result = casted_env.gist_codeblock(
+        "https://gist.github.com/user/123", all_files=True
+    )
+    assert result == "Error: Failed to fetch Gist content: HTTP 404"
+
+    result = casted_env.gist_codeblock("https://invalid.url", all_files=True)
+    assert result == "Error: Invalid Gist URL format"
+
+
 # -- Language Detection with Lexer Tests ------------------------------
 def test_detect_language_from_content_with_lexer(mocker: MockerFixture) -> None:
     """Test language detection using lexer with aliases"""
@@ -192,9 +481,7 @@ def test_detect_language_from_content_with_lexer(mocker: MockerFixture) -> None:
     mock_lexer = mocker.Mock(spec=["aliases", "name"])
     mock_lexer.aliases = ["python"]
     mock_lexer.name = "Python"
-    mocker.patch(
-        "mkdocs_macros_utils.gist_codeblock.guess_lexer", return_value=mock_lexer
-    )
+    mocker.patch("pygments.lexers.guess_lexer", return_value=mock_lexer)
     mocker.patch("mkdocs_macros_utils.gist_codeblock.isinstance", return_value=False)
 
     result = processor.detect_language_from_content("print('test')", filename=None)
@@ -207,7 +494,7 @@ def test_detect_language_from_content_exception_handling(mocker: MockerFixture)
     processor = GistProcessor(logger)
 
     mocker.patch(
-        "mkdocs_macros_utils.gist_codeblock.guess_lexer",
+        "pygments.lexers.guess_lexer",
         side_effect=Exception("Test error"),
     )
 
@@ -215,6 +502,44 @@ def test_detect_language_from_content_exception_handling(mocker: MockerFixture)
     assert result == "text"
 
 
+def test_detect_language_memoized(
+    mocker: MockerFixture, mock_logger: DebugLogger, response_cache: ResponseCache
+) -> None:
+    """Test that guessed languages are memoized and persisted by content hash"""
+    guess = mocker.patch(
+        "mkdocs_macros_utils.gist_codeblock.GistProcessor.guess_language",
+        return_value="python",
+    )
+    processor = GistProcessor(mock_logger, response_cache)
+
+    assert processor.detect_language_from_content("print('a')") == "python"
+    assert processor.detect_language_from_content("print('a')") == "python"
+    assert guess.call_count == 1
+
+    # A new processor reads the language back from the cache
+    other = GistProcessor(mock_logger, ResponseCache(response_cache.cache_dir))
+    assert other.detect_language_from_content("print('a')") == "python"
+    assert guess.call_count == 1
+
+
+def test_detect_language_bounded_sample(
+    mocker: MockerFixture, mock_logger: DebugLogger
+) -> None:
+    """Test that only the configured prefix is passed to the lexer guess"""
+    guess = mocker.patch(
+        "mkdocs_macros_utils.gist_codeblock.GistProcessor.guess_language",
+        return_value="python",
+    )
+    processor = GistProcessor(mock_logger, lexer_sample_size=10)
+
+    processor.detect_language_from_content("import os\n" + "x = 1\n" * 1000)
+    guess.assert_called_once_with("import os\n")
+
+    # Files sharing the same prefix reuse the detected language
+    processor.detect_language_from_content("import os\n" + "y = 2\n" * 10)
+    assert guess.call_count == 1
+
+
 # -- Macro Integration Tests ------------------------------
 def test_gist_codeblock_macro_complete(
     monkeypatch: MonkeyPatch, env: MockMacrosPlugin, mock_response: Type[Any]
@@ -231,7 +556,7 @@ def test_gist_codeblock_macro_complete(
         current_response["index"] += 1
         return response
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     casted_env = cast(Any, env)
     result = casted_env.gist_codeblock("https://gist.github.com/user/123")
 
@@ -255,7 +580,7 @@ def test_gist_codeblock_with_options(
         current_response["index"] += 1
         return response
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     casted_env = cast(Any, env)
     result = casted_env.gist_codeblock(
         "https://gist.github.com/user/123", indent=1, ext="python"
@@ -310,7 +635,7 @@ def test_gist_codeblock_special_chars(
         current_response["index"] += 1
         return response
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     casted_env = cast(Any, env)
     result = casted_env.gist_codeblock("https://gist.github.com/user/123")
 
@@ -333,7 +658,7 @@ def test_gist_codeblock_multiline_content(
         current_response["index"] += 1
         return response
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     casted_env = cast(Any, env)
     result = casted_env.gist_codeblock("https://gist.github.com/user/123", indent=2)
 
@@ -353,7 +678,7 @@ def test_fetch_gist_content_failure_with_error(
     def mock_get(*args: Any, **kwargs: Any) -> Any:
         return mock_response("", status_code=500)
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     content, error = processor.fetch_gist_content("https://test.url")
 
     assert content is None
@@ -375,7 +700,7 @@ def test_gist_codeblock_content_fetch_error(
         current_response["index"] += 1
         return response
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     casted_env = cast(Any, env)
     result = casted_env.gist_codeblock("https://gist.github.com/user/123")
 
@@ -399,3 +724,163 @@ def test_gist_codeblock_fetch_content_returns_none(
     casted_env = cast(Any, env)
     result = casted_env.gist_codeblock("https://gist.github.com/user/123")
     assert result == "Error: Failed to fetch content"
+
+
+# -- Concurrent Resolution Tests ------------------------------
+def test_concurrent_requests_share_one_fetch(
+    monkeypatch: MonkeyPatch, processor: GistProcessor, mock_response: Type[Any]
+) -> None:
+    """Test that concurrent requests for a Gist share the page and raw fetches"""
+    fetched: List[str] = []
+    page_release = threading.Event()
+    raw_release = threading.Event()
+
+    def slow_get(self: Any, url: str, **kwargs: Any) -> Any:
+        fetched.append(url)
+        if url.endswith("main.py"):
+            raw_release.wait(5)
+            return mock_response("print('hello')")
+        page_release.wait(5)
+        return mock_response(MULTI_FILE_PAGE)
+
+    monkeypatch.setattr(requests.Session, "get", slow_get)
+    url = "https://gist.github.com/user/123"
+
+    def resolve() -> Optional[str]:
+        raw_url, _, _ = processor.get_gist_info(url)
+        content, _ = processor.fetch_gist_content(cast(str, raw_url))
+        return content
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(resolve) for _ in range(8)]
+        # Release the page, then the raw file, once all threads wait for them
+        flights = (
+            (page_release, processor.manifest_flights),
+            (raw_release, processor.content_flights),
+        )
+        for release, flight in flights:
+            while flight.coalesced < 7:
+                threading.Event().wait(0.001)
+            release.set()
+        contents = [future.result() for future in futures]
+
+    assert contents == ["print('hello')"] * 8
+    assert fetched == [
+        "https://gist.github.com/user/123",
+        "https://gist.githubusercontent.com/user/123/raw/rev/main.py",
+    ]
+
+
+# -- Size Limit Tests ------------------------------
+def test_limit_content(mock_logger: DebugLogger) -> None:
+    """Test that oversized content is cut after its last whole line"""
+    processor = GistProcessor(mock_logger, max_content_size=20)
+    url = "https://gist.githubusercontent.com/user/1/raw/a.py"
+
+    assert processor.limit_content(url, "short\n") == "short\n"
+    assert url not in processor.truncated_urls
+    assert processor.limit_content(url, "line 1\nline 2\nline 3\nline 4\n") == (
+        "line 1\nline 2"
+    )
+    assert url in processor.truncated_urls
+    # Multi-byte characters count in bytes
+    assert processor.limit_content(url, "é" * 15) == "é" * 10
+    # Content of an aborted download is cut whatever its length
+    partial_url = "https://gist.githubusercontent.com/user/1/raw/b.py"
+    assert processor.limit_content(partial_url, "a\nb", truncated=True) == "a"
+    assert partial_url in processor.truncated_urls
+
+    unlimited = GistProcessor(mock_logger, max_content_size=0)
+    assert unlimited.limit_content(url, "x" * 100) == "x" * 100
+
+
+def test_gist_codeblock_truncates_large_gist(
+    monkeypatch: MonkeyPatch, mock_response: Type[Any]
+) -> None:
+    """Test that a large Gist renders truncated with a link to the full Gist"""
+    content = "".join(f"print({i})\n" for i in range(1000))
+    monkeypatch.setattr(
+        requests.Session,
+        "get",
+        mock_requests_get(
+            [
+                mock_response('<a href="/user/123/raw/big.py">Raw</a>'),
+                mock_response(content),
+            ]
+        ),
+    )
+    env = MockMacrosPlugin(
+        debug_settings={"extra": {"macros_utils": {"gist": {"max_content_size": 1024}}}}
+    )
+    define_env(env)
+
+    result = cast(Any, env).gist_codeblock("https://gist.github.com/user/123", 1)
+
+    assert "    print(0)" in result
+    assert "print(999)" not in result
+    assert result.endswith(
+        "\n    *Truncated to the first 1 KiB. "
+        "[View the full Gist](https://gist.github.com/user/123)*\n"
+    )
+
+
+def test_larger_limit_refetches_truncated_content(
+    stub_server: StubServer, mock_logger: DebugLogger, response_cache: ResponseCache
+) -> None:
+    """Test that a build with a larger limit does not reuse a truncated body"""
+    content = "".join(f"print({i})\n" for i in range(1000))
+    stub_server.add("/raw/big.py", content)
+    raw_url = f"{stub_server.url}/raw/big.py"
+
+    small = GistProcessor(mock_logger, cache=response_cache, max_content_size=1024)
+    partial, _ = small.fetch_gist_content(raw_url)
+    assert partial is not None and len(partial) < 1024
+    assert raw_url in small.truncated_urls
+
+    large = GistProcessor(mock_logger, cache=response_cache, max_content_size=0)
+    full, _ = large.fetch_gist_content(raw_url)
+    assert full == content
+    assert raw_url not in large.truncated_urls
+    assert len(stub_server.requests) == 2
+
+
+def test_streamed_content_failure_is_reported(
+    monkeypatch: MonkeyPatch, mock_logger: DebugLogger, mock_response: Type[Any]
+) -> None:
+    """Test that a connection drop while streaming a file returns an error"""
+    response = mock_response("")
+
+    def iter_failing(chunk_size: int) -> Any:
+        yield b"print(1)\n"
+        raise requests.exceptions.ConnectionError("Read timed out")
+
+    response.iter_content = iter_failing
+    monkeypatch.setattr(requests.Session, "get", lambda *args, **kwargs: response)
+    processor = GistProcessor(mock_logger, max_content_size=1024)
+
+    content, error = processor.fetch_gist_content(
+        "https://gist.githubusercontent.com/user/1/raw/a.py"
+    )
+
+    assert content is None
+    assert error == "Error fetching Gist content: Read timed out"
+
+
+def test_inline_api_content_is_limited(
+    stub_server: StubServer, mock_logger: DebugLogger
+) -> None:
+    """Test that inline Gist API content is limited as well"""
+    stub_server.add("/gists/abc123", gist_api_payload(stub_server))
+    processor = GistProcessor(
+        mock_logger,
+        resolver=RESOLVER_API,
+        api_url=stub_server.url,
+        max_content_size=5,
+    )
+
+    raw_url, _, _ = processor.get_gist_info("https://gist.github.com/user/abc123")
+    content, error = processor.fetch_gist_content(str(raw_url))
+
+    assert error is None
+    assert content == "print"
+    assert raw_url in processor.truncated_urls
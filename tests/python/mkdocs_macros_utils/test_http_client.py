@@ -0,0 +1,290 @@
+"""
+Tests for the HTTP client module in MkDocs Macros Utils
+"""
+
+from typing import Any, Dict, List, Type
+import pytest
+from pytest import MonkeyPatch
+import requests
+from requests.adapters import HTTPAdapter
+from mkdocs_macros_utils import cache as cache_module
+from mkdocs_macros_utils import http_client
+from mkdocs_macros_utils.cache import ResponseCache
+from mkdocs_macros_utils.debug_logger import DebugLogger
+from mkdocs_macros_utils.http_client import cached_get
+from tests.python import MockMacrosPlugin, StubServer
+
+URL = "https://gist.githubusercontent.com/user/123/raw/test.py"
+
+
+@pytest.fixture
+def recorded_headers() -> List[Dict[str, str]]:
+    """List collecting request headers sent by the mocked requests.get"""
+    return []
+
+
+def patch_get(
+    monkeypatch: MonkeyPatch, response: Any, recorded: List[Dict[str, str]]
+) -> None:
+    """Patch requests.get to return response and record request headers"""
+
+    def mock_get(*args: Any, **kwargs: Any) -> Any:
+        recorded.append(kwargs.get("headers", {}))
+        return response
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+
+# -- Cache Behaviour Tests ------------------------------
+def test_cached_get_without_cache(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    mock_response: Type[Any],
+    recorded_headers: List[Dict[str, str]],
+) -> None:
+    """Test plain fetch when no cache is configured"""
+    patch_get(monkeypatch, mock_response("body"), recorded_headers)
+
+    result = cached_get(URL, None, mock_logger)
+    assert result.status_code == 200
+    assert result.text == "body"
+    assert result.from_cache is False
+
+
+def test_cached_get_stores_validators(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    response_cache: ResponseCache,
+    mock_response: Type[Any],
+    recorded_headers: List[Dict[str, str]],
+) -> None:
+    """Test that ETag and Last-Modified are stored with the body"""
+    headers = {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    patch_get(monkeypatch, mock_response("body", 200, headers), recorded_headers)
+
+    cached_get(URL, response_cache, mock_logger)
+
+    entry = response_cache.get(URL)
+    assert entry is not None
+    assert entry.etag == '"abc"'
+    assert entry.last_modified == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+def test_cached_get_fresh_entry_skips_network(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    response_cache: ResponseCache,
+    mock_response: Type[Any],
+    recorded_headers: List[Dict[str, str]],
+) -> None:
+    """Test that fresh entries are served without a request"""
+    response_cache.set(URL, "cached")
+    patch_get(monkeypatch, mock_response("fresh"), recorded_headers)
+
+    result = cached_get(URL, response_cache, mock_logger)
+    assert result.text == "cached"
+    assert result.from_cache is True
+    assert recorded_headers == []
+
+
+def test_cached_get_revalidates_with_304(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    response_cache: ResponseCache,
+    mock_response: Type[Any],
+    recorded_headers: List[Dict[str, str]],
+) -> None:
+    """Test conditional revalidation of an expired entry"""
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1000.0)
+    response_cache.set(URL, "cached", '"abc"', "Wed, 01 Jan 2025 00:00:00 GMT")
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1000.0 + 10**6)
+    patch_get(monkeypatch, mock_response("", 304), recorded_headers)
+
+    result = cached_get(URL, response_cache, mock_logger)
+
+    assert result.status_code == 200
+    assert result.text == "cached"
+    assert result.from_cache is True
+    assert recorded_headers == [
+        {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+    ]
+    # The entry is fresh again after revalidation
+    assert response_cache.get(URL) is not None
+
+
+def test_cached_get_replaces_modified_entry(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    response_cache: ResponseCache,
+    mock_response: Type[Any],
+    recorded_headers: List[Dict[str, str]],
+) -> None:
+    """Test that a changed resource replaces the expired entry"""
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1000.0)
+    response_cache.set(URL, "old", '"abc"')
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1000.0 + 10**6)
+    patch_get(
+        monkeypatch, mock_response("new", 200, {"ETag": '"def"'}), recorded_headers
+    )
+
+    result = cached_get(URL, response_cache, mock_logger)
+
+    assert result.text == "new"
+    assert result.from_cache is False
+    entry = response_cache.get(URL)
+    assert entry is not None
+    assert entry.body == "new"
+    assert entry.etag == '"def"'
+
+
+def test_cached_get_error_status(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    response_cache: ResponseCache,
+    mock_response: Type[Any],
+    recorded_headers: List[Dict[str, str]],
+) -> None:
+    """Test that error responses carry no body and are not cached"""
+    patch_get(monkeypatch, mock_response("Not Found", 404), recorded_headers)
+
+    result = cached_get(URL, response_cache, mock_logger)
+    assert result.status_code == 404
+    assert result.text is None
+    assert response_cache.get(URL) is None
+
+
+# -- Size Limit Tests ------------------------------
+def test_cached_get_aborts_oversized_download(
+    stub_server: StubServer, mock_logger: DebugLogger, response_cache: ResponseCache
+) -> None:
+    """Test that a streamed body over max_size is cut and marked truncated"""
+    stub_server.add("/big.txt", "é" * 100_000)
+    url = f"{stub_server.url}/big.txt"
+
+    result = cached_get(url, response_cache, mock_logger, max_size=1000)
+
+    assert result.truncated is True
+    assert result.text is not None
+    assert 1000 < len(result.text.encode("utf-8")) <= 1000 + 4
+    assert set(result.text) == {"é"}
+    entry = response_cache.get(url)
+    assert entry is not None
+    assert entry.body == result.text
+    assert entry.truncated is True
+
+
+def test_cached_get_refetches_truncated_entry(
+    stub_server: StubServer, mock_logger: DebugLogger, response_cache: ResponseCache
+) -> None:
+    """Test that a body truncated to a smaller limit is fetched again"""
+    stub_server.add("/big.txt", "x" * 5000)
+    url = f"{stub_server.url}/big.txt"
+    cached_get(url, response_cache, mock_logger, max_size=1000)
+
+    # The cached partial body still covers a smaller limit
+    result = cached_get(url, response_cache, mock_logger, max_size=500)
+    assert result.from_cache is True
+    assert result.truncated is True
+    assert len(stub_server.requests) == 1
+
+    # A larger limit (or none) needs the rest of the body
+    for max_size in (10_000, None):
+        result = cached_get(url, response_cache, mock_logger, max_size=max_size)
+        assert result.truncated is False
+        assert result.text == "x" * 5000
+    assert len(stub_server.requests) == 2
+    entry = response_cache.get(url)
+    assert entry is not None
+    assert entry.truncated is False
+
+
+def test_cached_get_within_max_size(
+    stub_server: StubServer, mock_logger: DebugLogger
+) -> None:
+    """Test that bodies within max_size are read whole"""
+    stub_server.add("/small.txt", "small body")
+
+    result = cached_get(f"{stub_server.url}/small.txt", None, mock_logger, max_size=10)
+
+    assert result.truncated is False
+    assert result.text == "small body"
+
+
+def test_cached_get_streamed_body_fails(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    mock_response: Type[Any],
+    response_cache: ResponseCache,
+) -> None:
+    """Test that a connection drop while streaming raises HttpRequestError"""
+    response = mock_response("")
+    closed: List[bool] = []
+
+    def iter_failing(chunk_size: int) -> Any:
+        yield b"partial"
+        raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+    response.iter_content = iter_failing
+    response.close = lambda: closed.append(True)
+    monkeypatch.setattr(requests.Session, "get", lambda *args, **kwargs: response)
+
+    with pytest.raises(http_client.HttpRequestError, match="Connection broken"):
+        cached_get(URL, response_cache, mock_logger, max_size=1000)
+    assert closed == [True]
+    assert response_cache.get(URL) is None
+
+
+# -- Shared Session Tests ------------------------------
+def test_get_session_is_shared() -> None:
+    """Test that the same session is reused for the same settings"""
+    session = http_client.get_session()
+    assert http_client.get_session() is session
+
+
+def test_get_session_pool_and_retry_settings() -> None:
+    """Test that the adapter is configured with pool size and retries"""
+    session = http_client.get_session(pool_size=4, max_retries=2, backoff_factor=1)
+
+    adapter = session.get_adapter("https://gist.github.com")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.backoff_factor == 1
+
+
+def test_configure_session_from_env() -> None:
+    """Test session configuration from extra.macros_utils.http"""
+    env = MockMacrosPlugin(
+        debug_settings={
+            "extra": {"macros_utils": {"http": {"pool_size": 3, "max_retries": 0}}}
+        }
+    )
+    old_session = http_client.get_session()
+
+    http_client.configure_session(env)
+    # The session is only recreated when it is next used
+    assert http_client._session is old_session
+
+    session = http_client.get_configured_session()
+    assert session is not old_session
+    adapter = session.get_adapter("https://gist.github.com")
+    assert adapter.max_retries.total == 0  # type: ignore[attr-defined]
+
+
+def test_get_pool_stats() -> None:
+    """Test connection pool statistics of the shared session"""
+    session = http_client.get_session()
+    adapter = session.get_adapter("https://gist.github.com")
+    assert isinstance(adapter, HTTPAdapter)
+    adapter.poolmanager.connection_from_url("https://gist.github.com")
+
+    stats = http_client.get_pool_stats()
+
+    assert stats["https://gist.github.com"] == {
+        "connections": 0,
+        "requests": 0,
+        "idle": 10,
+    }
@@ -0,0 +1,61 @@
+"""
+Tests for the import time of MkDocs Macros Utils
+"""
+
+from pathlib import Path
+from typing import Dict
+import subprocess
+import sys
+
+# Startup budget of `import mkdocs_macros_utils` itself, in microseconds.
+# Generous enough for slow CI runners, but far below eager Pygments imports.
+IMPORT_TIME_BUDGET_US = 250_000
+
+# Dependencies already loaded by MkDocs and mkdocs-macros-plugin
+PRELOAD = "import mkdocs.config, mkdocs.structure.files, mkdocs_macros.plugin"
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def run_importtime(code: str) -> Dict[str, int]:
+    """Run code with `python -X importtime` and get cumulative times by module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+# -- Import Time Tests ------------------------------
+def test_import_does_not_load_pygments() -> None:
+    """Test that Pygments is only imported when a language is guessed"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{PRELOAD}; import sys, mkdocs_macros_utils; "
+            "print('pygments' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_import_time_budget() -> None:
+    """Test that importing the package stays within the startup budget"""
+    times = run_importtime(f"{PRELOAD}; import mkdocs_macros_utils")
+
+    assert "pygments.lexers" not in times
+    assert times["mkdocs_macros_utils"] < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,244 @@
+"""
+Tests for the incremental rebuild module in MkDocs Macros Utils
+"""
+
+from pathlib import Path
+from typing import Any, List, Type
+import json
+import pytest
+from pytest import MonkeyPatch
+import requests
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+from mkdocs_macros_utils import card_templates, incremental, link_card, x_twitter_card
+from mkdocs_macros_utils.incremental import DependencyTracker, track_macro
+from tests.python import MockMacrosPlugin
+
+GIST_URL = "https://gist.github.com/user/123"
+RAW_URL = "https://gist.githubusercontent.com/user/123/raw/abc/test.py"
+
+
+@pytest.fixture
+def tracker() -> DependencyTracker:
+    """Tracker started for a build"""
+    tracker = incremental.get_tracker()
+    tracker.start_build("config")
+    return tracker
+
+
+# -- Dependency Tracker Tests ------------------------------
+def test_unchanged_page_reuses_results(tracker: DependencyTracker) -> None:
+    """Test that macro results are reused when the page did not change"""
+    calls: List[str] = []
+
+    @track_macro
+    def macro(value: str) -> str:
+        calls.append(value)
+        return f"<p>{value}</p>"
+
+    assert tracker.begin_page("index.md", "v1") is False
+    assert macro("a") == "<p>a</p>"
+    tracker.end_page()
+
+    tracker.start_build("config")
+    assert tracker.begin_page("index.md", "v1") is True
+    assert macro("a") == "<p>a</p>"
+    tracker.end_page()
+    assert calls == ["a"]
+    assert (tracker.reused_pages, tracker.rendered_pages) == (1, 0)
+
+    # An edited page runs its macros again
+    tracker.begin_page("index.md", "v2")
+    macro("a")
+    tracker.end_page()
+    assert calls == ["a", "a"]
+
+
+def test_errors_are_not_reused(tracker: DependencyTracker) -> None:
+    """Test that error output is computed again on the next build"""
+    calls: List[str] = []
+
+    @track_macro
+    def macro() -> str:
+        calls.append("call")
+        return "Error: Request error"
+
+    for _ in range(2):
+        tracker.begin_page("index.md", "v1")
+        macro()
+        tracker.end_page()
+    assert len(calls) == 2
+
+
+def test_macro_outside_page_not_tracked(tracker: DependencyTracker) -> None:
+    """Test that macros called outside page rendering always run"""
+    calls: List[str] = []
+
+    @track_macro
+    def macro() -> str:
+        calls.append("call")
+        return "ok"
+
+    macro()
+    macro()
+    assert len(calls) == 2
+
+
+def test_configuration_change_forgets_pages(tracker: DependencyTracker) -> None:
+    """Test that a configuration change renders every page again"""
+    tracker.begin_page("index.md", "v1")
+    tracker.end_page()
+
+    tracker.start_build("other config")
+
+    assert tracker.begin_page("index.md", "v1") is False
+
+
+def test_template_override_change_forgets_pages(tmp_path: Path) -> None:
+    """Test that editing a card template override renders every page again"""
+    override = tmp_path / "overrides" / "macros-utils" / "link_card.html"
+    override.parent.mkdir(parents=True)
+    override.write_text("v1", encoding="utf-8")
+    env = MockMacrosPlugin(conf={"config_file_path": str(tmp_path / "mkdocs.yml")})
+
+    def configure() -> DependencyTracker:
+        card_templates.configure_templates(env)
+        return incremental.configure_tracker(env)
+
+    tracker = configure()
+    tracker.begin_page("index.md", "v1")
+    tracker.end_page()
+
+    assert configure().begin_page("index.md", "v1") is True
+    tracker.end_page()
+
+    override.write_text("version2", encoding="utf-8")
+    assert configure().begin_page("index.md", "v1") is False
+
+
+def test_results_marked_not_reusable(tracker: DependencyTracker) -> None:
+    """Test that results marked as not reusable are computed again"""
+    calls: List[str] = []
+
+    @track_macro
+    def macro(degraded: bool) -> str:
+        calls.append("call")
+        if degraded:
+            incremental.mark_not_reusable()
+        return "<p>card</p>"
+
+    for _ in range(2):
+        tracker.begin_page("index.md", "v1")
+        macro(True)
+        macro(False)
+        tracker.end_page()
+    assert len(calls) == 3
+
+
+# -- Degraded Card Tests ------------------------------
+def test_card_without_icon_rendered_again(
+    monkeypatch: MonkeyPatch, mock_response: Type[Any], tracker: DependencyTracker
+) -> None:
+    """Test that a link card whose icon failed to load is not reused"""
+    responses = [mock_response("", 503), mock_response("<svg></svg>")]
+    monkeypatch.setattr(
+        requests.Session, "get", lambda *args, **kwargs: responses.pop(0)
+    )
+    url = "https://blog.hatenablog.com/entry/1"
+
+    htmls = []
+    for _ in range(2):
+        env = MockMacrosPlugin()
+        link_card.define_env(env)
+        tracker.begin_page("index.md", "v1")
+        htmls.append(getattr(env, "link_card")(url, "Title"))
+        tracker.end_page()
+
+    assert "<svg" not in htmls[0]
+    assert "<svg" in htmls[1]
+
+
+def test_card_without_prerendered_post_rendered_again(
+    monkeypatch: MonkeyPatch,
+    mock_response: Type[Any],
+    tracker: DependencyTracker,
+    tmp_path: Path,
+) -> None:
+    """Test that an X/Twitter card whose oEmbed failed is not reused"""
+    responses = [
+        mock_response("", 503),
+        mock_response(json.dumps({"html": "<blockquote>Post</blockquote>"})),
+    ]
+    monkeypatch.setattr(
+        requests.Session, "get", lambda *args, **kwargs: responses.pop(0)
+    )
+    env = MockMacrosPlugin(
+        debug_settings={
+            "extra": {
+                "macros_utils": {
+                    "x_twitter_card": {
+                        "prerender": True,
+                        "oembed_cache_dir": str(tmp_path),
+                    }
+                }
+            }
+        }
+    )
+    x_twitter_card.define_env(env)
+
+    htmls = []
+    for _ in range(2):
+        tracker.begin_page("index.md", "v1")
+        htmls.append(getattr(env, "x_twitter_card")("https://x.com/user/status/1"))
+        tracker.end_page()
+
+    assert "Post" not in htmls[0]
+    assert "<blockquote>Post</blockquote>" in htmls[1]
+
+
+# -- Rebuild Tests ------------------------------
+def test_rebuild_only_reruns_edited_pages(
+    monkeypatch: MonkeyPatch, mock_response: Type[Any], tmp_path: Path
+) -> None:
+    """Test that rebuilding a site only fetches Gists of edited pages"""
+    requested: List[str] = []
+
+    def mock_get(session: Any, url: str, *args: Any, **kwargs: Any) -> Any:
+        requested.append(url)
+        if url == GIST_URL:
+            return mock_response('<a href="/user/123/raw/abc/test.py">Raw</a>')
+        return mock_response("print('hello')")
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    page = docs_dir / "index.md"
+    page.write_text(f'{{{{ gist_codeblock("{GIST_URL}") }}}}\n', encoding="utf-8")
+    (docs_dir / "other.md").write_text("# Other\n", encoding="utf-8")
+    config_file = tmp_path / "mkdocs.yml"
+    config_file.write_text(
+        "site_name: Test\n"
+        "plugins:\n"
+        "  - macros:\n"
+        "      modules: [mkdocs_macros_utils]\n",
+        encoding="utf-8",
+    )
+
+    def rebuild() -> None:
+        build(load_config(config_file=str(config_file)))
+
+    rebuild()
+    assert requested == [GIST_URL, RAW_URL]
+    assert "print" in (tmp_path / "site" / "index.html").read_text(encoding="utf-8")
+
+    rebuild()
+    assert len(requested) == 2
+    assert incremental.get_tracker().reused_pages == 2
+
+    page.write_text(
+        f'# Edited\n\n{{{{ gist_codeblock("{GIST_URL}") }}}}\n', encoding="utf-8"
+    )
+    rebuild()
+    assert len(requested) == 4
+    assert incremental.get_tracker().rendered_pages == 1
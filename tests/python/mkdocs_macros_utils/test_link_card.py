@@ -4,18 +4,20 @@ This module tests the functionality for creating and managing link cards,
 including URL processing, SVG content retrieval, and card generation.
 """
 
-from typing import Any, cast, Optional
+from typing import Any, cast, Optional, Type
 import pytest
 from pytest import MonkeyPatch
 import requests
 from mkdocs_macros_utils.link_card import (
     get_gist_content,
+    get_icon_registry,
     get_svg_content,
     extract_domain_for_display,
     clean_url,
     create_link_card,
     define_env,
 )
+from mkdocs_macros_utils.cache import ResponseCache
 from mkdocs_macros_utils.debug_logger import DebugLogger
 from tests.python import MockMacrosPlugin
 
@@ -32,7 +34,7 @@ def test_get_gist_content_success(
         response._content = b"Test content"
         return response
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
     result = get_gist_content("testuser", "testgist", "testfile.txt", mock_logger)
     assert result == "Test content"
@@ -48,7 +50,7 @@ def test_get_gist_content_failure(
         response.status_code = 404
         return response
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
     result = get_gist_content("testuser", "testgist", "testfile.txt", mock_logger)
     assert result is None
@@ -62,7 +64,7 @@ def test_get_gist_content_exception(
     def mock_get(*args: Any, **kwargs: Any) -> None:
         raise requests.RequestException("Network error")
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
     result = get_gist_content("testuser", "testgist", "testfile.txt", mock_logger)
     assert result is None
@@ -73,7 +75,11 @@ def test_get_svg_content(monkeypatch: MonkeyPatch, mock_logger: DebugLogger) ->
     """Test SVG content retrieval for different domains"""
 
     def mock_get_gist_content(
-        user_id: str, gist_id: str, filename: str, logger: DebugLogger
+        user_id: str,
+        gist_id: str,
+        filename: str,
+        logger: DebugLogger,
+        cache: Optional[ResponseCache] = None,
     ) -> str:
         return "<svg>Test</svg>"
 
@@ -83,7 +89,9 @@ def test_get_svg_content(monkeypatch: MonkeyPatch, mock_logger: DebugLogger) ->
 
     # Test different domain types
     github_result = get_svg_content("https://github.com/test", mock_logger)
-    assert github_result == "<svg>Test</svg>"
+    assert github_result is not None
+    assert github_result.startswith("<svg")
+    assert 'fill="#333"' in github_result
 
     hatena_result = get_svg_content("https://hatenablog.com/test", mock_logger)
     assert hatena_result == "<svg>Test</svg>"
@@ -92,6 +100,76 @@ def test_get_svg_content(monkeypatch: MonkeyPatch, mock_logger: DebugLogger) ->
     assert unknown_result is None
 
 
+def test_get_svg_content_bundled_icon_without_network(
+    monkeypatch: MonkeyPatch, mock_logger: DebugLogger
+) -> None:
+    """Test that the default GitHub icon is served from the package"""
+
+    def mock_get(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Network access for a bundled icon")
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    for url in ["https://github.com/a", "https://gist.github.com/b"]:
+        result = get_svg_content(url, mock_logger)
+        assert result is not None and result.startswith("<svg")
+
+    # Domains are matched on the host name only
+    assert get_svg_content("https://example.com/?ref=github.com", mock_logger) is None
+
+
+def test_get_svg_content_gist_icon_fetched_once(
+    monkeypatch: MonkeyPatch, mock_logger: DebugLogger
+) -> None:
+    """Test that a Gist icon is fetched once for many cards"""
+    calls = []
+
+    def mock_get_gist_content(*args: Any, **kwargs: Any) -> str:
+        calls.append(args[:3])
+        return "<svg>Hatena</svg>"
+
+    monkeypatch.setattr(
+        "mkdocs_macros_utils.link_card.get_gist_content", mock_get_gist_content
+    )
+
+    for _ in range(30):
+        assert (
+            get_svg_content("https://user.hatenablog.com/entry", mock_logger)
+            == "<svg>Hatena</svg>"
+        )
+    assert len(calls) == 1
+
+    # A new build fetches the icon again
+    define_env(MockMacrosPlugin())
+    get_svg_content("https://user.hatenablog.com/entry", mock_logger)
+    assert len(calls) == 2
+
+
+def test_get_icon_registry_from_settings(mock_logger: DebugLogger) -> None:
+    """Test icon registry configuration from extra.macros_utils.link_card"""
+    env = MockMacrosPlugin(
+        debug_settings={
+            "extra": {
+                "macros_utils": {
+                    "link_card": {
+                        "icons": {
+                            "gitlab.com": "user/gist/gitlab.svg",
+                            "github.com": "",
+                        }
+                    }
+                }
+            }
+        }
+    )
+
+    icons = get_icon_registry(env)
+
+    assert icons["gitlab.com"] == "user/gist/gitlab.svg"
+    assert "github.com" not in icons
+    assert "hatenablog.com" in icons
+    assert get_svg_content("https://github.com/a", mock_logger, icons=icons) is None
+
+
 # -- Domain Extraction Tests ------------------------------
 def test_extract_domain_for_display() -> None:
     """Test domain extraction from various URL formats"""
@@ -287,8 +365,13 @@ def test_define_env() -> None:
     assert hasattr(mock_env, "link_card")
 
 
-def test_link_card_macro(mock_env: MockMacrosPlugin) -> None:
+def test_link_card_macro(
+    monkeypatch: MonkeyPatch, mock_env: MockMacrosPlugin, mock_response: Type[Any]
+) -> None:
     """Test the link_card macro functionality"""
+    monkeypatch.setattr(
+        requests.Session, "get", lambda *args, **kwargs: mock_response("", 404)
+    )
     define_env(mock_env)
 
     # Type cast to tell mypy that the attribute exists after define_env
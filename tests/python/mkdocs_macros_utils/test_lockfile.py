@@ -0,0 +1,295 @@
+"""
+Tests for the offline lockfile module in MkDocs Macros Utils
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Type
+import json
+import pytest
+from pytest import MonkeyPatch
+import requests
+from mkdocs_macros_utils import lockfile
+from mkdocs_macros_utils.debug_logger import DebugLogger
+from mkdocs_macros_utils.gist_codeblock import GistProcessor
+from mkdocs_macros_utils.http_client import cached_get
+from mkdocs_macros_utils.link_card import get_gist_content
+from mkdocs_macros_utils.lockfile import (
+    MODE_RECORD,
+    OfflineResourceError,
+    RemoteLock,
+    configure_lock,
+    get_active_lock,
+    set_active_lock,
+)
+from tests.python import MockMacrosPlugin
+
+URL = "https://gist.githubusercontent.com/user/123/raw/test.py"
+
+
+@pytest.fixture
+def recorded_lock(tmp_path: Path) -> RemoteLock:
+    """Lock saved with a single recorded resource"""
+    lock = RemoteLock(tmp_path / "lock.json", tmp_path / "blobs", mode=MODE_RECORD)
+    lock.record(URL, "print('hello')")
+    lock.save()
+    return lock
+
+
+def offline_lock(recorded_lock: RemoteLock) -> RemoteLock:
+    """Load an offline lock from the files written by recorded_lock"""
+    return RemoteLock(recorded_lock.lock_path, recorded_lock.blob_dir).load()
+
+
+def forbid_network(monkeypatch: MonkeyPatch) -> None:
+    """Make any HTTP request fail the test"""
+
+    def mock_get(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("Network access in offline mode")
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+
+# -- Lockfile Tests ------------------------------
+def test_save_and_lookup(recorded_lock: RemoteLock) -> None:
+    """Test that recorded content is served back by an offline lock"""
+    data = json.loads(recorded_lock.lock_path.read_text(encoding="utf-8"))
+    assert data["version"] == 1
+    digest = data["resources"][URL]["sha256"]
+    assert (recorded_lock.blob_dir / digest).exists()
+
+    assert offline_lock(recorded_lock).lookup(URL) == "print('hello')"
+
+
+def test_lookup_missing_url(recorded_lock: RemoteLock) -> None:
+    """Test that unknown URLs fail fast"""
+    with pytest.raises(OfflineResourceError, match="not in lockfile"):
+        offline_lock(recorded_lock).lookup("https://example.com/missing")
+
+
+def test_lookup_missing_blob(recorded_lock: RemoteLock) -> None:
+    """Test that a deleted blob is reported"""
+    for blob in recorded_lock.blob_dir.iterdir():
+        blob.unlink()
+
+    with pytest.raises(OfflineResourceError, match="Locked content missing"):
+        offline_lock(recorded_lock).lookup(URL)
+
+
+def test_lookup_hash_mismatch(recorded_lock: RemoteLock) -> None:
+    """Test that tampered blobs are rejected"""
+    for blob in recorded_lock.blob_dir.iterdir():
+        blob.write_text("tampered", encoding="utf-8")
+
+    with pytest.raises(OfflineResourceError, match="does not match"):
+        offline_lock(recorded_lock).lookup(URL)
+
+
+def test_save_prunes_orphan_blobs(recorded_lock: RemoteLock) -> None:
+    """Test that blobs of resources no longer used are removed"""
+    lock = RemoteLock(recorded_lock.lock_path, recorded_lock.blob_dir, mode=MODE_RECORD)
+    lock.record("https://example.com/other", "other")
+    assert lock.save() == 1
+
+    assert len(list(recorded_lock.blob_dir.iterdir())) == 1
+    assert URL not in offline_lock(recorded_lock).resources
+
+
+def test_save_marks_truncated(recorded_lock: RemoteLock) -> None:
+    """Test that content cut short by a size limit is marked in the lockfile"""
+    partial_url = "https://gist.githubusercontent.com/user/123/raw/big.py"
+    recorded_lock.record(partial_url, "print(1)\npri", truncated=True)
+    recorded_lock.save()
+
+    data = json.loads(recorded_lock.lock_path.read_text(encoding="utf-8"))
+    assert data["resources"][partial_url]["truncated"] is True
+    assert "truncated" not in data["resources"][URL]
+    lock = offline_lock(recorded_lock)
+    assert lock.is_truncated(partial_url) is True
+    assert lock.is_truncated(URL) is False
+
+
+def test_record_ignored_offline(tmp_path: Path) -> None:
+    """Test that an offline lock does not record content"""
+    lock = RemoteLock(tmp_path / "lock.json", tmp_path / "blobs")
+    lock.record(URL, "body")
+    assert lock.save() == 0
+
+
+# -- Configuration Tests ------------------------------
+def test_configure_lock_disabled() -> None:
+    """Test that no lock is active without offline settings"""
+    assert configure_lock(MockMacrosPlugin()) is None
+    assert get_active_lock() is None
+
+
+def test_configure_lock_from_env(recorded_lock: RemoteLock) -> None:
+    """Test offline lock configuration from extra.macros_utils.offline"""
+    env = MockMacrosPlugin(
+        debug_settings={
+            "extra": {
+                "macros_utils": {
+                    "offline": {
+                        "enabled": True,
+                        "lockfile": str(recorded_lock.lock_path),
+                        "blob_dir": str(recorded_lock.blob_dir),
+                    }
+                }
+            }
+        }
+    )
+
+    lock = configure_lock(env)
+
+    assert lock is get_active_lock()
+    assert lock is not None and lock.offline
+    assert URL in lock.resources
+
+
+def test_configure_lock_relative_to_config_file(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that lock paths are resolved against the directory of mkdocs.yml"""
+    site_dir = tmp_path / "sub"
+    lock = RemoteLock(site_dir / "lock.json", site_dir / "blobs", mode=MODE_RECORD)
+    lock.record(URL, "print('hello')")
+    lock.save()
+    env = MockMacrosPlugin(
+        conf={"config_file_path": str(site_dir / "mkdocs.yml")},
+        debug_settings={
+            "extra": {
+                "macros_utils": {
+                    "offline": {
+                        "enabled": True,
+                        "lockfile": "lock.json",
+                        "blob_dir": "blobs",
+                    }
+                }
+            }
+        },
+    )
+    monkeypatch.chdir(tmp_path)
+
+    configured = configure_lock(env)
+
+    assert configured is not None
+    assert configured.lock_path == site_dir / "lock.json"
+    assert configured.lookup(URL) == "print('hello')"
+
+
+def test_configure_lock_keeps_record_mode(tmp_path: Path) -> None:
+    """Test that the refresh command's record lock is not replaced"""
+    lock = RemoteLock(tmp_path / "lock.json", tmp_path / "blobs", mode=MODE_RECORD)
+    set_active_lock(lock)
+
+    assert configure_lock(MockMacrosPlugin()) is lock
+
+
+# -- Fetch Integration Tests ------------------------------
+def test_cached_get_offline(
+    monkeypatch: MonkeyPatch, mock_logger: DebugLogger, recorded_lock: RemoteLock
+) -> None:
+    """Test that offline fetches are served from the lockfile only"""
+    forbid_network(monkeypatch)
+    set_active_lock(offline_lock(recorded_lock))
+
+    result = cached_get(URL, None, mock_logger)
+    assert result.text == "print('hello')"
+    assert result.from_cache is True
+    assert result.truncated is False
+
+    with pytest.raises(OfflineResourceError):
+        cached_get("https://example.com/missing", None, mock_logger)
+
+
+def test_cached_get_records(
+    monkeypatch: MonkeyPatch,
+    mock_logger: DebugLogger,
+    mock_response: Type[Any],
+    tmp_path: Path,
+) -> None:
+    """Test that successful fetches are recorded in record mode"""
+    monkeypatch.setattr(
+        requests.Session, "get", lambda *args, **kwargs: mock_response("body")
+    )
+    lock = RemoteLock(tmp_path / "lock.json", tmp_path / "blobs", mode=MODE_RECORD)
+    set_active_lock(lock)
+
+    cached_get(URL, None, mock_logger)
+
+    assert lock.save() == 1
+    assert offline_lock(lock).lookup(URL) == "body"
+
+
+def test_gist_page_offline(
+    monkeypatch: MonkeyPatch, mock_logger: DebugLogger, tmp_path: Path
+) -> None:
+    """Test that Gist page resolution is served from the lockfile"""
+    page_url = "https://gist.github.com/user/123"
+    lock = RemoteLock(tmp_path / "lock.json", tmp_path / "blobs", mode=MODE_RECORD)
+    lock.record(page_url, "/user/123/raw/abc/test.py")
+    lock.save()
+    forbid_network(monkeypatch)
+    set_active_lock(offline_lock(lock))
+
+    files, error = GistProcessor(mock_logger).get_gist_files(page_url)
+
+    assert error is None
+    assert [f.raw_url for f in files] == [
+        "https://gist.githubusercontent.com/user/123/raw/abc/test.py"
+    ]
+
+
+def test_link_card_icon_offline(
+    monkeypatch: MonkeyPatch, mock_logger: DebugLogger, recorded_lock: RemoteLock
+) -> None:
+    """Test that a link card icon missing from the lockfile fails the build"""
+    forbid_network(monkeypatch)
+    set_active_lock(offline_lock(recorded_lock))
+
+    with pytest.raises(OfflineResourceError, match="not in lockfile"):
+        get_gist_content("user", "456", "icon.svg", mock_logger)
+
+
+# -- Refresh Command Tests ------------------------------
+def test_refresh_records_site_resources(
+    monkeypatch: MonkeyPatch, mock_response: Type[Any], tmp_path: Path
+) -> None:
+    """Test that refresh builds the site and locks every fetched resource"""
+    page_url = "https://gist.github.com/user/123"
+    raw_url = "https://gist.githubusercontent.com/user/123/raw/abc/test.py"
+    responses: Dict[str, Any] = {
+        page_url: mock_response('<a href="/user/123/raw/abc/test.py">Raw</a>'),
+        raw_url: mock_response("print('hello')"),
+    }
+    requested: List[str] = []
+
+    def mock_get(session: Any, url: str, *args: Any, **kwargs: Any) -> Any:
+        requested.append(url)
+        return responses.get(url, mock_response("", 404))
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "index.md").write_text(
+        f'{{{{ gist_codeblock("{page_url}") }}}}\n', encoding="utf-8"
+    )
+    config_file = tmp_path / "mkdocs.yml"
+    config_file.write_text(
+        "site_name: Test\n"
+        "plugins:\n"
+        "  - macros:\n"
+        "      modules: [mkdocs_macros_utils]\n",
+        encoding="utf-8",
+    )
+    # The lock is written next to mkdocs.yml, not in the working directory
+    monkeypatch.chdir(docs_dir)
+
+    assert lockfile.refresh(str(config_file)) == 2
+    assert get_active_lock() is None
+
+    lock = RemoteLock(
+        tmp_path / lockfile.DEFAULT_LOCKFILE, tmp_path / lockfile.DEFAULT_BLOB_DIR
+    ).load()
+    assert lock.lookup(raw_url) == "print('hello')"
+    assert page_url in requested
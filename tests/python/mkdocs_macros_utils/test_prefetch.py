@@ -0,0 +1,131 @@
+"""
+Tests for the prefetch module in MkDocs Macros Utils
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Type
+from pytest import MonkeyPatch
+import requests
+from mkdocs_macros_utils.cache import get_response_cache
+from mkdocs_macros_utils.gist_codeblock import define_env as define_gist_env
+from mkdocs_macros_utils.prefetch import (
+    collect_remote_targets,
+    extract_remote_targets,
+    prefetch_remote_resources,
+)
+from tests.python import MockMacrosPlugin
+
+PAGE = """
+# Page
+
+{{ gist_codeblock("https://gist.github.com/user/aaa") }}
+
+{{ gist_codeblock(
+    gist_url="https://gist.github.com/user/bbb",
+    indent=1
+) }}
+
+{{ link_card(
+    url="https://example.com",
+    title="Card",
+    svg_path="user/ccc/icon.svg"
+) }}
+
+{% raw %}
+{{ gist_codeblock("https://gist.github.com/user/id") }}
+{% endraw %}
+"""
+
+
+def make_env(docs_dir: Path) -> MockMacrosPlugin:
+    """Create an environment with prefetching enabled"""
+    return MockMacrosPlugin(
+        conf={"docs_dir": str(docs_dir)},
+        debug_settings={
+            "extra": {"macros_utils": {"prefetch": {"enabled": True, "max_workers": 4}}}
+        },
+    )
+
+
+# -- Extraction Tests ------------------------------
+def test_extract_remote_targets() -> None:
+    """Test extraction of macro arguments from Markdown"""
+    gist_urls, svg_paths = extract_remote_targets(PAGE)
+
+    assert gist_urls == {
+        "https://gist.github.com/user/aaa",
+        "https://gist.github.com/user/bbb",
+    }
+    assert svg_paths == {"user/ccc/icon.svg"}
+
+
+def test_collect_remote_targets(tmp_path: Path) -> None:
+    """Test collection across nested pages with de-duplication"""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "index.md").write_text(PAGE)
+    (tmp_path / "sub" / "page.md").write_text(PAGE)
+    (tmp_path / "notes.txt").write_text('{{ gist_codeblock("https://x") }}')
+
+    gist_urls, svg_paths = collect_remote_targets(tmp_path)
+
+    assert gist_urls == [
+        "https://gist.github.com/user/aaa",
+        "https://gist.github.com/user/bbb",
+    ]
+    assert svg_paths == ["user/ccc/icon.svg"]
+
+
+# -- Prefetch Tests ------------------------------
+def test_prefetch_disabled(tmp_path: Path) -> None:
+    """Test that nothing is fetched unless prefetching is enabled"""
+    env = MockMacrosPlugin(conf={"docs_dir": str(tmp_path)})
+    assert prefetch_remote_resources(env) == 0
+
+
+def test_prefetch_serves_macros_from_memory(
+    monkeypatch: MonkeyPatch, tmp_path: Path, mock_response: Type[Any]
+) -> None:
+    """Test that prefetched resources are rendered without network access"""
+    (tmp_path / "index.md").write_text(PAGE)
+    bodies: Dict[str, str] = {
+        "https://gist.github.com/user/aaa": '<a href="/user/aaa/raw/a.py">Raw</a>',
+        "https://gist.github.com/user/bbb": '<a href="/user/bbb/raw/b.sh">Raw</a>',
+        "https://gist.githubusercontent.com/user/aaa/raw/a.py": "print('a')",
+        "https://gist.githubusercontent.com/user/bbb/raw/b.sh": "echo b",
+        "https://gist.githubusercontent.com/user/ccc/raw/icon.svg": "<svg/>",
+    }
+    requested: List[str] = []
+
+    def mock_get(session: Any, url: str, *args: Any, **kwargs: Any) -> Any:
+        requested.append(url)
+        return mock_response(bodies[url])
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    env = make_env(tmp_path)
+
+    assert prefetch_remote_resources(env) == 3
+    assert sorted(requested) == sorted(bodies)
+    cache = get_response_cache(env)
+    assert cache is not None
+    assert cache.get("https://gist.githubusercontent.com/user/ccc/raw/icon.svg")
+
+    def fail_get(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("network access after prefetch")
+
+    monkeypatch.setattr(requests.Session, "get", fail_get)
+    define_gist_env(env)
+    result = getattr(env, "gist_codeblock")("https://gist.github.com/user/aaa")
+    assert "```python" in result
+    assert "print('a')" in result
+
+
+def test_prefetch_failures_do_not_raise(
+    monkeypatch: MonkeyPatch, tmp_path: Path, mock_response: Type[Any]
+) -> None:
+    """Test that failed prefetches are logged and skipped"""
+    (tmp_path / "index.md").write_text(PAGE)
+    monkeypatch.setattr(
+        requests.Session, "get", lambda *args, **kwargs: mock_response("", 404)
+    )
+
+    assert prefetch_remote_resources(make_env(tmp_path)) == 3
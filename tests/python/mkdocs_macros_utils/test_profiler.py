@@ -0,0 +1,170 @@
+"""
+Tests for the macro profiler module in MkDocs Macros Utils
+"""
+
+from pathlib import Path
+from typing import Any, Type
+import json
+import time
+import pytest
+from pytest import MonkeyPatch
+import requests
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+from mkdocs_macros_utils import profiler
+from mkdocs_macros_utils.profiler import (
+    PHASE_NETWORK,
+    MacroProfiler,
+    configure_profiler,
+    profile_macro,
+)
+from tests.python import MockMacrosPlugin
+
+
+@pytest.fixture
+def enabled_profiler(tmp_path: Path) -> MacroProfiler:
+    """Profiler enabled with its report in a temporary directory"""
+    env = MockMacrosPlugin(
+        debug_settings={
+            "extra": {
+                "macros_utils": {
+                    "profile": {
+                        "enabled": True,
+                        "report": str(tmp_path / "profile"),
+                        "slowest_pages": 1,
+                    }
+                }
+            }
+        }
+    )
+    return configure_profiler(env)
+
+
+# -- Profiler Tests ------------------------------
+def test_profile_disabled_by_default() -> None:
+    """Test that macros run untouched without profile settings"""
+
+    @profile_macro
+    def macro() -> str:
+        return "ok"
+
+    configure_profiler(MockMacrosPlugin())
+
+    assert macro() == "ok"
+    assert profiler.get_profiler().macros == {}
+
+
+def test_profile_macro_phases_and_caches(enabled_profiler: MacroProfiler) -> None:
+    """Test that calls, phases and cache lookups are recorded per macro"""
+
+    @profile_macro
+    def macro() -> str:
+        with profiler.phase(PHASE_NETWORK):
+            time.sleep(0.01)
+        profiler.record_cache("response", True)
+        profiler.record_cache("response", False)
+        return "ok"
+
+    macro()
+    macro()
+
+    stats = enabled_profiler.report()["macros"]["macro"]
+    assert stats["calls"] == 2
+    assert stats["network_ms"] >= 20
+    assert stats["total_ms"] >= stats["network_ms"]
+    assert stats["cache_hit_ratio"] == 0.5
+    assert enabled_profiler.report()["caches"]["response"] == {
+        "hits": 2,
+        "misses": 2,
+        "hit_ratio": 0.5,
+    }
+
+
+def test_cache_lookups_outside_macros_ignored(
+    enabled_profiler: MacroProfiler,
+) -> None:
+    """Test that lookups outside a macro (e.g. prefetch) are not counted"""
+    profiler.record_cache("response", True)
+    with profiler.phase(PHASE_NETWORK):
+        pass
+
+    assert enabled_profiler.report()["caches"] == {}
+
+
+def test_slowest_pages(enabled_profiler: MacroProfiler) -> None:
+    """Test that macro time is attributed to pages"""
+
+    @profile_macro
+    def macro(delay: float) -> str:
+        time.sleep(delay)
+        return "ok"
+
+    for page, delay in [("fast.md", 0.0), ("slow.md", 0.01)]:
+        enabled_profiler.current_page = page
+        macro(delay)
+    enabled_profiler.current_page = None
+
+    slowest = enabled_profiler.report()["slowest_pages"]
+    assert [page["page"] for page in slowest] == ["slow.md"]
+    assert slowest[0]["calls"] == 1
+
+
+def test_write_report(enabled_profiler: MacroProfiler, tmp_path: Path) -> None:
+    """Test that JSON and Markdown reports are written"""
+
+    @profile_macro
+    def macro() -> str:
+        return "ok"
+
+    macro()
+    markdown_path = enabled_profiler.write_report()
+
+    assert markdown_path == tmp_path / "profile.md"
+    assert "| macro | 1 |" in markdown_path.read_text(encoding="utf-8")
+    report = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    assert report["macros"]["macro"]["calls"] == 1
+
+
+# -- Build Report Tests ------------------------------
+def test_build_writes_profile_report(
+    monkeypatch: MonkeyPatch, mock_response: Type[Any], tmp_path: Path
+) -> None:
+    """Test that a profiled build reports every macro next to mkdocs.yml"""
+    monkeypatch.setattr(
+        requests.Session,
+        "get",
+        lambda *args, **kwargs: mock_response("print('hello')"),
+    )
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "index.md").write_text(
+        '{{ gist_codeblock("https://gist.githubusercontent.com/u/1/raw/a.py") }}\n\n'
+        '{{ x_twitter_card("https://x.com/user/status/1") }}\n\n'
+        '{{ x_twitter_card("https://x.com/user/status/1") }}\n',
+        encoding="utf-8",
+    )
+    config_file = tmp_path / "mkdocs.yml"
+    config_file.write_text(
+        "site_name: Test\n"
+        "plugins:\n"
+        "  - macros:\n"
+        "      modules: [mkdocs_macros_utils]\n"
+        "extra:\n"
+        "  macros_utils:\n"
+        "    profile:\n"
+        "      enabled: true\n"
+        "      report: profile\n",
+        encoding="utf-8",
+    )
+
+    build(load_config(config_file=str(config_file)))
+
+    report = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    assert report["macros"]["gist_codeblock"]["calls"] == 1
+    assert report["macros"]["x_twitter_card"]["calls"] == 2
+    assert report["caches"]["render_memo"] == {
+        "hits": 1,
+        "misses": 1,
+        "hit_ratio": 0.5,
+    }
+    assert report["slowest_pages"][0]["page"] == "index.md"
@@ -0,0 +1,133 @@
+"""
+Tests for the rendered output memo module in MkDocs Macros Utils
+"""
+
+from typing import Any, List, Optional
+from pytest import MonkeyPatch
+from mkdocs_macros_utils.link_card import create_link_card
+from mkdocs_macros_utils.render_memo import (
+    RenderMemo,
+    config_fingerprint,
+    get_render_memo,
+)
+from mkdocs_macros_utils.x_twitter_card import create_x_twitter_card
+from tests.python import MockMacrosPlugin
+
+
+def make_env(
+    site_url: str = "https://example.com", **settings: Any
+) -> MockMacrosPlugin:
+    """Create an environment with a site URL and macros_utils settings"""
+    return MockMacrosPlugin(
+        conf={"site_url": site_url},
+        debug_settings={"extra": {"macros_utils": settings}},
+    )
+
+
+# -- Memo Tests ------------------------------
+def test_render_memo_lru_eviction() -> None:
+    """Test that the least recently used entries are evicted"""
+    memo = RenderMemo(max_entries=2)
+    memo.set("a", "config", "A")
+    memo.set("b", "config", "B")
+    assert memo.get("a", "config") == "A"
+
+    memo.set("c", "config", "C")
+
+    assert memo.get("b", "config") is None
+    assert memo.get("a", "config") == "A"
+    assert memo.get("c", "config") == "C"
+    assert (memo.hits, memo.misses) == (3, 1)
+
+
+def test_render_memo_invalidated_on_config_change() -> None:
+    """Test that all entries are dropped when the configuration changes"""
+    memo = RenderMemo()
+    memo.set("a", "config", "A")
+
+    assert memo.get("a", "other config") is None
+    assert memo.size == 0
+
+
+def test_get_render_memo_from_settings() -> None:
+    """Test memo configuration from extra.macros_utils.render_memo"""
+    memo = get_render_memo("link_card", make_env(render_memo={"max_entries": 5}))
+    assert memo is not None
+    assert memo.max_entries == 5
+    assert get_render_memo("link_card", make_env()) is memo
+
+    disabled_env = make_env(render_memo={"enabled": False})
+    assert get_render_memo("link_card", disabled_env) is None
+
+
+def test_config_fingerprint() -> None:
+    """Test that the fingerprint follows site URL, debug flag and settings"""
+    base = config_fingerprint(make_env(), "link_card", False)
+
+    assert config_fingerprint(make_env(), "link_card", False) == base
+    other_env = make_env("https://other.com")
+    assert config_fingerprint(other_env, "link_card", False) != base
+    assert config_fingerprint(make_env(), "link_card", True) != base
+    icons_env = make_env(link_card={"icons": {"a.com": "x"}})
+    assert config_fingerprint(icons_env, "link_card", False) != base
+
+
+# -- Macro Memoization Tests ------------------------------
+def test_link_card_rendered_once(monkeypatch: MonkeyPatch) -> None:
+    """Test that identical link cards are rendered once"""
+    calls: List[str] = []
+
+    def mock_get_svg_content(url: str, *args: Any, **kwargs: Any) -> Optional[str]:
+        calls.append(url)
+        return "<svg>Test</svg>"
+
+    monkeypatch.setattr(
+        "mkdocs_macros_utils.link_card.get_svg_content", mock_get_svg_content
+    )
+    env = make_env()
+
+    first = create_link_card(url="https://github.com/a", title="A", env=env)
+    second = create_link_card(url="https://github.com/a", title="A", env=env)
+    assert first == second
+    assert len(calls) == 1
+
+    # Changing the site URL renders the card again
+    other_env = make_env("https://b.com")
+    create_link_card(url="https://github.com/a", title="A", env=other_env)
+    assert len(calls) == 2
+
+
+def test_link_card_without_icon_not_memoized(monkeypatch: MonkeyPatch) -> None:
+    """Test that cards whose icon could not be fetched are rendered again"""
+    calls: List[str] = []
+
+    def mock_get_svg_content(url: str, *args: Any, **kwargs: Any) -> Optional[str]:
+        calls.append(url)
+        return None
+
+    monkeypatch.setattr(
+        "mkdocs_macros_utils.link_card.get_svg_content", mock_get_svg_content
+    )
+    env = make_env()
+
+    create_link_card(url="https://github.com/a", title="A", env=env)
+    create_link_card(url="https://github.com/a", title="A", env=env)
+    assert len(calls) == 2
+
+    # Cards of domains without an icon are memoized
+    create_link_card(url="https://example.org/a", title="A", env=env)
+    create_link_card(url="https://example.org/a", title="A", env=env)
+    assert len(calls) == 3
+
+
+def test_x_twitter_card_memoized() -> None:
+    """Test that identical X/Twitter cards are served from the memo"""
+    env = make_env()
+    url = "https://x.com/user/status/123"
+
+    html = create_x_twitter_card(url, env)
+    assert create_x_twitter_card(url, env) == html
+
+    memo = get_render_memo("x_twitter_card", env)
+    assert memo is not None
+    assert memo.hits == 1
@@ -0,0 +1,100 @@
+"""
+Tests for the single-flight module in MkDocs Macros Utils
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+import threading
+import pytest
+from mkdocs_macros_utils.singleflight import SingleFlight
+
+
+def run_concurrently(
+    flight: SingleFlight[str], key: str, workers: int
+) -> Tuple[List[str], List[str]]:
+    """Call flight.do from several threads while the first call is blocked"""
+    release = threading.Event()
+    calls: List[str] = []
+
+    def func() -> str:
+        calls.append(threading.current_thread().name)
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(flight.do, key, func) for _ in range(workers)]
+        # Wait until every follower is waiting for the leader
+        while flight.coalesced < workers - 1:
+            threading.Event().wait(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+    return calls, results
+
+
+# -- SingleFlight Tests ------------------------------
+def test_concurrent_calls_share_one_call() -> None:
+    """Test that concurrent callers of a key run the function once"""
+    flight: SingleFlight[str] = SingleFlight()
+
+    calls, results = run_concurrently(flight, "key", 8)
+
+    assert len(calls) == 1
+    assert results == ["result"] * 8
+    assert flight.coalesced == 7
+
+
+def test_sequential_calls_run_again() -> None:
+    """Test that a key is forgotten once its call finished"""
+    flight: SingleFlight[int] = SingleFlight()
+    calls: List[int] = []
+
+    def call() -> int:
+        calls.append(1)
+        return len(calls)
+
+    for _ in range(2):
+        flight.do("key", call)
+
+    assert len(calls) == 2
+    assert flight.coalesced == 0
+
+
+def test_distinct_keys_do_not_wait() -> None:
+    """Test that calls for other keys run while a key is in flight"""
+    flight: SingleFlight[str] = SingleFlight()
+    release = threading.Event()
+
+    def slow() -> str:
+        release.wait(5)
+        return "slow"
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        blocked = pool.submit(flight.do, "slow", slow)
+        assert flight.do("fast", lambda: "fast") == "fast"
+        release.set()
+        assert blocked.result() == "slow"
+
+
+def test_exception_shared_with_waiters() -> None:
+    """Test that waiters get the exception of the call and can retry"""
+    flight: SingleFlight[str] = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail() -> str:
+        started.set()
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "key", fail)
+        started.wait(5)
+        follower = pool.submit(flight.do, "key", lambda: "unused")
+        while flight.coalesced < 1:
+            threading.Event().wait(0.001)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match="boom"):
+                future.result()
+
+    assert flight.do("key", lambda: "retried") == "retried"
@@ -0,0 +1,112 @@
+"""
+Tests for the URL classifier module in MkDocs Macros Utils
+"""
+
+import pytest
+from mkdocs_macros_utils.url_classifier import (
+    PROVIDER_GIST,
+    PROVIDER_GIST_RAW,
+    PROVIDER_INVALID,
+    PROVIDER_TWEET,
+    PROVIDER_WEB,
+    classify_url,
+    match_domain,
+)
+
+
+# -- Provider Classification Tests ------------------------------
+@pytest.mark.parametrize(
+    "url, provider",
+    [
+        ("https://gist.github.com/user/0123abcd", PROVIDER_GIST),
+        ("https://gist.github.com/user/0123abcd#file-a-py", PROVIDER_GIST),
+        ("https://gist.githubusercontent.com/u/id/raw/rev/a.py", PROVIDER_GIST_RAW),
+        ("https://x.com/user/status/123", PROVIDER_TWEET),
+        ("https://mobile.twitter.com/user/status/123?s=20", PROVIDER_TWEET),
+        ("https://github.com/user/repo", PROVIDER_WEB),
+        ("https://gist.github.com/user", PROVIDER_WEB),
+        ("https://gist.github.com/user/not-a-gist", PROVIDER_WEB),
+        ("http://gist.github.com/user/0123abcd", PROVIDER_WEB),
+        ("https://x.com/user", PROVIDER_WEB),
+        ("https://x.com/user/likes/123", PROVIDER_WEB),
+        ("ftp://example.com/file", PROVIDER_INVALID),
+        ("not-a-url", PROVIDER_INVALID),
+        ("https://[::1/broken", PROVIDER_INVALID),
+    ],
+)
+def test_classify_url_provider(url: str, provider: str) -> None:
+    """Test that URLs are dispatched to the right provider"""
+    assert classify_url(url).provider == provider
+
+
+def test_classify_gist_url() -> None:
+    """Test that Gist page URLs expose the user and Gist ID"""
+    info = classify_url("https://gist.github.com/user/0123abcd/revisions")
+
+    assert info.user == "user"
+    assert info.resource_id == "0123abcd"
+    assert info.canonical_url == "https://gist.github.com/user/0123abcd"
+
+
+def test_classify_gist_raw_url() -> None:
+    """Test that raw Gist URLs expose the file name"""
+    url = "https://gist.githubusercontent.com/user/0123abcd/raw/rev/main.py"
+    info = classify_url(url)
+
+    assert (info.user, info.resource_id, info.filename) == (
+        "user",
+        "0123abcd",
+        "main.py",
+    )
+    assert info.canonical_url == url
+
+
+@pytest.mark.parametrize(
+    "url, canonical_url",
+    [
+        ("https://x.com/u/status/1", "https://twitter.com/u/status/1"),
+        ("http://x.com/u/status/1?s=20", "http://twitter.com/u/status/1?s=20"),
+        ("https://mobile.x.com/u/status/1", "https://mobile.twitter.com/u/status/1"),
+        ("https://twitter.com/u/status/1", "https://twitter.com/u/status/1"),
+    ],
+)
+def test_classify_tweet_canonical_url(url: str, canonical_url: str) -> None:
+    """Test that X/Twitter post URLs are canonicalized to twitter.com"""
+    info = classify_url(url)
+
+    assert info.canonical_url == canonical_url
+    assert (info.user, info.resource_id) == ("u", "1")
+
+
+def test_classify_url_normalizes_web_url() -> None:
+    """Test that web URLs get a normalized form and a lowercase host"""
+    info = classify_url("https://Example.com:8080//docs/")
+
+    assert info.host == "example.com"
+    assert info.netloc == "Example.com:8080"
+    assert info.normalized_url == "https://Example.com:8080/docs"
+
+
+def test_classify_url_is_memoized() -> None:
+    """Test that repeated classifications return the cached result"""
+    url = "https://example.com/memoized"
+
+    assert classify_url(url) is classify_url(url)
+
+
+# -- Domain Matching Tests ------------------------------
+def test_match_domain_prefers_most_specific() -> None:
+    """Test that the most specific registered domain wins"""
+    domains = {"github.com": "github", "gist.github.com": "gist"}
+
+    assert match_domain("gist.github.com", domains) == "gist"
+    assert match_domain("api.github.com", domains) == "github"
+    assert match_domain("github.com", domains) == "github"
+
+
+def test_match_domain_requires_label_boundary() -> None:
+    """Test that domains only match whole labels"""
+    domains = {"github.com": "github"}
+
+    assert match_domain("notgithub.com", domains) is None
+    assert match_domain("", domains) is None
@@ -4,7 +4,11 @@ This module tests the functionality for creating and managing X/Twitter cards,
 including URL validation, standardization, and card generation.
 """
 
-from typing import Any, cast
+from pathlib import Path
+from typing import Any, Dict, cast
+from urllib.parse import urlencode
+import json
+import logging
 import pytest
 from mkdocs_macros_utils.x_twitter_card import (
     validate_x_twitter_url,
@@ -13,7 +17,15 @@ from mkdocs_macros_utils.x_twitter_card import (
     define_env,
 )
 from mkdocs_macros_utils.debug_logger import DebugLogger
-from tests.python import MockMacrosPlugin
+from tests.python import MockMacrosPlugin, StubServer
+
+TWEET_URL = "https://twitter.com/user/status/123456789"
+OEMBED_HTML = (
+    '<blockquote class="twitter-tweet"><p lang="en" dir="ltr">Hello</p>'
+    "&mdash; User (@user) "
+    f'<a href="{TWEET_URL}">January 1, 2025</a></blockquote>\n'
+    '<script async src="https://platform.twitter.com/widgets.js"></script>\n'
+)
 
 
 # -- URL Validation Tests ------------------------------
@@ -145,3 +157,133 @@ def test_x_twitter_card_macro() -> None:
     assert '<div class="x-twitter-embed"' in result
     assert '<blockquote class="twitter-tweet"' in result
     assert f'data-url="{url}"' in result
+
+
+# -- Pre-rendering Tests ------------------------------
+
+
+def oembed_path(url: str) -> str:
+    """Get the request path of the oEmbed stub for a post"""
+    return "/oembed?" + urlencode({"url": url, "omit_script": "true", "dnt": "true"})
+
+
+def make_prerender_env(stub_server: StubServer, cache_dir: Path) -> MockMacrosPlugin:
+    """Create an environment pre-rendering posts from the oEmbed stub"""
+    card_settings: Dict[str, Any] = {
+        "prerender": True,
+        "oembed_url": f"{stub_server.url}/oembed",
+        "oembed_cache_dir": str(cache_dir),
+    }
+    return MockMacrosPlugin(
+        debug_settings={"extra": {"macros_utils": {"x_twitter_card": card_settings}}}
+    )
+
+
+def test_prerender_inlines_oembed_markup(
+    stub_server: StubServer, tmp_path: Path
+) -> None:
+    """Test that the oEmbed markup is inlined without scripts"""
+    stub_server.add(oembed_path(TWEET_URL), json.dumps({"html": OEMBED_HTML}))
+    env = make_prerender_env(stub_server, tmp_path)
+
+    result = create_x_twitter_card("https://x.com/user/status/123456789", env)
+
+    assert 'class="x-twitter-embed x-twitter-prerendered"' in result
+    assert '<p lang="en" dir="ltr">Hello</p>' in result
+    assert "<script" not in result
+
+
+def test_prerender_caches_oembed_on_disk(
+    stub_server: StubServer, tmp_path: Path
+) -> None:
+    """Test that each post is requested once, even across builds"""
+    stub_server.add(oembed_path(TWEET_URL), json.dumps({"html": OEMBED_HTML}))
+    env = make_prerender_env(stub_server, tmp_path)
+
+    create_x_twitter_card(TWEET_URL, env)
+    create_x_twitter_card(TWEET_URL, make_prerender_env(stub_server, tmp_path))
+
+    assert len(stub_server.requests) == 1
+    assert list(tmp_path.glob("*.json"))
+
+
+def test_prerender_cache_relative_to_config_file(
+    stub_server: StubServer, tmp_path: Path
+) -> None:
+    """Test that the oEmbed cache directory is relative to mkdocs.yml"""
+    stub_server.add(oembed_path(TWEET_URL), json.dumps({"html": OEMBED_HTML}))
+    card_settings: Dict[str, Any] = {
+        "prerender": True,
+        "oembed_url": f"{stub_server.url}/oembed",
+    }
+    env = MockMacrosPlugin(
+        conf={"config_file_path": str(tmp_path / "mkdocs.yml")},
+        debug_settings={"extra": {"macros_utils": {"x_twitter_card": card_settings}}},
+    )
+
+    create_x_twitter_card(TWEET_URL, env)
+
+    assert list((tmp_path / ".cache" / "macros-utils" / "oembed").glob("*.json"))
+
+
+@pytest.mark.parametrize(
+    "status, body",
+    [(404, ""), (200, "not json"), (200, json.dumps({"type": "rich"}))],
+)
+def test_prerender_falls_back_to_widget(
+    stub_server: StubServer,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+    status: int,
+    body: str,
+) -> None:
+    """Test that unresolved posts keep the widget markup and are not memoized"""
+    stub_server.add(oembed_path(TWEET_URL), body, status)
+    env = make_prerender_env(stub_server, tmp_path / str(status))
+
+    with caplog.at_level(logging.WARNING):
+        result = create_x_twitter_card(TWEET_URL, env)
+    create_x_twitter_card(TWEET_URL, env)
+
+    assert f'<a href="{TWEET_URL}"></a>' in result
+    assert "x-twitter-prerendered" not in result
+    assert "Failed to pre-render" in caplog.text
+    assert len(stub_server.requests) == (1 if status == 200 else 2)
+
+
+def test_prerender_disabled_by_default(mock_env: MockMacrosPlugin) -> None:
+    """Test that posts are not pre-rendered without the setting"""
+    result = create_x_twitter_card(TWEET_URL, mock_env)
+
+    assert "x-twitter-prerendered" not in result
+
+
+# -- Lazy Loading Tests ------------------------------
+
+
+def test_cards_are_lazy_by_default(mock_env: MockMacrosPlugin) -> None:
+    """Test that cards carry the root margin used by the widget script"""
+    result = create_x_twitter_card(TWEET_URL, mock_env)
+
+    assert 'data-root-margin="200px 0px"' in result
+
+
+@pytest.mark.parametrize(
+    "card_settings, expected",
+    [
+        ({"root_margin": "50% 0px"}, 'data-root-margin="50% 0px"'),
+        ({"lazy": False}, None),
+    ],
+)
+def test_lazy_settings(card_settings: Dict[str, Any], expected: Any) -> None:
+    """Test that the root margin is configurable and lazy loading can be disabled"""
+    env = MockMacrosPlugin(
+        debug_settings={"extra": {"macros_utils": {"x_twitter_card": card_settings}}}
+    )
+
+    result = create_x_twitter_card(TWEET_URL, env)
+
+    if expected:
+        assert expected in result
+    else:
+        assert "data-root-margin" not in result